@@ -13,7 +13,7 @@ assigning bookings to department members:
 import frappe
 from frappe.utils import getdate, get_time, now_datetime, add_to_date
 from datetime import datetime, timedelta
-from meeting_manager.meeting_manager.utils.validation import check_member_availability
+from meeting_manager.meeting_manager.utils.validation import check_members_availability
 
 
 def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_time, duration_minutes):
@@ -48,19 +48,15 @@ def assign_to_member(department, meeting_type, scheduled_date, scheduled_start_t
 	if not active_members:
 		frappe.throw(f"No active members in department '{dept.department_name}'")
 
-	# Check which members are available at the requested time
-	available_members = []
-
-	for member in active_members:
-		availability = check_member_availability(
-			member.member,
-			scheduled_date,
-			scheduled_start_time,
-			duration_minutes
-		)
-
-		if availability["available"]:
-			available_members.append(member)
+	# Check which members are available at the requested time - one bulk
+	# call covering the whole roster instead of six queries per member
+	availability_map = check_members_availability(
+		[m.member for m in active_members],
+		scheduled_date,
+		scheduled_start_time,
+		duration_minutes
+	)
+	available_members = [m for m in active_members if availability_map[m.member]["available"]]
 
 	if not available_members:
 		frappe.throw(
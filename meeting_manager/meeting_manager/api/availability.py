@@ -11,7 +11,14 @@ individual member availability. Used for public booking interface.
 import frappe
 from frappe.utils import getdate, get_time, get_datetime, add_to_date
 from datetime import datetime, timedelta, time
-from meeting_manager.meeting_manager.utils.validation import check_member_availability, validate_minimum_notice, validate_advance_booking_window
+from meeting_manager.meeting_manager.utils.validation import (
+	check_availability_rules,
+	check_date_overrides,
+	check_working_hours,
+	slot_conflict_mask,
+	validate_minimum_notice,
+	validate_advance_booking_window,
+)
 from meeting_manager.meeting_manager.utils.timezone import get_department_timezone, convert_from_utc, convert_to_utc
 import json
 
@@ -214,35 +221,43 @@ def get_department_available_slots(department_slug, meeting_type_slug, date, vis
 		dt = datetime.combine(scheduled_date, current_time) + timedelta(minutes=slot_interval)
 		current_time = dt.time()
 
-	# Check availability for each time slot
+	# Check availability for each time slot. Booking, calendar and buffer
+	# conflicts are resolved for the whole grid in one pass per member;
+	# day/week caps don't vary by slot, so members over their cap drop
+	# out before the grid is scanned. Working hours, overrides and notice
+	# evaluate in memory off the cached member profile.
+	slot_starts = [datetime.combine(scheduled_date, t) for t in time_slots]
+	slot_ends = [s + timedelta(minutes=duration) for s in slot_starts]
+
+	member_masks = {}
+	for member in member_ids:
+		if not check_availability_rules(member, scheduled_date)["available"]:
+			continue
+		member_masks[member] = slot_conflict_mask(member, scheduled_date, slot_starts, slot_ends)
+
 	available_slots = []
 
-	for slot_time in time_slots:
+	for i, slot_time in enumerate(time_slots):
 		# Count how many members are available at this time
+		slot_end_time = slot_ends[i].time()
 		available_members = []
 
-		for member in member_ids:
-			# Check if member is available
-			availability = check_member_availability(
-				member,
-				scheduled_date,
-				slot_time,
-				duration
-			)
-
-			if availability["available"]:
-				# Also check minimum notice
-				slot_datetime = datetime.combine(scheduled_date, slot_time)
-				notice_check = validate_minimum_notice(member, slot_datetime)
-
-				if notice_check["valid"]:
-					available_members.append(member)
+		for member, mask in member_masks.items():
+			if mask[i]:
+				continue
+			if not check_working_hours(member, scheduled_date, slot_time, slot_end_time)["available"]:
+				continue
+			if not check_date_overrides(member, scheduled_date, slot_time, slot_end_time)["available"]:
+				continue
+
+			notice_check = validate_minimum_notice(member, slot_starts[i])
+			if notice_check["valid"]:
+				available_members.append(member)
 
 		# If at least one member is available, add slot
 		if available_members:
-			# Calculate end time
-			start_datetime = datetime.combine(scheduled_date, slot_time)
-			end_datetime = start_datetime + timedelta(minutes=duration)
+			start_datetime = slot_starts[i]
+			end_datetime = slot_ends[i]
 
 			slot_data = {
 				"start_time": slot_time.strftime("%H:%M"),
@@ -366,25 +381,32 @@ def get_member_available_slots(member, date, duration_minutes, meeting_type=None
 
 	available_slots = []
 
-	for slot_time in time_slots:
-		availability = check_member_availability(
-			member,
-			scheduled_date,
-			slot_time,
-			duration_minutes
-		)
+	# Day/week caps hold for every slot, so a capped member has no free
+	# slots at all; otherwise one pass builds the conflict mask and the
+	# remaining checks run in memory off the cached profile
+	if not check_availability_rules(member, scheduled_date)["available"]:
+		return available_slots
 
-		if availability["available"]:
-			# Check minimum notice
-			slot_datetime = datetime.combine(scheduled_date, slot_time)
-			notice_check = validate_minimum_notice(member, slot_datetime)
+	slot_starts = [datetime.combine(scheduled_date, t) for t in time_slots]
+	slot_ends = [s + timedelta(minutes=duration_minutes) for s in slot_starts]
+	mask = slot_conflict_mask(member, scheduled_date, slot_starts, slot_ends)
 
-			if notice_check["valid"]:
-				end_datetime = slot_datetime + timedelta(minutes=duration_minutes)
-				available_slots.append({
-					"start_time": slot_time.strftime("%H:%M"),
-					"end_time": end_datetime.time().strftime("%H:%M"),
-					"start_datetime": slot_datetime.isoformat()
-				})
+	for i, slot_time in enumerate(time_slots):
+		if mask[i]:
+			continue
+
+		slot_end_time = slot_ends[i].time()
+		if not check_working_hours(member, scheduled_date, slot_time, slot_end_time)["available"]:
+			continue
+		if not check_date_overrides(member, scheduled_date, slot_time, slot_end_time)["available"]:
+			continue
+
+		notice_check = validate_minimum_notice(member, slot_starts[i])
+		if notice_check["valid"]:
+			available_slots.append({
+				"start_time": slot_time.strftime("%H:%M"),
+				"end_time": slot_end_time.strftime("%H:%M"),
+				"start_datetime": slot_starts[i].isoformat()
+			})
 
 	return available_slots
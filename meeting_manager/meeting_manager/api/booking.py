@@ -17,7 +17,7 @@ import frappe
 from frappe import _
 from frappe.utils import getdate, get_time, get_datetime, now_datetime
 from datetime import datetime, timedelta
-from meeting_manager.meeting_manager.utils.validation import check_member_availability
+from meeting_manager.meeting_manager.utils.validation import check_member_availability, check_members_availability
 from meeting_manager.meeting_manager.api.assignment import update_member_assignment_tracking
 from meeting_manager.meeting_manager.utils.email_notifications import send_booking_confirmation_email
 
@@ -83,16 +83,18 @@ def create_internal_meeting(meeting_data):
 	end_datetime = start_datetime + timedelta(minutes=meeting_type.duration)
 	scheduled_end_time = end_datetime.time()
 
-	# Check availability for all participants
+	# Check availability for all participants - one query per concern for
+	# the whole team instead of six queries per participant
+	availability_map = check_members_availability(
+		meeting_data["participants"],
+		scheduled_date,
+		scheduled_start_time,
+		meeting_type.duration
+	)
+
 	unavailable_participants = []
 	for participant_id in meeting_data["participants"]:
-		availability = check_member_availability(
-			participant_id,
-			scheduled_date,
-			scheduled_start_time,
-			meeting_type.duration
-		)
-
+		availability = availability_map[participant_id]
 		if not availability["available"]:
 			participant_name = frappe.get_value("User", participant_id, "full_name")
 			unavailable_participants.append({
@@ -1175,7 +1177,7 @@ def get_team_available_slots(department, meeting_type, date, participants):
 			"participants_count": int
 		}
 	"""
-	from meeting_manager.meeting_manager.utils.validation import check_member_availability
+	from meeting_manager.meeting_manager.utils.validation import check_members_availability
 	import json
 
 	if frappe.session.user == "Guest":
@@ -1219,18 +1221,21 @@ def get_team_available_slots(department, meeting_type, date, participants):
 	end_time = time(end_hour - 1, 60 - interval_minutes)
 
 	while current_time <= end_time:
-		# Check if ALL participants are available at this time slot (AND operation)
+		# Check if ALL participants are available at this time slot (AND
+		# operation) - the bulk check costs one query per concern for the
+		# whole group instead of six per participant
 		all_available = True
 		unavailable_participants = []
 
-		for participant_id in participants:
-			availability = check_member_availability(
-				participant_id,
-				check_date,
-				current_time,
-				mt_doc.duration
-			)
+		availability_map = check_members_availability(
+			participants,
+			check_date,
+			current_time,
+			mt_doc.duration
+		)
 
+		for participant_id in participants:
+			availability = availability_map[participant_id]
 			if not availability["available"]:
 				all_available = False
 				participant_name = frappe.get_value("User", participant_id, "full_name")
@@ -762,11 +762,12 @@ def get_booking_confirmation(booking_id):
 	except frappe.DoesNotExistError:
 		frappe.throw(_("Booking not found"), frappe.DoesNotExistError)
 
-	# Get meeting type details
+	# Get meeting type details (including its department link, so the
+	# full document doesn't need a second load just for that field)
 	meeting_type = frappe.get_value(
 		"MM Meeting Type",
 		booking.meeting_type,
-		["name", "meeting_name", "description", "duration", "location_type", "video_platform"],
+		["name", "meeting_name", "description", "duration", "location_type", "video_platform", "department"],
 		as_dict=True
 	)
 
@@ -774,10 +775,9 @@ def get_booking_confirmation(booking_id):
 		frappe.throw(_("Meeting type not found"))
 
 	# Get department details
-	meeting_type_doc = frappe.get_doc("MM Meeting Type", booking.meeting_type)
 	department = frappe.get_value(
 		"MM Department",
-		meeting_type_doc.department,
+		meeting_type.department,
 		["name", "department_name", "department_slug", "description", "timezone"],
 		as_dict=True
 	)
@@ -785,16 +785,20 @@ def get_booking_confirmation(booking_id):
 	if not department:
 		frappe.throw(_("Department not found"))
 
-	# Get assigned users with their full names
+	# Get assigned users with their full names - one IN query for the
+	# whole child table instead of a get_value per user
 	assigned_users = []
 	if booking.assigned_users:
-		for assigned_user in booking.assigned_users:
-			user_data = frappe.get_value(
+		user_map = {
+			u.name: u
+			for u in frappe.get_all(
 				"User",
-				assigned_user.user,
-				["full_name", "email", "user_image"],
-				as_dict=True
+				filters={"name": ["in", [au.user for au in booking.assigned_users]]},
+				fields=["name", "full_name", "email", "user_image"]
 			)
+		}
+		for assigned_user in booking.assigned_users:
+			user_data = user_map.get(assigned_user.user)
 			if user_data:
 				assigned_users.append({
 					"name": user_data.full_name,
@@ -818,9 +822,12 @@ def get_booking_confirmation(booking_id):
 		"meeting_location": booking.meeting_location,
 		"video_meeting_url": booking.video_meeting_url,
 
-		# Timing - keep as datetime objects for template compatibility
+		# Timing - keep as datetime objects for template compatibility,
+		# plus a preformatted display string so the template does pure
+		# interpolation instead of calling strftime per render
 		"start_datetime": booking.start_datetime,
 		"end_datetime": booking.end_datetime,
+		"start_display": get_datetime(booking.start_datetime).strftime("%B %d, %Y at %I:%M %p"),
 		"duration": booking.duration,
 
 		# Customer info (only if not internal)
@@ -4,13 +4,47 @@
 import frappe
 from frappe.model.document import Document
 from frappe.utils import get_datetime, now_datetime
+from datetime import datetime
 import json
 import re
 
+from meeting_manager.meeting_manager.utils.caching import cached_exists, cached_get_value
+
+
+def _to_dt(value):
+	"""Return a datetime, skipping the parse when the value is already typed"""
+	if isinstance(value, datetime):
+		return value
+	return get_datetime(value)
+
+
+def _email_from_str(attendee, idx):
+	return attendee
+
+
+def _email_from_dict(attendee, idx):
+	if "email" not in attendee:
+		frappe.throw(f"Attendee at index {idx} is missing 'email' field.")
+	return attendee["email"]
+
+
+# Dispatch on type() - one dict lookup instead of an isinstance chain per attendee
+_ATTENDEE_EXTRACT = {str: _email_from_str, dict: _email_from_dict}
+
 
 class MMCalendarEventSync(Document):
 	def validate(self):
 		"""Validate calendar event sync before saving"""
+		# Capture the current time and parse start/end datetimes once so the
+		# individual validators don't repeat the same conversions
+		self._now = now_datetime()
+		try:
+			self._start_dt = _to_dt(self.start_datetime) if self.start_datetime else None
+			self._end_dt = _to_dt(self.end_datetime) if self.end_datetime else None
+		except (ValueError, TypeError):
+			self._start_dt = None
+			self._end_dt = None
+
 		self.validate_calendar_integration_exists()
 		self.validate_external_event_id_unique()
 		self.validate_event_timing()
@@ -23,11 +57,11 @@ class MMCalendarEventSync(Document):
 		if not self.calendar_integration:
 			frappe.throw("Calendar Integration is required.")
 
-		if not frappe.db.exists("MM Calendar Integration", self.calendar_integration):
+		if not cached_exists("MM Calendar Integration", self.calendar_integration):
 			frappe.throw(f"Calendar Integration '{self.calendar_integration}' does not exist.")
 
 		# Check if calendar integration is active
-		is_active = frappe.db.get_value(
+		is_active = cached_get_value(
 			"MM Calendar Integration",
 			self.calendar_integration,
 			"is_active"
@@ -53,11 +87,11 @@ class MMCalendarEventSync(Document):
 		if not self.is_new():
 			filters["name"] = ["!=", self.name]
 
-		existing = frappe.db.exists("MM Calendar Event Sync", filters)
-		if existing:
+		existing_name = frappe.db.get_value("MM Calendar Event Sync", filters, "name")
+		if existing_name:
 			frappe.throw(
 				f"External Event ID '{self.external_event_id}' already exists in calendar integration "
-				f"'{self.calendar_integration}'. Each event must have a unique external ID."
+				f"'{self.calendar_integration}' (see '{existing_name}'). Each event must have a unique external ID."
 			)
 
 	def validate_event_timing(self):
@@ -68,11 +102,10 @@ class MMCalendarEventSync(Document):
 		if not self.end_datetime:
 			frappe.throw("End DateTime is required.")
 
-		# Convert to datetime objects for comparison
-		try:
-			start_dt = get_datetime(self.start_datetime)
-			end_dt = get_datetime(self.end_datetime)
-		except:
+		# Use the datetime objects parsed once in validate()
+		start_dt = self._start_dt
+		end_dt = self._end_dt
+		if start_dt is None or end_dt is None:
 			frappe.throw("Invalid datetime format for Start or End DateTime.")
 
 		# Validate end is after start
@@ -93,8 +126,7 @@ class MMCalendarEventSync(Document):
 			)
 
 		# Validate events are not in the distant past (> 2 years ago)
-		current_dt = now_datetime()
-		days_in_past = (current_dt - start_dt).days
+		days_in_past = (self._now - start_dt).days
 
 		if days_in_past > 730:  # 2 years
 			frappe.msgprint(
@@ -127,14 +159,10 @@ class MMCalendarEventSync(Document):
 
 		for idx, attendee in enumerate(attendees):
 			# Attendee can be either a string (email) or an object with email field
-			if isinstance(attendee, str):
-				email = attendee
-			elif isinstance(attendee, dict):
-				if "email" not in attendee:
-					frappe.throw(f"Attendee at index {idx} is missing 'email' field.")
-				email = attendee.get("email")
-			else:
+			handler = _ATTENDEE_EXTRACT.get(type(attendee))
+			if handler is None:
 				frappe.throw(f"Attendee at index {idx} must be a string or object.")
+			email = handler(attendee, idx)
 
 			# Validate email format
 			if email and not email_pattern.match(email):
@@ -157,7 +185,7 @@ class MMCalendarEventSync(Document):
 			return
 
 		# Check if meeting booking exists
-		if not frappe.db.exists("MM Meeting Booking", self.meeting_booking):
+		if not cached_exists("MM Meeting Booking", self.meeting_booking):
 			frappe.throw(f"Meeting Booking '{self.meeting_booking}' does not exist.")
 
 		# Check if meeting booking is already linked to another calendar event
@@ -167,24 +195,28 @@ class MMCalendarEventSync(Document):
 		if not self.is_new():
 			filters["name"] = ["!=", self.name]
 
-		existing_link = frappe.db.exists("MM Calendar Event Sync", filters)
+		existing_link = frappe.db.get_value("MM Calendar Event Sync", filters, "name")
 		if existing_link:
 			frappe.msgprint(
-				f"Warning: Meeting Booking '{self.meeting_booking}' is already linked to another calendar event. "
-				f"Multiple calendar events for the same booking may cause sync conflicts.",
+				f"Warning: Meeting Booking '{self.meeting_booking}' is already linked to another calendar event "
+				f"('{existing_link}'). Multiple calendar events for the same booking may cause sync conflicts.",
 				alert=True,
 				indicator="orange"
 			)
 
-		# Verify timing consistency between event and booking
-		booking_start = frappe.db.get_value("MM Meeting Booking", self.meeting_booking, "start_datetime")
-		booking_end = frappe.db.get_value("MM Meeting Booking", self.meeting_booking, "end_datetime")
+		# Verify timing consistency between event and booking (one query for both fields)
+		booking = frappe.db.get_value(
+			"MM Meeting Booking",
+			self.meeting_booking,
+			["start_datetime", "end_datetime"],
+			as_dict=True
+		)
 
-		if booking_start and booking_end:
-			event_start = get_datetime(self.start_datetime)
-			event_end = get_datetime(self.end_datetime)
-			booking_start_dt = get_datetime(booking_start)
-			booking_end_dt = get_datetime(booking_end)
+		if booking and booking.start_datetime and booking.end_datetime:
+			event_start = self._start_dt
+			event_end = self._end_dt
+			booking_start_dt = _to_dt(booking.start_datetime)
+			booking_end_dt = _to_dt(booking.end_datetime)
 
 			# Allow small time differences (up to 5 minutes) for timezone/rounding differences
 			time_tolerance_seconds = 300  # 5 minutes
@@ -202,9 +234,16 @@ class MMCalendarEventSync(Document):
 
 	def on_update(self):
 		"""Hook called after document is saved"""
-		# Update last_synced timestamp
-		if self.sync_status == "Synced":
-			self.db_set("last_synced", now_datetime(), update_modified=False)
+		if self.sync_status != "Synced":
+			return
+
+		# Only touch last_synced when the status actually transitioned to
+		# Synced - skips one UPDATE per save under webhook-driven flows
+		prev = self.get_doc_before_save()
+		if prev and prev.sync_status == "Synced" and self.last_synced:
+			return
+
+		self.db_set("last_synced", now_datetime(), update_modified=False)
 
 	def on_trash(self):
 		"""Hook called before document is deleted"""
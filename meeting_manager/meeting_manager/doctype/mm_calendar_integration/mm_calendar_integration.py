@@ -4,8 +4,18 @@
 import frappe
 from frappe.model.document import Document
 from frappe.utils import now_datetime, get_datetime
+from datetime import datetime
 import re
 
+from meeting_manager.meeting_manager.utils.caching import cached_exists
+
+
+def _to_dt(value):
+	"""Return a datetime, skipping the parse when the value is already typed"""
+	if isinstance(value, datetime):
+		return value
+	return get_datetime(value)
+
 
 class MMCalendarIntegration(Document):
 	def validate(self):
@@ -22,7 +32,7 @@ class MMCalendarIntegration(Document):
 		if not self.user:
 			frappe.throw("User is required.")
 
-		if not frappe.db.exists("User", self.user):
+		if not cached_exists("User", self.user):
 			frappe.throw(f"User '{self.user}' does not exist.")
 
 	def validate_integration_name_unique(self):
@@ -127,25 +137,31 @@ class MMCalendarIntegration(Document):
 			return
 
 		try:
-			expiry_datetime = get_datetime(self.token_expiry)
-			current_datetime = now_datetime()
+			expiry_datetime = _to_dt(self.token_expiry)
+		except (ValueError, TypeError) as e:
+			frappe.throw(f"Invalid Token Expiry datetime format: {e}")
 
-			# If token has expired and integration is active, warn the user
-			if expiry_datetime < current_datetime and self.is_active:
-				frappe.msgprint(
-					f"Warning: Access Token has expired on {self.token_expiry}. "
-					f"Please re-authenticate to continue syncing.",
-					alert=True,
-					indicator="red"
-				)
-		except:
-			frappe.throw("Invalid Token Expiry datetime format.")
+		# If token has expired and integration is active, warn the user
+		if expiry_datetime < now_datetime() and self.is_active:
+			frappe.msgprint(
+				f"Warning: Access Token has expired on {self.token_expiry}. "
+				f"Please re-authenticate to continue syncing.",
+				alert=True,
+				indicator="red"
+			)
 
 	def validate_primary_calendar(self):
 		"""Ensure only one primary calendar per user"""
 		if not self.is_primary:
 			return
 
+		# Skip the DB round trip when neither the primary flag nor the user
+		# changed in this save
+		if not self.is_new():
+			prev = self.get_doc_before_save()
+			if prev and prev.is_primary == self.is_primary and prev.user == self.user:
+				return
+
 		# Check if another primary calendar exists for this user
 		filters = {
 			"user": self.user,
@@ -171,6 +187,10 @@ class MMCalendarIntegration(Document):
 		"""Hook called after document is saved"""
 		# If this is marked as primary and active, ensure it's the only active primary
 		if self.is_primary and self.is_active:
+			# No-op when the document was already the primary calendar
+			prev = self.get_doc_before_save()
+			if prev and prev.is_primary and prev.user == self.user:
+				return
 			self.unmark_other_primary_calendars()
 
 	def unmark_other_primary_calendars(self):
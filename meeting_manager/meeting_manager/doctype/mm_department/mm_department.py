@@ -1,10 +1,29 @@
 # Copyright (c) 2025, Best Security and contributors
 # For license information, please see license.txt
 
+import re
+import string
+
 import frappe
 from frappe.model.document import Document
 from frappe.utils import get_url
 
+from meeting_manager.meeting_manager.utils.caching import (
+	clear_led_departments_cache,
+	clear_public_booking_cache,
+	clear_timeline_acl_cache,
+)
+
+# Translate table that keeps only lowercase letters, digits and hyphens -
+# runs at C speed vs a regex scan, and drops any unlisted character
+class _SlugTable(dict):
+	def __missing__(self, code):
+		return None
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in string.ascii_lowercase + string.digits + "-"})
+_MULTI_DASH_RE = re.compile(r'-+')
+
 
 class MMDepartment(Document):
 	def validate(self):
@@ -46,27 +65,30 @@ class MMDepartment(Document):
 		if not self.department_members:
 			frappe.throw("Department must have at least one member.")
 
-		# Check for duplicate members
-		member_list = [m.member for m in self.department_members]
-		if len(member_list) != len(set(member_list)):
-			frappe.throw("Duplicate members found. Each user can only be added once to the department.")
+		# Single pass over the child table: collect duplicates, validate
+		# existence and assignment_priority, and count active members
+		seen = set()
+		active_count = 0
 
-		# Validate each member exists and validate assignment_priority
 		for member in self.department_members:
+			if member.member in seen:
+				frappe.throw("Duplicate members found. Each user can only be added once to the department.")
+			seen.add(member.member)
+
 			if not frappe.db.exists("User", member.member):
 				frappe.throw(f"User '{member.member}' does not exist.")
 
-			# Validate assignment_priority is positive
-			if member.assignment_priority is not None and member.assignment_priority <= 0:
-				frappe.throw(f"Assignment Priority for member '{member.member}' must be greater than 0.")
-    
-			# Validate assignment_priority is not greater than 10
-			if member.assignment_priority is not None and member.assignment_priority > 10:
-				frappe.throw(f"Assignment Priority for member '{member.member}' must be less or equal to 10.")
+			# Validate assignment_priority is within range (1-10)
+			if member.assignment_priority is not None:
+				if member.assignment_priority <= 0:
+					frappe.throw(f"Assignment Priority for member '{member.member}' must be greater than 0.")
+				if member.assignment_priority > 10:
+					frappe.throw(f"Assignment Priority for member '{member.member}' must be less or equal to 10.")
 
-		active_members = [m for m in self.department_members if m.is_active]
+			if member.is_active:
+				active_count += 1
 
-		if not active_members:
+		if not active_count:
 			frappe.throw("Department must have at least one active member. Please enable 'Is Active' for at least one member.")
 
 	def validate_department_slug(self):
@@ -74,22 +96,13 @@ class MMDepartment(Document):
 		if not self.department_slug:
 			frappe.throw("Department Slug is required.")
 
-		import re
+		# Convert to lowercase, turn spaces into hyphens, then drop anything
+		# that isn't a lowercase letter, number or hyphen in one translate pass
+		slug = self.department_slug.lower().strip().replace(" ", "-")
+		slug = slug.translate(_SLUG_TABLE)
 
-		# Convert to lowercase and strip leading/trailing whitespace
-		self.department_slug = self.department_slug.lower().strip()
-
-		# Replace spaces with hyphens
-		self.department_slug = self.department_slug.replace(" ", "-")
-
-		# Remove any characters that aren't lowercase letters, numbers, or hyphens
-		self.department_slug = re.sub(r'[^a-z0-9\-]', '', self.department_slug)
-
-		# Replace consecutive hyphens with a single hyphen
-		self.department_slug = re.sub(r'-+', '-', self.department_slug)
-
-		# Remove leading and trailing hyphens
-		self.department_slug = self.department_slug.strip('-')
+		# Collapse consecutive hyphens and remove leading/trailing hyphens
+		self.department_slug = _MULTI_DASH_RE.sub('-', slug).strip('-')
 
 		# Ensure slug is not empty after cleaning
 		if not self.department_slug:
@@ -108,3 +121,15 @@ class MMDepartment(Document):
 		"""Auto-generate public booking URL based on department slug"""
 		site_url = get_url()
 		self.public_booking_url = f"{site_url}/book/{self.department_slug}"
+
+	def on_update(self):
+		"""Hook called after saving - membership or leadership may have changed"""
+		clear_timeline_acl_cache()
+		clear_led_departments_cache()
+		clear_public_booking_cache()
+
+	def on_trash(self):
+		"""Hook called before deletion"""
+		clear_timeline_acl_cache()
+		clear_led_departments_cache()
+		clear_public_booking_cache()
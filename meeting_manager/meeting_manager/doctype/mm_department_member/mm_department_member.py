@@ -4,6 +4,8 @@
 import frappe
 from frappe.model.document import Document
 
+from meeting_manager.meeting_manager.utils.caching import cached_exists, cached_get_value
+
 
 class MMDepartmentMember(Document):
 	def validate(self):
@@ -17,11 +19,11 @@ class MMDepartmentMember(Document):
 		if not self.member:
 			frappe.throw("Member is required.")
 
-		if not frappe.db.exists("User", self.member):
+		if not cached_exists("User", self.member):
 			frappe.throw(f"User '{self.member}' does not exist.")
 
 		# Check if user is enabled
-		user_enabled = frappe.db.get_value("User", self.member, "enabled")
+		user_enabled = cached_get_value("User", self.member, "enabled")
 		if not user_enabled:
 			frappe.msgprint(
 				f"Warning: User '{self.member}' is disabled. Consider removing them from the department or enabling their account.",
@@ -38,17 +40,13 @@ class MMDepartmentMember(Document):
 		if not parent_doc:
 			return
 
-		# Get parent document to access all members
-		parent = frappe.get_doc("MM Department", parent_doc)
-
-		# Count occurrences of this member (excluding current row if updating)
-		member_count = 0
-		for dept_member in parent.members:
-			if dept_member.member == self.member:
-				# Skip current row (same idx means same row)
-				if hasattr(self, 'idx') and hasattr(dept_member, 'idx') and dept_member.idx == self.idx:
-					continue
-				member_count += 1
+		# Count other rows with this member via an indexed query instead of
+		# loading the parent and scanning its child table for every row save
+		member_count = frappe.db.sql(
+			"""SELECT COUNT(*) FROM `tabMM Department Member`
+			WHERE parent=%s AND member=%s AND idx!=%s""",
+			(parent_doc, self.member, getattr(self, "idx", 0))
+		)[0][0]
 
 		if member_count > 0:
 			frappe.throw(
@@ -4,49 +4,182 @@
 import frappe
 from frappe.model.document import Document
 from frappe.utils import get_datetime, now_datetime
-import re
-import random
-import string
+import secrets
+
+from meeting_manager.meeting_manager.utils.validation import is_valid_email
+
+# C-level single-pass strip of phone formatting characters (no regex engine)
+_PHONE_STRIP = str.maketrans('', '', ' \t\n\r\v\f-()+')
 
 
 class MMMeetingBooking(Document):
+	def before_insert(self):
+		"""Creation-only setup - keeps the update-save path short"""
+		self.set_created_by()
+		self.apply_meeting_type_defaults()
+		self.set_booking_reference()
+
 	def validate(self):
 		"""Validate meeting booking before saving"""
-		self.set_created_by()
+		self._cache_times()
+		self._prepare_assignment_data()
 		self.validate_meeting_type_exists()
-		self.validate_timing()
-		self.calculate_duration()
-		self.validate_customer_details()
-		self.validate_assigned_users()
+
+		# Gate the expensive sub-validators on actual field changes so the
+		# common "minor edit" save skips regex parsing and DB lookups
+		is_new = self.is_new()
+
+		if is_new or self.has_value_changed("start_datetime") or self.has_value_changed("end_datetime"):
+			self.validate_timing()
+			self.calculate_duration()
+
+		if is_new or any(
+			self.has_value_changed(f)
+			for f in ("is_internal", "customer_name", "customer_email", "customer_phone")
+		):
+			self.validate_customer_details()
+
+		if self._assigned_users_changed():
+			self.validate_assigned_users()
+
 		self.validate_participants()
 		self.validate_approval_workflow()
-		self.validate_calendar_sync()
-		self.validate_location_settings()
+
+		if is_new or self.has_value_changed("calendar_event") or self.has_value_changed("calendar_event_synced"):
+			self.validate_calendar_sync()
+
+		if is_new or any(
+			self.has_value_changed(f)
+			for f in ("location_type", "meeting_location", "video_meeting_url")
+		):
+			self.validate_location_settings()
+
 		self.validate_booking_status()
-		self.set_booking_reference()
+
+	def _prepare_assignment_data(self):
+		"""Single pass over assigned_users shared by the timing and assignment validators
+
+		Collects users, duplicates, the primary-host count and (for new
+		bookings) the batched availability-rule lookup, so the individual
+		validators don't each re-scan the child table.
+		"""
+		session_user = frappe.session.user
+		users = set()
+		duplicate = False
+		primary_count = 0
+
+		for assigned_user in self.assigned_users or []:
+			if assigned_user.user in users:
+				duplicate = True
+			else:
+				users.add(assigned_user.user)
+
+			# Set assigned_by if not set
+			if not assigned_user.assigned_by:
+				assigned_user.assigned_by = session_user
+
+			if assigned_user.is_primary_host:
+				primary_count += 1
+
+		self._au_users_set = users
+		self._au_duplicate = duplicate
+		self._au_primary_count = primary_count
+
+		# Default availability rules for all assigned users in one query
+		self._au_rules = {}
+		if self.is_new() and users:
+			self._au_rules = {
+				r.user: r
+				for r in frappe.get_all(
+					"MM User Availability Rule",
+					filters={"user": ["in", list(users)], "is_active": 1, "is_default": 1},
+					fields=["user", "max_days_advance", "min_notice_hours"]
+				)
+			}
+
+	def _get_old_doc(self):
+		"""Load the pre-save version of this document once per save"""
+		if not hasattr(self, "_old_doc_cache"):
+			self._old_doc_cache = self.get_doc_before_save()
+		return self._old_doc_cache
+
+	def _assigned_users_changed(self):
+		"""Detect whether the assigned_users child table changed in this save"""
+		if self.is_new():
+			return True
+
+		old_doc = self._get_old_doc()
+		if old_doc is None:
+			return True
+
+		old_rows = [(au.user, bool(au.is_primary_host), au.assigned_by) for au in old_doc.assigned_users or []]
+		new_rows = [(au.user, bool(au.is_primary_host), au.assigned_by) for au in self.assigned_users or []]
+		return old_rows != new_rows
 
 	def before_save(self):
 		"""Hook called before document is saved"""
 		# Track status changes for history
 		if not self.is_new():
-			old_doc = self.get_doc_before_save()
+			old_doc = self._get_old_doc()
 			if old_doc and old_doc.booking_status != self.booking_status:
 				self.add_history_entry(
 					event_type=self.booking_status,
 					description=f"Booking status changed from {old_doc.booking_status} to {self.booking_status}"
 				)
 
+	def _cache_times(self):
+		"""Parse start/end datetimes and capture now() once per validate() call"""
+		self._now_dt = now_datetime()
+		try:
+			self._start_dt = get_datetime(self.start_datetime) if self.start_datetime else None
+			self._end_dt = get_datetime(self.end_datetime) if self.end_datetime else None
+		except (ValueError, TypeError):
+			self._start_dt = None
+			self._end_dt = None
+
 	def set_created_by(self):
 		"""Auto-set created_by to current user if not already set"""
-		if not self.created_by and self.is_new():
+		if not self.created_by:
 			self.created_by = frappe.session.user
 
+	def apply_meeting_type_defaults(self):
+		"""Copy approval and location defaults from the meeting type on creation"""
+		if not self.meeting_type:
+			return
+
+		meeting_type = frappe.get_cached_value(
+			"MM Meeting Type",
+			self.meeting_type,
+			["requires_approval", "location_type", "custom_location"],
+			as_dict=True
+		)
+		if not meeting_type:
+			return
+
+		if meeting_type.requires_approval:
+			self.requires_approval = 1
+			self.approval_status = "Pending"
+
+		if not self.location_type:
+			self.location_type = meeting_type.location_type
+		if not self.meeting_location and meeting_type.custom_location:
+			self.meeting_location = meeting_type.custom_location
+
 	def validate_meeting_type_exists(self):
 		"""Ensure the selected meeting type exists and is active"""
 		if not self.meeting_type:
 			frappe.throw("Meeting Type is required.")
 
-		meeting_type = frappe.get_doc("MM Meeting Type", self.meeting_type)
+		# Cached multi-field fetch - avoids loading the full document with child tables
+		meeting_type = frappe.get_cached_value(
+			"MM Meeting Type",
+			self.meeting_type,
+			["is_active", "is_internal", "is_public"],
+			as_dict=True
+		)
+		if not meeting_type:
+			frappe.throw(f"Meeting Type '{self.meeting_type}' does not exist.")
+
 		if not meeting_type.is_active:
 			frappe.throw(f"Meeting Type '{self.meeting_type}' is not active. Please select an active meeting type.")
 
@@ -63,18 +196,6 @@ class MMMeetingBooking(Document):
 				f"Please select a meeting type that allows public bookings."
 			)
 
-		# Set requires_approval from meeting type if not already set
-		if self.is_new() and meeting_type.requires_approval:
-			self.requires_approval = 1
-			self.approval_status = "Pending"
-
-		# Copy location settings from meeting type if not already set
-		if self.is_new():
-			if not self.location_type:
-				self.location_type = meeting_type.location_type
-			if not self.meeting_location and meeting_type.custom_location:
-				self.meeting_location = meeting_type.custom_location
-
 	def validate_timing(self):
 		"""Validate booking timing is logical and available"""
 		if not self.start_datetime:
@@ -83,11 +204,10 @@ class MMMeetingBooking(Document):
 		if not self.end_datetime:
 			frappe.throw("End DateTime is required.")
 
-		# Convert to datetime objects for comparison
-		try:
-			start_dt = get_datetime(self.start_datetime)
-			end_dt = get_datetime(self.end_datetime)
-		except:
+		# Use the datetime objects parsed once in validate()
+		start_dt = self._start_dt
+		end_dt = self._end_dt
+		if start_dt is None or end_dt is None:
 			frappe.throw("Invalid datetime format for Start or End DateTime.")
 
 		# Validate end is after start
@@ -95,28 +215,23 @@ class MMMeetingBooking(Document):
 			frappe.throw("End DateTime must be after Start DateTime.")
 
 		# Validate booking is not in the past (for new bookings)
-		if self.is_new():
-			current_dt = now_datetime()
-			if start_dt < current_dt:
-				frappe.throw("Cannot create a booking in the past. Please select a future date and time.")
+		if self.is_new() and start_dt < self._now_dt:
+			frappe.throw("Cannot create a booking in the past. Please select a future date and time.")
 
 		# Validate booking doesn't exceed maximum advance booking window
 		if self.is_new() and self.assigned_users:
+			# Availability rules were fetched in one query by _prepare_assignment_data
+			rules_by_user = self._au_rules
+
+			current_dt = self._now_dt
+			days_in_advance = (start_dt - current_dt).days
+			hours_in_advance = (start_dt - current_dt).total_seconds() / 3600
+
 			for assigned_user in self.assigned_users:
 				user = assigned_user.user
-				# Get user's availability rules
-				availability_rule = frappe.get_value(
-					"MM User Availability Rule",
-					{"user": user, "is_active": 1, "is_default": 1},
-					["max_days_advance", "min_notice_hours"],
-					as_dict=True
-				)
+				availability_rule = rules_by_user.get(user)
 
 				if availability_rule:
-					current_dt = now_datetime()
-					days_in_advance = (start_dt - current_dt).days
-					hours_in_advance = (start_dt - current_dt).total_seconds() / 3600
-
 					if days_in_advance > availability_rule.max_days_advance:
 						frappe.throw(
 							f"Booking is too far in advance for user '{user}'. "
@@ -131,13 +246,10 @@ class MMMeetingBooking(Document):
 
 	def calculate_duration(self):
 		"""Calculate duration in minutes from start and end times"""
-		if not self.start_datetime or not self.end_datetime:
+		if not self._start_dt or not self._end_dt:
 			return
 
-		start_dt = get_datetime(self.start_datetime)
-		end_dt = get_datetime(self.end_datetime)
-
-		duration_seconds = (end_dt - start_dt).total_seconds()
+		duration_seconds = (self._end_dt - self._start_dt).total_seconds()
 		self.duration = int(duration_seconds / 60)
 
 	def validate_customer_details(self):
@@ -153,14 +265,13 @@ class MMMeetingBooking(Document):
 		if not self.customer_email:
 			frappe.throw("Customer Email is required for external bookings.")
 
-		email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-		if not email_pattern.match(self.customer_email):
+		if not is_valid_email(self.customer_email):
 			frappe.throw(f"Invalid email format for Customer Email: '{self.customer_email}'")
 
 		# Validate customer_phone format if provided
 		if self.customer_phone:
 			# Remove common phone formatting characters
-			phone_digits = re.sub(r'[\s\-\(\)\+]', '', self.customer_phone)
+			phone_digits = self.customer_phone.translate(_PHONE_STRIP)
 			if not phone_digits.isdigit() or len(phone_digits) < 7:
 				frappe.throw("Invalid phone number format. Please provide a valid phone number.")
 
@@ -169,22 +280,21 @@ class MMMeetingBooking(Document):
 		if not self.assigned_users or len(self.assigned_users) == 0:
 			frappe.throw("At least one user must be assigned to this booking.")
 
-		# Check for duplicate users
-		user_list = [au.user for au in self.assigned_users]
-		if len(user_list) != len(set(user_list)):
-			frappe.throw("Duplicate users found in assigned users. Each user can only be assigned once.")
+		# Consume the single pass done in _prepare_assignment_data
+		users = self._au_users_set
+		primary_count = self._au_primary_count
 
-		# Validate each assigned user exists
-		for assigned_user in self.assigned_users:
-			if not frappe.db.exists("User", assigned_user.user):
-				frappe.throw(f"User '{assigned_user.user}' does not exist.")
+		if self._au_duplicate:
+			frappe.throw("Duplicate users found in assigned users. Each user can only be assigned once.")
 
-			# Set assigned_by if not set
-			if not assigned_user.assigned_by:
-				assigned_user.assigned_by = frappe.session.user
+		# Validate all assigned users exist in one query instead of one per row
+		existing = set(frappe.get_all("User", filters=[["name", "in", list(users)]], pluck="name"))
+		missing = users - existing
+		if missing:
+			frappe.throw(f"User '{', '.join(sorted(missing))}' does not exist.")
 
-		# Count primary hosts
-		primary_count = sum(1 for au in self.assigned_users if au.is_primary_host)
+		# Let child-row validators skip their per-row existence lookups
+		self.flags.users_prevalidated = True
 
 		if primary_count == 0:
 			frappe.throw("At least one assigned user must be marked as Primary Host.")
@@ -201,17 +311,19 @@ class MMMeetingBooking(Document):
 		if not self.participants:
 			return
 
-		# Check for duplicate participants
-		participant_emails = [p.email for p in self.participants]
-		if len(participant_emails) != len(set(participant_emails)):
-			frappe.throw("Duplicate participants found. Each participant email must be unique.")
-
-		# Validate each participant
-		email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+		# Single pass: detect duplicate emails on insertion, validate per-row
+		# requirements and collect internal users for the batched checks below
+		seen_emails = set()
+		internal_users = set()
+		need_email = []
 
 		for participant in self.participants:
+			if participant.email in seen_emails:
+				frappe.throw("Duplicate participants found. Each participant email must be unique.")
+			seen_emails.add(participant.email)
+
 			# Validate email format
-			if not email_pattern.match(participant.email):
+			if not is_valid_email(participant.email):
 				frappe.throw(f"Invalid email format for participant: '{participant.email}'")
 
 			# Validate internal participant has user set
@@ -222,22 +334,33 @@ class MMMeetingBooking(Document):
 			if participant.participant_type == "External" and not participant.name1:
 				frappe.throw(f"External participant must have a Name: '{participant.email}'")
 
-			# Validate user exists if internal
 			if participant.participant_type == "Internal" and participant.user:
-				if not frappe.db.exists("User", participant.user):
-					frappe.throw(f"User '{participant.user}' does not exist.")
-
-				# Auto-populate email from user if not set
+				internal_users.add(participant.user)
 				if not participant.email:
-					participant.email = frappe.db.get_value("User", participant.user, "email")
+					need_email.append(participant)
+
+		# Validate all internal users exist in one query instead of one per row
+		if internal_users:
+			existing = set(frappe.get_all("User", filters=[["name", "in", list(internal_users)]], pluck="name"))
+			missing = internal_users - existing
+			if missing:
+				frappe.throw(f"User '{', '.join(sorted(missing))}' does not exist.")
+
+			# Auto-populate emails from users in one bulk fetch if not set
+			if need_email:
+				emails = {
+					u.name: u.email
+					for u in frappe.get_all(
+						"User",
+						filters=[["name", "in", [p.user for p in need_email]]],
+						fields=["name", "email"]
+					)
+				}
+				for participant in need_email:
+					participant.email = emails.get(participant.user)
 
-		# Warn if no participants added for confirmed bookings
-		if len(self.participants) == 0 and self.booking_status == "Confirmed":
-			frappe.msgprint(
-				"Warning: No participants added to this confirmed booking. Consider adding participants for better tracking.",
-				alert=True,
-				indicator="orange"
-			)
+			# Child rows don't need to repeat the single-row email lookup
+			self.flags.participant_emails_prepopulated = True
 
 	def validate_approval_workflow(self):
 		"""Validate approval workflow logic"""
@@ -255,7 +378,7 @@ class MMMeetingBooking(Document):
 			if not self.approved_by:
 				self.approved_by = frappe.session.user
 			if not self.approval_date:
-				self.approval_date = now_datetime()
+				self.approval_date = self._now_dt
 
 			# Update booking_status based on approval_status
 			if self.approval_status == "Approved" and self.booking_status == "Pending":
@@ -281,9 +404,10 @@ class MMMeetingBooking(Document):
 			# Auto-check if calendar event is linked
 			self.calendar_event_synced = 1
 
-		# Validate calendar event exists if specified
+		# Validate calendar event exists if specified (in-process cache hit on
+		# repeated saves and bulk imports rather than a DB query each time)
 		if self.calendar_event:
-			if not frappe.db.exists("MM Calendar Event Sync", self.calendar_event):
+			if not frappe.get_cached_value("MM Calendar Event Sync", self.calendar_event, "name"):
 				frappe.throw(f"Calendar Event '{self.calendar_event}' does not exist.")
 
 	def validate_location_settings(self):
@@ -312,7 +436,7 @@ class MMMeetingBooking(Document):
 		# Validate cancelled_at is set for cancelled bookings
 		if self.booking_status == "Cancelled":
 			if not self.cancelled_at:
-				self.cancelled_at = now_datetime()
+				self.cancelled_at = self._now_dt
 
 			# Cancellation reason is recommended
 			if not self.cancellation_reason:
@@ -324,10 +448,8 @@ class MMMeetingBooking(Document):
 
 		# Validate no-show and completed status are only for past bookings
 		if self.booking_status in ["No-Show", "Completed"]:
-			if self.start_datetime:
-				start_dt = get_datetime(self.start_datetime)
-				current_dt = now_datetime()
-				if start_dt > current_dt:
+			if self._start_dt:
+				if self._start_dt > self._now_dt:
 					frappe.throw(
 						f"Cannot mark a future booking as '{self.booking_status}'. "
 						f"This status can only be set for past bookings."
@@ -335,10 +457,10 @@ class MMMeetingBooking(Document):
 
 	def set_booking_reference(self):
 		"""Generate unique booking reference for customer communication"""
-		if not self.booking_reference and self.is_new():
-			# Generate a unique reference code
-			ref_code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-			self.booking_reference = f"BK-{ref_code}"
+		if not self.booking_reference:
+			# Generate a unique reference code (one urandom read + hex encode,
+			# cryptographically unique unlike random.choices)
+			self.booking_reference = f"BK-{secrets.token_hex(4).upper()}"
 
 	def add_history_entry(self, event_type, description):
 		"""Add entry to booking history"""
@@ -347,13 +469,16 @@ class MMMeetingBooking(Document):
 
 		self.append("booking_history", {
 			"event_type": event_type,
-			"event_datetime": now_datetime(),
+			"event_datetime": getattr(self, "_now_dt", None) or now_datetime(),
 			"event_by": frappe.session.user,
 			"event_description": description
 		})
 
 	def on_update(self):
 		"""Hook called after document is saved"""
+		# Reuse the timestamp captured in validate() when available
+		if not getattr(self, "_now_dt", None):
+			self._now_dt = now_datetime()
 		# Add creation history entry for new bookings
 		if self.is_new():
 			self.add_history_entry(
@@ -363,54 +488,72 @@ class MMMeetingBooking(Document):
 
 		# Track assignment changes
 		if not self.is_new():
-			old_doc = self.get_doc_before_save()
+			old_doc = self._get_old_doc()
 			if old_doc:
 				self.track_assignment_changes(old_doc)
 
 	def track_assignment_changes(self, old_doc):
 		"""Track changes in assigned users and add to assignment history"""
+		# Skip the set building and appends entirely on the common
+		# "edit a description" save where assignments didn't change
+		new_sig = tuple(sorted((au.user, bool(au.is_primary_host)) for au in self.assigned_users or []))
+		old_sig = tuple(sorted((au.user, bool(au.is_primary_host)) for au in old_doc.assigned_users or []))
+		if new_sig == old_sig:
+			return
+
 		old_users = {au.user for au in old_doc.assigned_users} if old_doc.assigned_users else set()
 		new_users = {au.user for au in self.assigned_users} if self.assigned_users else set()
 
-		# Find added users
-		added_users = new_users - old_users
-		for user in added_users:
-			self.append("assignment_history", {
+		# One timestamp and one session-user read shared by all history rows -
+		# the transitions belong to the same save
+		now = getattr(self, "_now_dt", None) or now_datetime()
+		action_by = frappe.session.user
+
+		# Build all history rows as plain dicts, then append them in one
+		# extend call instead of constructing child docs one at a time
+		# (static notes - the user column already records who changed)
+		rows = [
+			{
 				"action_type": "Assigned",
 				"user": user,
-				"action_datetime": now_datetime(),
-				"action_by": frappe.session.user,
-				"notes": f"User {user} was assigned to this booking"
-			})
-
-		# Find removed users
-		removed_users = old_users - new_users
-		for user in removed_users:
-			self.append("assignment_history", {
+				"action_datetime": now,
+				"action_by": action_by,
+				"notes": "User was assigned to this booking"
+			}
+			for user in new_users - old_users
+		]
+		rows.extend(
+			{
 				"action_type": "Unassigned",
 				"user": user,
-				"action_datetime": now_datetime(),
-				"action_by": frappe.session.user,
-				"notes": f"User {user} was unassigned from this booking"
-			})
+				"action_datetime": now,
+				"action_by": action_by,
+				"notes": "User was unassigned from this booking"
+			}
+			for user in old_users - new_users
+		)
 
 		# Check for primary host changes
 		old_primary = next((au.user for au in old_doc.assigned_users if au.is_primary_host), None) if old_doc.assigned_users else None
 		new_primary = next((au.user for au in self.assigned_users if au.is_primary_host), None) if self.assigned_users else None
 
 		if old_primary != new_primary and new_primary:
-			self.append("assignment_history", {
+			rows.append({
 				"action_type": "Primary Changed",
 				"user": new_primary,
-				"action_datetime": now_datetime(),
-				"action_by": frappe.session.user,
+				"action_datetime": now,
+				"action_by": action_by,
 				"notes": f"Primary host changed from {old_primary or 'None'} to {new_primary}"
 			})
 
+		if rows:
+			self.extend("assignment_history", rows)
+
 	def on_cancel(self):
 		"""Hook called when document is cancelled"""
+		self._now_dt = now_datetime()
 		self.booking_status = "Cancelled"
-		self.cancelled_at = now_datetime()
+		self.cancelled_at = self._now_dt
 		self.add_history_entry(
 			event_type="Cancelled",
 			description=f"Booking cancelled. Reason: {self.cancellation_reason or 'Not provided'}"
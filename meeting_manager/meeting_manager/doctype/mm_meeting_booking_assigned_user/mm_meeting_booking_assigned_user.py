@@ -16,6 +16,12 @@ class MMMeetingBookingAssignedUser(Document):
 		if not self.user:
 			frappe.throw("User is required.")
 
+		# Parent bookings batch-validate every user in one query; skip the
+		# redundant per-row lookup when that already ran
+		parent = getattr(self, "parent_doc", None)
+		if parent is not None and parent.flags.get("users_prevalidated"):
+			return
+
 		if not frappe.db.exists("User", self.user):
 			frappe.throw(f"User '{self.user}' does not exist.")
 
@@ -3,7 +3,8 @@
 
 import frappe
 from frappe.model.document import Document
-import re
+
+from meeting_manager.meeting_manager.utils.validation import is_valid_email
 
 
 class MMMeetingBookingParticipant(Document):
@@ -19,6 +20,12 @@ class MMMeetingBookingParticipant(Document):
 			if not self.user:
 				frappe.throw("User is required for Internal participants.")
 
+			# Parent bookings batch-validate every user in one query; skip
+			# the redundant per-row lookup when that already ran
+			parent = getattr(self, "parent_doc", None)
+			if parent is not None and parent.flags.get("users_prevalidated"):
+				return
+
 			# Validate user exists
 			if not frappe.db.exists("User", self.user):
 				frappe.throw(f"User '{self.user}' does not exist.")
@@ -33,11 +40,16 @@ class MMMeetingBookingParticipant(Document):
 			frappe.throw("Email is required.")
 
 		# Email format validation
-		email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-		if not email_pattern.match(self.email):
+		if not is_valid_email(self.email):
 			frappe.throw(f"Invalid email format: '{self.email}'")
 
 	def auto_populate_email_for_internal(self):
 		"""Auto-populate email from user if internal participant"""
 		if self.participant_type == "Internal" and self.user and not self.email:
+			# Parent bookings bulk-fetch missing emails for all internal
+			# participants; skip the per-row lookup when that already ran
+			parent = getattr(self, "parent_doc", None)
+			if parent is not None and parent.flags.get("participant_emails_prepopulated"):
+				return
+
 			self.email = frappe.db.get_value("User", self.user, "email")
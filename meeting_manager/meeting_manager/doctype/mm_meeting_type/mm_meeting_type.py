@@ -5,6 +5,20 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import get_url
 import re
+import string
+
+from meeting_manager.meeting_manager.utils.caching import clear_public_booking_cache
+
+
+# Translate table that keeps only lowercase letters, digits and hyphens -
+# runs at C speed vs a regex scan, and drops any unlisted character
+class _SlugTable(dict):
+	def __missing__(self, code):
+		return None
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in string.ascii_lowercase + string.digits + "-"})
+_SLUG_DEDUP_HYPHEN_RE = re.compile(r'-+')
 
 
 class MMMeetingType(Document):
@@ -29,8 +43,12 @@ class MMMeetingType(Document):
 		if not self.department:
 			frappe.throw("Department is required.")
 
-		department = frappe.get_doc("MM Department", self.department)
-		if not department.is_active:
+		# Cached single-field fetch - avoids loading the full document with child tables
+		is_active = frappe.get_cached_value("MM Department", self.department, "is_active")
+		if is_active is None:
+			frappe.throw(f"Department '{self.department}' does not exist.")
+
+		if not is_active:
 			frappe.throw(f"Department '{self.department}' is not active. Please select an active department.")
 
 	def validate_meeting_slug(self):
@@ -38,20 +56,13 @@ class MMMeetingType(Document):
 		if not self.meeting_slug:
 			frappe.throw("Meeting Slug is required.")
 
-		# Convert to lowercase and strip leading/trailing whitespace
-		self.meeting_slug = self.meeting_slug.lower().strip()
+		# Convert to lowercase, turn spaces into hyphens, then drop anything
+		# that isn't a lowercase letter, number or hyphen in one translate pass
+		slug = self.meeting_slug.lower().strip().replace(" ", "-")
+		slug = slug.translate(_SLUG_TABLE)
 
-		# Replace spaces with hyphens
-		self.meeting_slug = self.meeting_slug.replace(" ", "-")
-
-		# Remove any characters that aren't lowercase letters, numbers, or hyphens
-		self.meeting_slug = re.sub(r'[^a-z0-9\-]', '', self.meeting_slug)
-
-		# Replace consecutive hyphens with a single hyphen
-		self.meeting_slug = re.sub(r'-+', '-', self.meeting_slug)
-
-		# Remove leading and trailing hyphens
-		self.meeting_slug = self.meeting_slug.strip('-')
+		# Collapse consecutive hyphens and remove leading/trailing hyphens
+		self.meeting_slug = _SLUG_DEDUP_HYPHEN_RE.sub('-', slug).strip('-')
 
 		# Ensure slug is not empty after cleaning
 		if not self.meeting_slug:
@@ -132,15 +143,27 @@ class MMMeetingType(Document):
 				indicator="orange"
 			)
 
+	def on_update(self):
+		"""Hook called after saving - cached public booking lookups may be stale"""
+		clear_public_booking_cache()
+
+	def on_trash(self):
+		"""Hook called before deletion"""
+		clear_public_booking_cache()
+
 	def set_public_booking_url(self):
 		"""Auto-generate public booking URL based on department and meeting slugs"""
 		if not self.department or not self.meeting_slug:
 			return
 
-		# Get department slug
-		department_slug = frappe.db.get_value("MM Department", self.department, "department_slug")
+		# Get department slug from the in-process cache rather than the DB
+		department_slug = frappe.get_cached_value("MM Department", self.department, "department_slug")
 		if not department_slug:
 			return
 
-		site_url = get_url()
+		# get_url() reads site config - memoize it for the request
+		site_url = getattr(frappe.local, "_mm_site_url", None)
+		if site_url is None:
+			site_url = frappe.local._mm_site_url = get_url()
+
 		self.public_booking_url = f"{site_url}/book/{department_slug}/{self.meeting_slug}"
@@ -53,19 +53,22 @@ class MMMeetingTypeReminder(Document):
 			)
 
 	def validate_duplicate_reminder(self):
-		"""Ensure no duplicate reminder times for the same meeting type"""
+		"""Ensure no duplicate reminder times for the same meeting type
+
+		Duplicate detection across the full schedule is handled in a single
+		pass by MMMeetingType.validate_reminder_schedule. Only check against
+		the in-memory parent here - re-fetching the parent (with all its
+		child tables) for every row save made multi-row saves O(n^2).
+		"""
 		if not self.hours_before_meeting:
 			return
 
-		parent_doc = self.get("parent")
-		if not parent_doc:
+		parent = getattr(self, "parent_doc", None)
+		if not parent:
 			return
 
-		# Get parent document to access all reminders
-		parent = frappe.get_doc("MM Meeting Type", parent_doc)
-
-		# Check for duplicate hours_before_meeting (excluding current row if updating)
-		for reminder in parent.reminder_schedule:
+		# Check for duplicate hours_before_meeting (excluding current row)
+		for reminder in parent.get("reminder_schedule") or []:
 			if reminder.hours_before_meeting == self.hours_before_meeting:
 				# Skip current row (same idx means same row)
 				if hasattr(self, 'idx') and hasattr(reminder, 'idx') and reminder.idx == self.idx:
@@ -75,16 +78,3 @@ class MMMeetingTypeReminder(Document):
 					f"A reminder at {self.hours_before_meeting} hours before meeting already exists. "
 					f"Each reminder time must be unique for this meeting type."
 				)
-
-		# Recommend common reminder patterns if this is the first reminder
-		active_reminders = [r for r in parent.reminder_schedule if r.is_active]
-		if len(active_reminders) == 0:
-			frappe.msgprint(
-				"Tip: Common reminder patterns include:\n"
-				"- 24 hours + 1 hour before (for important meetings)\n"
-				"- 24 hours before (standard)\n"
-				"- 1 hour before (last-minute reminder)\n"
-				"- 15 minutes before (quick reminder)",
-				alert=True,
-				indicator="blue"
-			)
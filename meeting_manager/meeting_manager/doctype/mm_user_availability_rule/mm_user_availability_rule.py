@@ -92,10 +92,23 @@ class MMUserAvailabilityRule(Document):
 			)
 
 	def validate_default_rule(self):
-		"""Ensure only one default rule per user"""
+		"""Ensure only one default rule per user
+
+		A unique index on the generated `_default_user` column enforces this
+		invariant race-safely at the DB level (see the
+		add_default_rule_unique_index patch); this check only exists to give
+		a readable error before the save hits the index.
+		"""
 		if not self.is_default:
 			return
 
+		# Skip the lookup when is_default was already set - the invariant
+		# held before this save and this rule isn't becoming the default now
+		if not self.is_new():
+			before = self.get_doc_before_save()
+			if before and before.is_default:
+				return
+
 		# Check if another default rule exists for this user
 		filters = {
 			"user": self.user,
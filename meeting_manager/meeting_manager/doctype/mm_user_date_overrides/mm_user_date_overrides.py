@@ -3,8 +3,19 @@
 
 import frappe
 from frappe.model.document import Document
-from frappe.utils import today, getdate
-from datetime import time
+from frappe.utils import getdate
+from datetime import date
+
+
+def _parse_hhmm(value):
+	"""Return an (hour, minute) tuple for a time value or 'HH:MM' string
+
+	Raises ValueError/IndexError for malformed strings.
+	"""
+	if isinstance(value, str):
+		parts = value.split(':')
+		return int(parts[0]), int(parts[1])
+	return value.hour, value.minute
 
 
 class MMUserDateOverrides(Document):
@@ -26,25 +37,43 @@ class MMUserDateOverrides(Document):
 		if not self.date:
 			return
 
+		# When saved through the parent rule, the sibling rows are already in
+		# memory - compare against those without touching the DB at all
+		parent = getattr(self, "parent_doc", None)
+		if parent is not None:
+			own_date = getdate(self.date)
+			for override in parent.get("date_overrides") or []:
+				if override.idx == self.idx or not override.date:
+					continue
+
+				if getdate(override.date) == own_date:
+					self._throw_duplicate_date()
+			return
+
 		parent_doc = self.get("parent")
 		if not parent_doc:
 			return
 
-		# Get parent document to access all date overrides
-		parent = frappe.get_doc("MM User Availability Rule", parent_doc)
-
-		# Check for duplicate dates (excluding current row if updating)
-		for override in parent.date_overrides:
-			if override.date and getdate(override.date) == getdate(self.date):
-				# Skip current row (same idx means same row)
-				if hasattr(self, 'idx') and hasattr(override, 'idx') and override.idx == self.idx:
-					continue
-
-				frappe.throw(
-					f"A date override for {self.date} already exists. "
-					f"Each date can only have one override entry. "
-					f"Please update the existing override instead of creating a new one."
-				)
+		# Direct child save (e.g. via REST): fall back to a single indexed
+		# lookup instead of loading the full parent document
+		exists = frappe.db.exists(
+			"MM User Date Overrides",
+			{
+				"parent": parent_doc,
+				"date": self.date,
+				"name": ["!=", self.name or ""]
+			}
+		)
+
+		if exists:
+			self._throw_duplicate_date()
+
+	def _throw_duplicate_date(self):
+		frappe.throw(
+			f"A date override for {self.date} already exists. "
+			f"Each date can only have one override entry. "
+			f"Please update the existing override instead of creating a new one."
+		)
 
 	def validate_custom_hours(self):
 		"""Validate custom hours if user is available"""
@@ -61,21 +90,21 @@ class MMUserDateOverrides(Document):
 					"Custom End Hours must be after Custom Start Hours."
 				)
 
-			# Validate reasonable hours (not exceeding 24 hours)
-			start_time = self.custom_hours_start
-			end_time = self.custom_hours_end
+			# Validate reasonable hours (not exceeding 24 hours) - parse each
+			# time once and cache the tuples for validate_custom_hours_format
+			try:
+				self._start_hm = _parse_hhmm(self.custom_hours_start)
+			except (ValueError, IndexError):
+				frappe.throw("Custom Start Hours must be in HH:MM format (e.g., 09:00).")
 
-			# Convert to time objects for comparison
-			if isinstance(start_time, str):
-				start_parts = start_time.split(':')
-				start_time = time(int(start_parts[0]), int(start_parts[1]))
-			if isinstance(end_time, str):
-				end_parts = end_time.split(':')
-				end_time = time(int(end_parts[0]), int(end_parts[1]))
+			try:
+				self._end_hm = _parse_hhmm(self.custom_hours_end)
+			except (ValueError, IndexError):
+				frappe.throw("Custom End Hours must be in HH:MM format (e.g., 17:00).")
 
 			# Check if duration exceeds 24 hours (shouldn't be possible for same-day override)
-			start_minutes = start_time.hour * 60 + start_time.minute
-			end_minutes = end_time.hour * 60 + end_time.minute
+			start_minutes = self._start_hm[0] * 60 + self._start_hm[1]
+			end_minutes = self._end_hm[0] * 60 + self._end_hm[1]
 
 			duration_minutes = end_minutes - start_minutes
 			if duration_minutes > 1440:  # 24 hours
@@ -99,7 +128,9 @@ class MMUserDateOverrides(Document):
 		if not self.date:
 			return
 
-		if getdate(self.date) < getdate(today()):
+		# date.today() is already a date object - no string round-trip
+		# through today()/getdate() needed
+		if getdate(self.date) < date.today():
 			frappe.msgprint(
 				f"Warning: You are creating an override for a past date ({self.date}). "
 				"This will not affect past bookings.",
@@ -112,32 +143,27 @@ class MMUserDateOverrides(Document):
 		if not self.available:
 			return
 
-		# Validate start time format
+		# Validate start time format, reusing the tuple parsed in
+		# validate_custom_hours instead of splitting the string again
 		if self.custom_hours_start:
 			try:
-				if isinstance(self.custom_hours_start, str):
-					parts = self.custom_hours_start.split(':')
-					hour = int(parts[0])
-					minute = int(parts[1])
-
-					if hour < 0 or hour > 23:
-						frappe.throw("Custom Start Hours: Hour must be between 0 and 23.")
-					if minute < 0 or minute > 59:
-						frappe.throw("Custom Start Hours: Minute must be between 0 and 59.")
+				hour, minute = getattr(self, "_start_hm", None) or _parse_hhmm(self.custom_hours_start)
 			except (ValueError, IndexError):
 				frappe.throw("Custom Start Hours must be in HH:MM format (e.g., 09:00).")
 
+			if hour < 0 or hour > 23:
+				frappe.throw("Custom Start Hours: Hour must be between 0 and 23.")
+			if minute < 0 or minute > 59:
+				frappe.throw("Custom Start Hours: Minute must be between 0 and 59.")
+
 		# Validate end time format
 		if self.custom_hours_end:
 			try:
-				if isinstance(self.custom_hours_end, str):
-					parts = self.custom_hours_end.split(':')
-					hour = int(parts[0])
-					minute = int(parts[1])
-
-					if hour < 0 or hour > 23:
-						frappe.throw("Custom End Hours: Hour must be between 0 and 23.")
-					if minute < 0 or minute > 59:
-						frappe.throw("Custom End Hours: Minute must be between 0 and 59.")
+				hour, minute = getattr(self, "_end_hm", None) or _parse_hhmm(self.custom_hours_end)
 			except (ValueError, IndexError):
 				frappe.throw("Custom End Hours must be in HH:MM format (e.g., 17:00).")
+
+			if hour < 0 or hour > 23:
+				frappe.throw("Custom End Hours: Hour must be between 0 and 23.")
+			if minute < 0 or minute > 59:
+				frappe.throw("Custom End Hours: Minute must be between 0 and 59.")
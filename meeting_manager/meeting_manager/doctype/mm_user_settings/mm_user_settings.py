@@ -4,6 +4,14 @@
 import frappe
 from frappe.model.document import Document
 import json
+import re
+
+from meeting_manager.meeting_manager.utils.caching import clear_working_hours_cache
+
+# HH:MM time format, compiled once instead of per weekday per save
+_HHMM_RE = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
+
+_VALID_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
 
 
 class MMUserSettings(Document):
@@ -12,6 +20,14 @@ class MMUserSettings(Document):
 		self.validate_working_hours_json()
 		self.validate_user_exists()
 
+	def on_update(self):
+		"""Hook called after saving - the cached working hours may be stale"""
+		clear_working_hours_cache(self.user)
+
+	def on_trash(self):
+		"""Hook called before deletion"""
+		clear_working_hours_cache(self.user)
+
 	def validate_user_exists(self):
 		"""Ensure the selected user exists in the User doctype"""
 		if not self.user:
@@ -45,12 +61,10 @@ class MMUserSettings(Document):
 			frappe.throw("Invalid JSON format for Working Hours.")
 
 		# Validate structure
-		valid_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-
 		if not isinstance(working_hours, dict):
 			frappe.throw("Working Hours must be a JSON object.")
 
-		for day in valid_days:
+		for day in _VALID_DAYS:
 			if day not in working_hours:
 				frappe.throw(f"Missing configuration for '{day}' in Working Hours.")
 
@@ -71,23 +85,23 @@ class MMUserSettings(Document):
 					frappe.throw(f"'{day}' is enabled but missing 'start' or 'end' time.")
 
 				# Validate time format (HH:MM)
-				import re
-				time_pattern = re.compile(r'^([01]\d|2[0-3]):([0-5]\d)$')
-
-				if not time_pattern.match(day_config["start"]):
+				start_match = _HHMM_RE.match(day_config["start"])
+				if not start_match:
 					frappe.throw(f"Invalid start time format for '{day}'. Use HH:MM format (e.g., 09:00).")
 
-				if not time_pattern.match(day_config["end"]):
+				end_match = _HHMM_RE.match(day_config["end"])
+				if not end_match:
 					frappe.throw(f"Invalid end time format for '{day}'. Use HH:MM format (e.g., 17:00).")
 
-				# Validate that end time is after start time
-				start_minutes = int(day_config["start"].split(":")[0]) * 60 + int(day_config["start"].split(":")[1])
-				end_minutes = int(day_config["end"].split(":")[0]) * 60 + int(day_config["end"].split(":")[1])
+				# Validate that end time is after start time, reusing the
+				# hour/minute captures instead of re-splitting the strings
+				start_minutes = int(start_match.group(1)) * 60 + int(start_match.group(2))
+				end_minutes = int(end_match.group(1)) * 60 + int(end_match.group(2))
 
 				if end_minutes <= start_minutes:
 					frappe.throw(f"End time must be after start time for '{day}'.")
 
 		# Ensure at least one day is enabled
-		enabled_days = [day for day in valid_days if working_hours[day].get("enabled")]
+		enabled_days = [day for day in _VALID_DAYS if working_hours[day].get("enabled")]
 		if not enabled_days:
 			frappe.throw("At least one day must be enabled in Working Hours.")
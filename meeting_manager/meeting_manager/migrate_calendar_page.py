@@ -20,22 +20,14 @@ def migrate():
 		print("Found old calendar-view page. Renaming to mm-calendar-view...")
 
 		try:
-			# Get the old page
-			old_page = frappe.get_doc("Page", "calendar-view")
-
 			# Check if new page already exists
 			if frappe.db.exists("Page", "mm-calendar-view"):
 				print("⚠️  mm-calendar-view page already exists. Deleting old calendar-view...")
-				old_page.delete()
-				frappe.db.commit()
+				frappe.get_doc("Page", "calendar-view").delete()
 				print("✅ Old calendar-view page deleted")
 			else:
-				# Rename the page
-				old_page.name = "mm-calendar-view"
-				old_page.page_name = "mm-calendar-view"
-				old_page.title = "Meeting Manager Calendar"
-
-				# Update the page using SQL to avoid validation issues
+				# Rename the page using SQL to avoid validation issues - no
+				# need to hydrate the Page document for this
 				frappe.db.sql("""
 					UPDATE `tabPage`
 					SET name = 'mm-calendar-view',
@@ -44,25 +36,16 @@ def migrate():
 					WHERE name = 'calendar-view'
 				""")
 
-				frappe.db.commit()
 				print("✅ Page renamed from calendar-view to mm-calendar-view")
 
-			# Update workspace links
+			# Update workspace links in one statement instead of loading and
+			# saving each Workspace document
 			print("\nUpdating workspace links...")
-			workspaces = frappe.get_all("Workspace", filters={"name": "Meeting Manager"})
-
-			for ws in workspaces:
-				workspace = frappe.get_doc("Workspace", ws.name)
-				updated = False
-
-				for link in workspace.links:
-					if link.link_type == "Page" and link.link_to == "calendar-view":
-						link.link_to = "mm-calendar-view"
-						updated = True
-						print(f"  - Updated link in workspace: {workspace.name}")
-
-				if updated:
-					workspace.save(ignore_permissions=True)
+			frappe.db.sql("""
+				UPDATE `tabWorkspace Link`
+				SET link_to = 'mm-calendar-view'
+				WHERE link_type = 'Page' AND link_to = 'calendar-view'
+			""")
 
 			frappe.db.commit()
 			print("✅ Workspace links updated")
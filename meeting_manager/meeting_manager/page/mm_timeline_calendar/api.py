@@ -5,7 +5,124 @@ Provides resources (team members) and events (meetings) for FullCalendar
 
 import frappe
 from frappe import _
+from collections import defaultdict
 from datetime import datetime
+import re
+
+from meeting_manager.meeting_manager.utils.caching import (
+	TIMELINE_ACL_CACHE_KEY,
+	cached_roles,
+)
+
+# Fixed-format fallback parser for datetime strings - DATETIME columns come
+# back from Frappe as datetime objects, so this path is rarely taken
+_ISO_RE = re.compile(r"(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)")
+
+# Event color per booking status - built once at import, not per request
+_COLOR_MAP = {
+	"Confirmed": "#10b981",   # Green
+	"Pending": "#f59e0b",     # Yellow/Orange
+	"Cancelled": "#ef4444",   # Red
+	"Completed": "#3b82f6",   # Blue
+	"No-Show": "#6b7280",     # Gray
+	"Rescheduled": "#8b5cf6"  # Purple
+}
+
+
+def _to_iso(value):
+	"""Return an ISO-format string for a datetime or datetime-like string"""
+	if hasattr(value, "isoformat"):
+		return value.isoformat()
+	m = _ISO_RE.match(value)
+	if m:
+		return datetime(*map(int, m.groups())).isoformat()
+	return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+
+
+def _parse_fc_dt(value):
+	"""Parse the datetime string FullCalendar posts on drag-and-drop
+
+	The shape is fixed ('YYYY-MM-DDTHH:MM:SS.000Z'), so slicing the digits
+	out beats scanning the string twice for replace() + fromisoformat().
+	Anything unexpected falls back to the general parser.
+	"""
+	if len(value) >= 19 and value[10] == "T":
+		try:
+			return datetime(
+				int(value[0:4]), int(value[5:7]), int(value[8:10]),
+				int(value[11:13]), int(value[14:16]), int(value[17:19])
+			)
+		except ValueError:
+			pass
+
+	return datetime.fromisoformat(value.replace('Z', '+00:00').replace('.000', ''))
+
+
+def _get_accessible_users():
+	"""Resolve which users' bookings the session user may see
+
+	Returns None when unrestricted (System Manager), else a list of user
+	ids - possibly empty for a leader with no active led departments.
+	The leader derivation costs two queries and the calendar re-requests
+	events on every pan, so it is cached in Redis; MM Department saves
+	and deletions invalidate the cache.
+	"""
+	user_roles = cached_roles()
+
+	if "System Manager" in user_roles:
+		return None
+
+	user = frappe.session.user
+
+	if "Department Leader" not in user_roles:
+		# Regular team members see only their bookings
+		return [user]
+
+	cached = frappe.cache().hget(TIMELINE_ACL_CACHE_KEY, user)
+	if cached is not None:
+		return cached.get("users")
+
+	# Get departments led by current user, then their members
+	led_departments = frappe.get_all(
+		"MM Department",
+		filters={"department_leader": user, "is_active": 1},
+		pluck="name"
+	)
+
+	# No led departments means no visible users - not unrestricted access,
+	# which a None here would silently grant
+	accessible_users = []
+	if led_departments:
+		accessible_users = frappe.get_all(
+			"MM Department Member",
+			filters={"parent": ["in", led_departments], "is_active": 1},
+			pluck="member"
+		)
+
+	frappe.cache().hset(TIMELINE_ACL_CACHE_KEY, user, {"users": accessible_users})
+	return accessible_users
+
+
+def _member_resources(members):
+	"""Build FullCalendar resources for department members, resolving
+	full names in a single batched query instead of one per member"""
+	if not members:
+		return []
+
+	name_map = {
+		u.name: u.full_name
+		for u in frappe.db.get_values(
+			"User",
+			{"name": ["in", [m.member for m in members]]},
+			["name", "full_name"],
+			as_dict=True
+		)
+	}
+
+	return [
+		{"id": m.member, "title": name_map.get(m.member) or m.member}
+		for m in members
+	]
 
 
 @frappe.whitelist()
@@ -24,7 +141,7 @@ def get_resources(department=None):
 		]
 	"""
 	try:
-		user_roles = frappe.get_roles()
+		user_roles = cached_roles()
 		resources = []
 
 		if department:
@@ -36,29 +153,21 @@ def get_resources(department=None):
 				order_by="member asc"
 			)
 
-			for member in members:
-				user_name = frappe.get_value("User", member.member, "full_name")
-				resources.append({
-					"id": member.member,
-					"title": user_name or member.member
-				})
+			resources = _member_resources(members)
 
 		elif "System Manager" in user_roles:
-			# System managers see all users with meeting access
-			# Get all unique users who are assigned to meetings or are department members
-			users = frappe.db.sql("""
-				SELECT DISTINCT user.name, user.full_name
-				FROM `tabUser` user
-				WHERE user.enabled = 1
-					AND user.name NOT IN ('Guest', 'Administrator')
-				ORDER BY user.full_name ASC
-			""", as_dict=True)
-
-			for user in users:
-				resources.append({
-					"id": user.name,
-					"title": user.full_name or user.name
-				})
+			# System managers see all enabled users
+			users = frappe.get_all(
+				"User",
+				filters={"enabled": 1, "name": ["not in", ["Guest", "Administrator"]]},
+				fields=["name", "full_name"],
+				order_by="full_name asc"
+			)
+
+			resources = [
+				{"id": user.name, "title": user.full_name or user.name}
+				for user in users
+			]
 
 		else:
 			# For department leaders and team members, get their accessible users
@@ -70,21 +179,18 @@ def get_resources(department=None):
 					pluck="name"
 				)
 
-				# Get members from these departments
+				# Get members from these departments - DISTINCT in SQL since a
+				# user can belong to several led departments
 				if led_departments:
 					members = frappe.get_all(
 						"MM Department Member",
 						filters={"parent": ["in", led_departments], "is_active": 1},
 						fields=["member"],
+						distinct=True,
 						order_by="member asc"
 					)
 
-					for member in members:
-						user_name = frappe.get_value("User", member.member, "full_name")
-						resources.append({
-							"id": member.member,
-							"title": user_name or member.member
-						})
+					resources = _member_resources(members)
 			else:
 				# Regular team members see only themselves
 				user_name = frappe.get_value("User", frappe.session.user, "full_name")
@@ -93,15 +199,8 @@ def get_resources(department=None):
 					"title": user_name or frappe.session.user
 				})
 
-		# Remove duplicates
-		seen = set()
-		unique_resources = []
-		for resource in resources:
-			if resource["id"] not in seen:
-				seen.add(resource["id"])
-				unique_resources.append(resource)
-
-		return unique_resources
+		# Each branch is already duplicate-free (DISTINCT in SQL where needed)
+		return resources
 
 	except Exception as e:
 		frappe.log_error(f"Error fetching resources: {str(e)}", "Timeline Calendar API")
@@ -175,59 +274,56 @@ def get_events(start, end, department=None, status=None, meeting_type=None, serv
 			...
 		]
 	"""
-	try:
-		user_roles = frappe.get_roles()
-
-		# Build base filters
-		filters = {
-			"start_datetime": [">=", start],
-			"end_datetime": ["<=", end]
-		}
+	# Build base filters
+	filters = {
+		"start_datetime": [">=", start],
+		"end_datetime": ["<=", end]
+	}
 
-		if status:
-			filters["booking_status"] = status
+	if status:
+		filters["booking_status"] = status
 
-		if meeting_type:
-			filters["meeting_type"] = meeting_type
+	if meeting_type:
+		filters["meeting_type"] = meeting_type
 
-		if service:
-			filters["select_mkru"] = service
+	if service:
+		filters["select_mkru"] = service
 
-		if status_color:
-			filters["status_color"] = status_color
+	if status_color:
+		filters["status_color"] = status_color
 
-		# Permission-based filtering
-		accessible_users = None
+	# Permission-based filtering
+	accessible_users = _get_accessible_users()
 
-		if "System Manager" not in user_roles:
-			if "Department Leader" in user_roles:
-				# Get departments led by current user
-				led_departments = frappe.get_all(
-					"MM Department",
-					filters={"department_leader": frappe.session.user, "is_active": 1},
-					pluck="name"
-				)
+	# Empty scope: nothing is visible, skip the queries entirely
+	if accessible_users is not None and not accessible_users:
+		return []
 
-				# Get members from these departments
-				if led_departments:
-					accessible_users = frappe.get_all(
-						"MM Department Member",
-						filters={"parent": ["in", led_departments], "is_active": 1},
-						pluck="member"
-					)
-			else:
-				# Regular team members see only their bookings
-				accessible_users = [frappe.session.user]
+	# Push the permission filter into SQL: only meetings with at least one
+	# accessible assignee are fetched, instead of post-filtering in Python
+	if accessible_users is not None:
+		visible = frappe.get_all(
+			"MM Meeting Booking Assigned User",
+			filters={"user": ["in", accessible_users]},
+			pluck="parent",
+			distinct=True
+		)
+		if not visible:
+			return []
+		filters["name"] = ["in", visible]
 
-		# Fetch meetings
+	# Fetch meetings - the only guarded call; event assembly below is
+	# plain Python over prefetched maps and should fail fast, not log per row
+	try:
 		meetings = frappe.get_all(
 			"MM Meeting Booking",
 			filters=filters,
 			fields=[
 				"name",
 				"booking_reference",
-				"is_internal",
 				"meeting_type",
+				# Joined from the linked type so no second lookup is needed
+				"meeting_type.meeting_name as meeting_type_name",
 				"customer_name",
 				"customer_email",
 				"customer_phone",
@@ -236,96 +332,83 @@ def get_events(start, end, department=None, status=None, meeting_type=None, serv
 				"duration",
 				"booking_status",
 				"location_type",
-				"video_meeting_url",
-				"meeting_title"
+				"video_meeting_url"
 			],
 			order_by="start_datetime asc",
 			limit=500  # Limit for performance
 		)
+	except Exception as e:
+		frappe.log_error(f"Error fetching events: {str(e)}", "Timeline Calendar API")
+		frappe.throw(_("Failed to load events. Please try again."))
+
+	# Bulk-fetch assigned users and meeting type names: 2 queries total
+	# instead of 2 per meeting
+	assigned_by_meeting = defaultdict(list)
+	if meetings:
+		rows = frappe.get_all(
+			"MM Meeting Booking Assigned User",
+			filters={"parent": ["in", [m.name for m in meetings]]},
+			fields=["parent", "user", "is_primary_host"]
+		)
 
-		# Color mapping based on status
-		color_map = {
-			"Confirmed": "#10b981",   # Green
-			"Pending": "#f59e0b",     # Yellow/Orange
-			"Cancelled": "#ef4444",   # Red
-			"Completed": "#3b82f6",   # Blue
-			"No-Show": "#6b7280",     # Gray
-			"Rescheduled": "#8b5cf6"  # Purple
+		# Primary hosts first; sorting here instead of ORDER BY avoids a
+		# filesort on a column the child-table index doesn't cover
+		rows.sort(key=lambda a: -int(a.is_primary_host or 0))
+
+		for row in rows:
+			assigned_by_meeting[row.parent].append(row)
+
+	# Build events list
+	events = []
+	for meeting in meetings:
+		assigned_users = assigned_by_meeting.get(meeting.name, [])
+
+		# Get meeting type name (joined in the booking fetch)
+		meeting_type_name = meeting.meeting_type_name or "Meeting"
+
+		# Determine event title
+		customer_name = meeting.customer_name or meeting.customer_email or "Guest"
+		event_title = f"{customer_name} - {meeting_type_name}"
+
+		# Get status color
+		event_color = _COLOR_MAP.get(meeting.booking_status, "#6b7280")
+
+		# Format datetimes for FullCalendar once per meeting, not per assignee
+		start_iso = _to_iso(meeting.start_datetime)
+		end_iso = _to_iso(meeting.end_datetime)
+
+		# Shared extendedProps - only is_primary_host varies per assignee
+		base_props = {
+			"booking_reference": meeting.booking_reference,
+			"customer_name": meeting.customer_name or "N/A",
+			"customer_email": meeting.customer_email or "N/A",
+			"customer_phone": meeting.customer_phone or "N/A",
+			"status": meeting.booking_status,
+			"meeting_type": meeting_type_name,
+			"location_type": meeting.location_type or "N/A",
+			"video_meeting_url": meeting.video_meeting_url or "",
+			"duration": meeting.duration or 0
 		}
 
-		# Build events list
-		events = []
-		for meeting in meetings:
-			# Get assigned users from child table
-			assigned_users = frappe.get_all(
-				"MM Meeting Booking Assigned User",
-				filters={"parent": meeting.name},
-				fields=["user", "is_primary_host"],
-				order_by="is_primary_host desc"
-			)
+		# Create event for each assigned user (resource)
+		for assigned_user in assigned_users:
+			props = dict(base_props)
+			props["is_primary_host"] = assigned_user.is_primary_host
+
+			events.append({
+				"id": meeting.name,
+				"resourceId": assigned_user.user,
+				"title": event_title,
+				"start": start_iso,
+				"end": end_iso,
+				"backgroundColor": event_color,
+				"borderColor": event_color,
+				"textColor": "#ffffff",
+				"extendedProps": props
+			})
 
-			# Filter by permission if needed
-			if accessible_users:
-				# Check if any assigned user is in accessible_users
-				meeting_users = [au.user for au in assigned_users]
-				if not any(user in accessible_users for user in meeting_users):
-					continue  # Skip this meeting
-
-			# Get meeting type name
-			meeting_type_name = frappe.get_value(
-				"MM Meeting Type",
-				meeting.meeting_type,
-				"meeting_name"
-			) if meeting.meeting_type else "Meeting"
-
-			# Determine event title
-			customer_name = meeting.customer_name or meeting.customer_email or "Guest"
-			event_title = f"{customer_name} - {meeting_type_name}"
-
-			# Get status color
-			event_color = color_map.get(meeting.booking_status, "#6b7280")
-
-			# Create event for each assigned user (resource)
-			for assigned_user in assigned_users:
-				# Format datetime for FullCalendar
-				start_dt = meeting.start_datetime
-				end_dt = meeting.end_datetime
-
-				if isinstance(start_dt, str):
-					start_dt = datetime.fromisoformat(start_dt.replace('Z', '+00:00'))
-				if isinstance(end_dt, str):
-					end_dt = datetime.fromisoformat(end_dt.replace('Z', '+00:00'))
-
-				event = {
-					"id": meeting.name,
-					"resourceId": assigned_user.user,
-					"title": event_title,
-					"start": start_dt.isoformat(),
-					"end": end_dt.isoformat(),
-					"backgroundColor": event_color,
-					"borderColor": event_color,
-					"textColor": "#ffffff",
-					"extendedProps": {
-						"booking_reference": meeting.booking_reference,
-						"customer_name": meeting.customer_name or "N/A",
-						"customer_email": meeting.customer_email or "N/A",
-						"customer_phone": meeting.customer_phone or "N/A",
-						"status": meeting.booking_status,
-						"meeting_type": meeting_type_name,
-						"location_type": meeting.location_type or "N/A",
-						"video_meeting_url": meeting.video_meeting_url or "",
-						"is_primary_host": assigned_user.is_primary_host,
-						"duration": meeting.duration or 0
-					}
-				}
-
-				events.append(event)
-
-		return events
+	return events
 
-	except Exception as e:
-		frappe.log_error(f"Error fetching events: {str(e)}", "Timeline Calendar API")
-		frappe.throw(_("Failed to load events. Please try again."))
 
 
 @frappe.whitelist()
@@ -360,21 +443,42 @@ def update_booking(booking_id, start_datetime=None, end_datetime=None, new_host=
 		reschedule_booking_internal,
 		has_permission_to_manage_booking
 	)
-	from datetime import datetime as dt
 
 	try:
-		# Check if booking exists
-		if not frappe.db.exists("MM Meeting Booking", booking_id):
+		# Fetch only the columns the permission and status checks read -
+		# the actual writes happen inside the reassign/reschedule APIs,
+		# which load their own documents. Also doubles as the existence check
+		booking = frappe.db.get_value(
+			"MM Meeting Booking",
+			booking_id,
+			["name", "meeting_type", "booking_status", "duration", "start_datetime"],
+			as_dict=True
+		)
+
+		if not booking:
 			return {
 				"success": False,
 				"message": f"Booking {booking_id} not found"
 			}
 
-		# Get the booking document
-		booking = frappe.get_doc("MM Meeting Booking", booking_id)
+		booking.assigned_users = frappe.get_all(
+			"MM Meeting Booking Assigned User",
+			filters={"parent": booking_id},
+			fields=["user"]
+		)
+
+		# Memoize the permission verdict per (user, booking) for the request -
+		# a drag-and-drop can fire reassign and reschedule in one call
+		perm_cache = getattr(frappe.local, "_mm_booking_perm_cache", None)
+		if perm_cache is None:
+			perm_cache = frappe.local._mm_booking_perm_cache = {}
+
+		perm_key = (frappe.session.user, booking_id)
+		allowed = perm_cache.get(perm_key)
+		if allowed is None:
+			allowed = perm_cache[perm_key] = has_permission_to_manage_booking(booking)
 
-		# Check permissions using existing permission system
-		if not has_permission_to_manage_booking(booking):
+		if not allowed:
 			return {
 				"success": False,
 				"message": "You don't have permission to modify this booking"
@@ -408,15 +512,15 @@ def update_booking(booking_id, start_datetime=None, end_datetime=None, new_host=
 
 			changes.append(f"Reassigned from {reassignment_result['old_assigned_to']} to {reassignment_result['new_assigned_to']}")
 
-			# Reload booking after reassignment
-			booking.reload()
+			# No reload needed: reassignment doesn't touch the duration or
+			# start_datetime the reschedule branch reads below
 
 		# CASE 2: RESCHEDULING (time change)
 		if is_rescheduling:
 			# Parse ISO datetime
 			# Handle formats: '2026-01-02T04:30:00.000Z', '2026-01-02T04:30:00Z', '2026-01-02T04:30:00'
-			start_dt = dt.fromisoformat(start_datetime.replace('Z', '+00:00').replace('.000', ''))
-			end_dt = dt.fromisoformat(end_datetime.replace('Z', '+00:00').replace('.000', ''))
+			start_dt = _parse_fc_dt(start_datetime)
+			end_dt = _parse_fc_dt(end_datetime)
 
 			# Extract date and time components
 			new_date = start_dt.strftime('%Y-%m-%d')
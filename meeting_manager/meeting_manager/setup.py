@@ -4,6 +4,418 @@ Setup functions for Meeting Manager app
 import frappe
 import json
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+def _dumps(obj, pretty=False):
+	"""Serialize to a JSON string, preferring orjson when it is installed
+
+	orjson is roughly an order of magnitude faster than the stdlib encoder
+	on the large workspace content/links payloads; fall back to json so the
+	app keeps working without the optional dependency.
+	"""
+	if orjson is not None:
+		try:
+			return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+		except TypeError:
+			# orjson has no default= hook for arbitrary types; let the
+			# stdlib encoder handle them below
+			pass
+	return json.dumps(obj, indent=1 if pretty else None, default=str)
+
+
+# Workspace layout, shortcuts and links are static - build them once at
+# import time instead of rebuilding the literals on every setup run
+# Key insight: shortcut blocks reference shortcuts by label (shortcut_name)
+# and card blocks organize links into sections (card_name matches "Card Break" label)
+_WORKSPACE_CONTENT = [
+	{
+		"id": "shortcuts_header",
+		"type": "header",
+		"data": {
+			"text": "<span class='h4'><b>Quick Access</b></span>",
+			"col": 12
+		}
+	},
+	{
+		"id": "shortcut_meeting_bookings",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Meeting Bookings",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_new_department",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "New Department",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_meeting_types",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Meeting Types",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_my_settings",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "User Settings",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_availability",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "User Availability Rule",
+			"col": 4
+		}
+	},
+	{
+		"id": "spacer_1",
+		"type": "spacer",
+		"data": {
+			"col": 12
+		}
+	},
+	{
+		"id": "bookings_by_status_header",
+		"type": "header",
+		"data": {
+			"text": "<span class='h4'><b>Bookings by Status</b></span>",
+			"col": 12
+		}
+	},
+	{
+		"id": "shortcut_pending",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Pending",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_confirmed",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Confirmed",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_cancelled",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Cancelled",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_completed",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Completed",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_no_show",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "No-Show",
+			"col": 4
+		}
+	},
+	{
+		"id": "shortcut_rescheduled",
+		"type": "shortcut",
+		"data": {
+			"shortcut_name": "Rescheduled",
+			"col": 4
+		}
+	},
+	{
+		"id": "spacer_2",
+		"type": "spacer",
+		"data": {
+			"col": 12
+		}
+	},
+	{
+		"id": "links_header",
+		"type": "header",
+		"data": {
+			"text": "<span class='h4'><b>Meeting Manager</b></span>",
+			"col": 12
+		}
+	},
+	{
+		"id": "card_bookings",
+		"type": "card",
+		"data": {
+			"card_name": "Bookings",
+			"col": 4
+		}
+	},
+	{
+		"id": "card_setup",
+		"type": "card",
+		"data": {
+			"card_name": "Setup",
+			"col": 4
+		}
+	},
+	{
+		"id": "card_configuration",
+		"type": "card",
+		"data": {
+			"card_name": "Configuration",
+			"col": 4
+		}
+	}
+]
+
+# Pre-serialized once; the content JSON never varies between runs
+_CONTENT_JSON = _dumps(_WORKSPACE_CONTENT)
+
+# Note: label must match shortcut_name in content blocks
+_WORKSPACE_SHORTCUTS = [
+	{
+		"label": "Meeting Bookings",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Grey",
+		"format": "{} Total"
+	},
+	{
+		"label": "New Department",
+		"link_to": "MM Department",
+		"type": "DocType",
+		"doc_view": "New",
+		"color": "Blue",
+		"format": "{} Create"
+	},
+	{
+		"label": "Meeting Types",
+		"link_to": "MM Meeting Type",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Green",
+		"format": "{} Available"
+	},
+	{
+		"label": "User Settings",
+		"link_to": "MM User Settings",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Orange",
+		"format": "{} Settings"
+	},
+	{
+		"label": "User Availability Rule",
+		"link_to": "MM User Availability Rule",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Purple",
+		"format": "{} Rules"
+	},
+	# Booking Status Shortcuts
+	{
+		"label": "Pending",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Yellow",
+		"format": "{} Pending",
+		"stats_filter": "{\"booking_status\":\"Pending\"}"
+	},
+	{
+		"label": "Confirmed",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Green",
+		"format": "{} Confirmed",
+		"stats_filter": "{\"booking_status\":\"Confirmed\"}"
+	},
+	{
+		"label": "Cancelled",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Red",
+		"format": "{} Cancelled",
+		"stats_filter": "{\"booking_status\":\"Cancelled\"}"
+	},
+	{
+		"label": "Completed",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Blue",
+		"format": "{} Completed",
+		"stats_filter": "{\"booking_status\":\"Completed\"}"
+	},
+	{
+		"label": "No-Show",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Grey",
+		"format": "{} No-Show",
+		"stats_filter": "{\"booking_status\":\"No-Show\"}"
+	},
+	{
+		"label": "Rescheduled",
+		"link_to": "MM Meeting Booking",
+		"type": "DocType",
+		"doc_view": "List",
+		"color": "Orange",
+		"format": "{} Rescheduled",
+		"stats_filter": "{\"booking_status\":\"Rescheduled\"}"
+	}
+]
+
+# Card Break creates sections, Link adds actual links within sections
+# The "Card Break" label must match the card_name in content blocks
+_WORKSPACE_LINKS = [
+	# Top-level Calendar link (appears directly under Meeting Manager)
+	{
+		"label": "Calendar",
+		"type": "Link",
+		"link_type": "Page",
+		"link_to": "mm-calendar-view",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	# Bookings Section
+	{
+		"label": "Bookings",
+		"type": "Card Break",
+		"hidden": 0,
+		"onboard": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Meeting Bookings",
+		"type": "Link",
+		"link_type": "DocType",
+		"link_to": "MM Meeting Booking",
+		"onboard": 1,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Calendar",
+		"type": "Link",
+		"link_type": "Page",
+		"link_to": "mm-calendar-view",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Timeline Calendar",
+		"type": "Link",
+		"link_type": "Page",
+		"link_to": "mm-timeline-calendar",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Self Book Meeting",
+		"type": "Link",
+		"link_type": "Page",
+		"link_to": "mm-self-book-meeting",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Schedule Team Meeting",
+		"type": "Link",
+		"link_type": "Page",
+		"link_to": "mm-team-meeting",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	# Setup Section
+	{
+		"label": "Setup",
+		"type": "Card Break",
+		"hidden": 0,
+		"onboard": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Departments",
+		"type": "Link",
+		"link_type": "DocType",
+		"link_to": "MM Department",
+		"onboard": 1,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Meeting Types",
+		"type": "Link",
+		"link_type": "DocType",
+		"link_to": "MM Meeting Type",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	# Configuration Section
+	{
+		"label": "Configuration",
+		"type": "Card Break",
+		"hidden": 0,
+		"onboard": 0,
+		"link_count": 0
+	},
+	{
+		"label": "User Settings",
+		"type": "Link",
+		"link_type": "DocType",
+		"link_to": "MM User Settings",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	},
+	{
+		"label": "Availability Rules",
+		"type": "Link",
+		"link_type": "DocType",
+		"link_to": "MM User Availability Rule",
+		"onboard": 0,
+		"hidden": 0,
+		"is_query_report": 0,
+		"link_count": 0
+	}
+]
+
 
 def create_calendar_page():
 	"""
@@ -19,7 +431,6 @@ def create_calendar_page():
 		page.standard = "Yes"
 		page.page_name = "mm-calendar-view"
 		page.insert(ignore_permissions=True)
-		frappe.db.commit()
 		print("✅ Meeting Manager Calendar Page created")
 	else:
 		print("ℹ️  Meeting Manager Calendar Page already exists")
@@ -39,7 +450,6 @@ def create_self_book_page():
 		page.standard = "Yes"
 		page.page_name = "mm-self-book-meeting"
 		page.insert(ignore_permissions=True)
-		frappe.db.commit()
 		print("✅ Self Book Meeting Page created")
 	else:
 		print("ℹ️  Self Book Meeting Page already exists")
@@ -59,7 +469,6 @@ def create_team_meeting_page():
 		page.standard = "Yes"
 		page.page_name = "mm-team-meeting"
 		page.insert(ignore_permissions=True)
-		frappe.db.commit()
 		print("✅ Team Meeting Page created")
 	else:
 		print("ℹ️  Team Meeting Page already exists")
@@ -100,10 +509,15 @@ def after_install():
 		print()
 
 
-def setup_workspace():
+def setup_workspace(export=False):
 	"""
 	Create or update Meeting Manager workspace with proper Frappe v15 structure
 
+	Args:
+		export (bool): Also export the workspace JSON fixture; the export
+			walks the whole document and is only useful in development, so
+			it is skipped on normal installs unless developer_mode is on
+
 	Usage:
 		sh
 	"""
@@ -135,418 +549,33 @@ def setup_workspace():
 	workspace.is_hidden = 0
 	workspace.public = 1
 
-	# Create proper Frappe v15 workspace content structure
-	# Key insight: shortcut blocks reference shortcuts by label (shortcut_name)
-	# and card blocks organize links into sections (card_name matches "Card Break" label)
-	content = [
-		{
-			"id": "shortcuts_header",
-			"type": "header",
-			"data": {
-				"text": "<span class='h4'><b>Quick Access</b></span>",
-				"col": 12
-			}
-		},
-		{
-			"id": "shortcut_meeting_bookings",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Meeting Bookings",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_new_department",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "New Department",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_meeting_types",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Meeting Types",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_my_settings",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "User Settings",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_availability",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "User Availability Rule",
-				"col": 4
-			}
-		},
-		{
-			"id": "spacer_1",
-			"type": "spacer",
-			"data": {
-				"col": 12
-			}
-		},
-		{
-			"id": "bookings_by_status_header",
-			"type": "header",
-			"data": {
-				"text": "<span class='h4'><b>Bookings by Status</b></span>",
-				"col": 12
-			}
-		},
-		{
-			"id": "shortcut_pending",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Pending",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_confirmed",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Confirmed",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_cancelled",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Cancelled",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_completed",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Completed",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_no_show",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "No-Show",
-				"col": 4
-			}
-		},
-		{
-			"id": "shortcut_rescheduled",
-			"type": "shortcut",
-			"data": {
-				"shortcut_name": "Rescheduled",
-				"col": 4
-			}
-		},
-		{
-			"id": "spacer_2",
-			"type": "spacer",
-			"data": {
-				"col": 12
-			}
-		},
-		{
-			"id": "links_header",
-			"type": "header",
-			"data": {
-				"text": "<span class='h4'><b>Meeting Manager</b></span>",
-				"col": 12
-			}
-		},
-		{
-			"id": "card_bookings",
-			"type": "card",
-			"data": {
-				"card_name": "Bookings",
-				"col": 4
-			}
-		},
-		{
-			"id": "card_setup",
-			"type": "card",
-			"data": {
-				"card_name": "Setup",
-				"col": 4
-			}
-		},
-		{
-			"id": "card_configuration",
-			"type": "card",
-			"data": {
-				"card_name": "Configuration",
-				"col": 4
-			}
-		}
-	]
-
-	workspace.content = json.dumps(content)
-
-	# Add shortcuts with proper Frappe v15 structure
-	# Note: label must match shortcut_name in content blocks
-	shortcuts = [
-		{
-			"label": "Meeting Bookings",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Grey",
-			"format": "{} Total"
-		},
-		{
-			"label": "New Department",
-			"link_to": "MM Department",
-			"type": "DocType",
-			"doc_view": "New",
-			"color": "Blue",
-			"format": "{} Create"
-		},
-		{
-			"label": "Meeting Types",
-			"link_to": "MM Meeting Type",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Green",
-			"format": "{} Available"
-		},
-		{
-			"label": "User Settings",
-			"link_to": "MM User Settings",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Orange",
-			"format": "{} Settings"
-		},
-		{
-			"label": "User Availability Rule",
-			"link_to": "MM User Availability Rule",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Purple",
-			"format": "{} Rules"
-		},
-		# Booking Status Shortcuts
-		{
-			"label": "Pending",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Yellow",
-			"format": "{} Pending",
-			"stats_filter": "{\"booking_status\":\"Pending\"}"
-		},
-		{
-			"label": "Confirmed",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Green",
-			"format": "{} Confirmed",
-			"stats_filter": "{\"booking_status\":\"Confirmed\"}"
-		},
-		{
-			"label": "Cancelled",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Red",
-			"format": "{} Cancelled",
-			"stats_filter": "{\"booking_status\":\"Cancelled\"}"
-		},
-		{
-			"label": "Completed",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Blue",
-			"format": "{} Completed",
-			"stats_filter": "{\"booking_status\":\"Completed\"}"
-		},
-		{
-			"label": "No-Show",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Grey",
-			"format": "{} No-Show",
-			"stats_filter": "{\"booking_status\":\"No-Show\"}"
-		},
-		{
-			"label": "Rescheduled",
-			"link_to": "MM Meeting Booking",
-			"type": "DocType",
-			"doc_view": "List",
-			"color": "Orange",
-			"format": "{} Rescheduled",
-			"stats_filter": "{\"booking_status\":\"Rescheduled\"}"
-		}
-	]
-
-	for shortcut in shortcuts:
-		workspace.append("shortcuts", shortcut)
-
-	# Add links with proper Card Break structure (Frappe v15 style)
-	# Card Break creates sections, Link adds actual links within sections
-	# The "Card Break" label must match the card_name in content blocks
-	links_data = [
-		# Top-level Calendar link (appears directly under Meeting Manager)
-		{
-			"label": "Calendar",
-			"type": "Link",
-			"link_type": "Page",
-			"link_to": "mm-calendar-view",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		# Bookings Section
-		{
-			"label": "Bookings",
-			"type": "Card Break",
-			"hidden": 0,
-			"onboard": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Meeting Bookings",
-			"type": "Link",
-			"link_type": "DocType",
-			"link_to": "MM Meeting Booking",
-			"onboard": 1,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Calendar",
-			"type": "Link",
-			"link_type": "Page",
-			"link_to": "mm-calendar-view",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Timeline Calendar",
-			"type": "Link",
-			"link_type": "Page",
-			"link_to": "mm-timeline-calendar",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Self Book Meeting",
-			"type": "Link",
-			"link_type": "Page",
-			"link_to": "mm-self-book-meeting",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Schedule Team Meeting",
-			"type": "Link",
-			"link_type": "Page",
-			"link_to": "mm-team-meeting",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		# Setup Section
-		{
-			"label": "Setup",
-			"type": "Card Break",
-			"hidden": 0,
-			"onboard": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Departments",
-			"type": "Link",
-			"link_type": "DocType",
-			"link_to": "MM Department",
-			"onboard": 1,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Meeting Types",
-			"type": "Link",
-			"link_type": "DocType",
-			"link_to": "MM Meeting Type",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		# Configuration Section
-		{
-			"label": "Configuration",
-			"type": "Card Break",
-			"hidden": 0,
-			"onboard": 0,
-			"link_count": 0
-		},
-		{
-			"label": "User Settings",
-			"type": "Link",
-			"link_type": "DocType",
-			"link_to": "MM User Settings",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		},
-		{
-			"label": "Availability Rules",
-			"type": "Link",
-			"link_type": "DocType",
-			"link_to": "MM User Availability Rule",
-			"onboard": 0,
-			"hidden": 0,
-			"is_query_report": 0,
-			"link_count": 0
-		}
-	]
 
-	for link in links_data:
-		workspace.append("links", link)
+	workspace.content = _CONTENT_JSON
 
-	# Save the workspace
+	# Add shortcuts and links in bulk (proper Frappe v15 structure)
+	workspace.extend("shortcuts", _WORKSPACE_SHORTCUTS)
+	workspace.extend("links", _WORKSPACE_LINKS)
+
+	# Save the workspace. No explicit commit: both entry points (app
+	# install and bench execute) commit once when they finish, so the Page
+	# inserts and the workspace land in a single transaction flush
 	workspace.save(ignore_permissions=True)
-	frappe.db.commit()
 
 	print(f"✅ Workspace '{workspace_name}' created/updated successfully")
 	print(f"\n📄 Workspace saved to: meeting_manager/workspace/meeting_manager/meeting_manager.json")
 	print(f"\n📊 Workspace contains:")
-	print(f"   - {len(shortcuts)} shortcuts (Quick Access buttons)")
-	print(f"   - {len([l for l in links_data if l['type'] == 'Link'])} links in {len([l for l in links_data if l['type'] == 'Card Break'])} sections")
-	print(f"   - {len(content)} content blocks (layout structure)")
+	print(f"   - {len(_WORKSPACE_SHORTCUTS)} shortcuts (Quick Access buttons)")
+	print(f"   - {len([l for l in _WORKSPACE_LINKS if l['type'] == 'Link'])} links in {len([l for l in _WORKSPACE_LINKS if l['type'] == 'Card Break'])} sections")
+	print(f"   - {len(_WORKSPACE_CONTENT)} content blocks (layout structure)")
 	print(f"\n💡 You can now customize the workspace layout via the UI:")
 	print(f"   - http://bestsecurity.local:8001/app/workspace/Meeting Manager")
 	print(f"\n🔄 To export your UI customizations back to code, run:")
 	print(f"   bench --site bestsecurity.local export-fixtures")
 
-	# Export workspace to JSON file
-	export_workspace_to_file(workspace)
+	# Export workspace to JSON file (development only - the as_dict walk
+	# plus indented dump is wasted work on production installs)
+	if export or frappe.conf.get("developer_mode"):
+		export_workspace_to_file(workspace)
 
 	print("\n" + "="*60)
 	print("✅ SETUP COMPLETE! Refresh your browser to see changes.")
@@ -568,10 +597,17 @@ def export_workspace_to_file(workspace):
 	if not os.path.exists(workspace_dir):
 		os.makedirs(workspace_dir)
 
-	# Export to JSON file
+	# Export to JSON file - serialize to one bytes buffer first so the
+	# write is a single syscall instead of json.dump's many tiny chunks
 	workspace_file = os.path.join(workspace_dir, "meeting_manager.json")
 
-	with open(workspace_file, 'w') as f:
-		json.dump(workspace.as_dict(), f, indent=1, default=str)
+	doc = workspace.as_dict()
+	if orjson is not None:
+		data = orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+	else:
+		data = json.dumps(doc, indent=1, default=str).encode()
+
+	with open(workspace_file, 'wb') as f:
+		f.write(data)
 
 	print(f"📁 Workspace exported to: {workspace_file}")
@@ -0,0 +1,153 @@
+# Copyright (c) 2025, Best Security and contributors
+# For license information, please see license.txt
+
+"""
+Request-Scoped Lookup Caches
+
+Thin caches around hot read-only DB lookups (existence checks, single-value
+fetches) that validators repeat for the same keys during bulk imports and
+migrations. Entries live on `frappe.local`, so they are discarded
+automatically at the end of each request.
+"""
+
+import frappe
+
+
+def cached_exists(doctype, name):
+	"""Request-scoped wrapper around frappe.db.exists for hot validators
+
+	Args:
+		doctype (str): DocType to check
+		name (str): Document name
+
+	Returns:
+		bool: True if the document exists
+	"""
+	cache = getattr(frappe.local, "_mm_exists_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_exists_cache = {}
+	key = (doctype, name)
+	if key not in cache:
+		cache[key] = bool(frappe.db.exists(doctype, name))
+	return cache[key]
+
+
+def cached_get_value(doctype, name, fieldname):
+	"""Request-scoped wrapper around frappe.db.get_value for a single field
+
+	Args:
+		doctype (str): DocType to read
+		name (str): Document name
+		fieldname (str): Field to fetch
+
+	Returns:
+		The field value (cached for the remainder of the request)
+	"""
+	cache = getattr(frappe.local, "_mm_value_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_value_cache = {}
+	key = (doctype, name, fieldname)
+	if key not in cache:
+		cache[key] = frappe.db.get_value(doctype, name, fieldname)
+	return cache[key]
+
+
+# Redis hash of user -> calendar permission scope, shared across workers
+TIMELINE_ACL_CACHE_KEY = "mm_timeline_acl"
+
+
+def clear_timeline_acl_cache():
+	"""Drop all cached calendar permission scopes
+
+	Called whenever a department (and with it its member child table)
+	changes, since leadership or membership edits can widen or narrow any
+	leader's visible users.
+	"""
+	frappe.cache().delete_key(TIMELINE_ACL_CACHE_KEY)
+
+
+# Redis hash of user -> working_hours_json, shared across workers
+WORKING_HOURS_CACHE_KEY = "mm_working_hours"
+
+
+def get_cached_working_hours(user):
+	"""Raw working_hours_json for a user, served from Redis when warm
+
+	The availability validators read this blob for every slot check;
+	keeping it in the shared cache spares each worker the MM User
+	Settings lookup. MM User Settings invalidates on save/delete.
+	"""
+	return frappe.cache().hget(
+		WORKING_HOURS_CACHE_KEY,
+		user,
+		generator=lambda: frappe.get_value("MM User Settings", {"user": user}, "working_hours_json") or ""
+	)
+
+
+def clear_working_hours_cache(user):
+	"""Drop the cached working hours for one user"""
+	frappe.cache().hdel(WORKING_HOURS_CACHE_KEY, user)
+
+
+# Redis hash of user -> names of departments they lead
+LED_DEPARTMENTS_CACHE_KEY = "mm_led_departments"
+
+
+def get_led_departments(user):
+	"""Department names a user leads, served from Redis when warm
+
+	Calendar paints resolve the leader's scope on every AJAX range
+	fetch; the answer only changes when a department is saved, which
+	drops this hash.
+	"""
+	return frappe.cache().hget(
+		LED_DEPARTMENTS_CACHE_KEY,
+		user,
+		generator=lambda: frappe.get_all(
+			"MM Department",
+			filters={"department_leader": user},
+			pluck="name"
+		)
+	)
+
+
+def clear_led_departments_cache():
+	"""Drop all cached leadership scopes"""
+	frappe.cache().delete_key(LED_DEPARTMENTS_CACHE_KEY)
+
+
+# Redis hash of "department_slug:meeting_type_slug" -> resolved pair for
+# the public booking wizard
+WIZARD_SLUG_CACHE_KEY = "mm_wizard_slug_pair"
+
+# Cached public API responses for the booking funnel landing pages
+DEPARTMENT_LIST_CACHE_KEY = "mm_public_departments"
+MEETING_TYPES_CACHE_KEY = "mm_public_meeting_types"
+
+
+def clear_public_booking_cache():
+	"""Drop cached public booking lookups
+
+	Called when a department or meeting type is saved or deleted, since
+	slugs, activation flags or display fields may have changed.
+	"""
+	frappe.cache().delete_key(WIZARD_SLUG_CACHE_KEY)
+	frappe.cache().delete_key(DEPARTMENT_LIST_CACHE_KEY)
+	frappe.cache().delete_key(MEETING_TYPES_CACHE_KEY)
+
+
+def cached_roles():
+	"""Request-scoped role set for the session user
+
+	Returns:
+		frozenset: Roles of frappe.session.user; membership tests are O(1)
+		versus a scan of the list frappe.get_roles() returns
+	"""
+	cache = getattr(frappe.local, "_mm_roles_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_roles_cache = {}
+	user = frappe.session.user
+	roles = cache.get(user)
+	if roles is None:
+		roles = cache[user] = frozenset(frappe.get_roles())
+	return roles
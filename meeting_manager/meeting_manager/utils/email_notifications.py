@@ -4,15 +4,120 @@ from frappe.utils import get_datetime, format_datetime
 
 
 def check_email_configured():
-	"""Check if outgoing email is configured in Frappe"""
+	"""Check if outgoing email is configured in Frappe
+
+	The result is cached on frappe.local since a single request (e.g. a
+	reschedule) can trigger several notification emails, and the answer
+	cannot change mid-request.
+
+	Returns:
+		tuple: (is_configured, error_message)
+	"""
+	cached = getattr(frappe.local, "_mm_email_cfg", None)
+	if cached is not None:
+		return cached
+
 	try:
-		email_account = frappe.get_doc("Email Account", frappe.get_value("Email Account", {"default_outgoing": 1}))
-		if email_account:
-			return True, None
+		# get_value alone verifies an account exists; loading the full
+		# document added nothing but an extra query
+		if frappe.get_value("Email Account", {"default_outgoing": 1}):
+			result = (True, None)
+		else:
+			result = (False, "No default outgoing email account configured")
 	except Exception as e:
-		return False, str(e)
+		result = (False, str(e))
+
+	frappe.local._mm_email_cfg = result
+	return result
+
+
+def _load_assigned_users(booking):
+	"""Resolve the booking's assignees to name/email dicts in one query
+
+	Loading each assignee via frappe.get_doc("User", ...) pulled the full
+	User document (plus child tables) per assignee; one filtered get_all
+	fetches just the two fields the templates need.
+
+	Args:
+		booking: MM Meeting Booking document
+
+	Returns:
+		list[dict]: [{"full_name": ..., "email": ...}, ...]
+	"""
+	user_ids = [a.user for a in booking.assigned_users if a.user]
+	if not user_ids:
+		return []
+
+	users = frappe.get_all(
+		"User",
+		filters={"name": ["in", user_ids]},
+		fields=["name", "full_name", "email"]
+	)
+	by_name = {u.name: u for u in users}
+
+	# Preserve child-table order
+	return [
+		{"full_name": by_name[uid].full_name, "email": by_name[uid].email}
+		for uid in user_ids if uid in by_name
+	]
+
+
+def _load_email_context(booking_id):
+	"""Load the booking plus the shared template context in one place
+
+	All three send_* functions need the same documents and base context;
+	building them here keeps the batched fetches uniform and gives any
+	future memoization a single seam instead of three copies.
+
+	Args:
+		booking_id: Name of the MM Meeting Booking document
+
+	Returns:
+		tuple: (booking, meeting_type, department, assigned_users, base_context)
+	"""
+	booking = frappe.get_doc("MM Meeting Booking", booking_id)
+	# The templates only read a handful of scalar fields, so fetch those
+	# directly instead of loading full documents (child tables, hooks)
+	meeting_type = frappe.db.get_value(
+		"MM Meeting Type", booking.meeting_type,
+		["name", "meeting_name", "meeting_slug", "duration", "location_type", "video_platform", "department"],
+		as_dict=True
+	)
+	# Department is linked through meeting_type, not directly on booking
+	department = frappe.db.get_value(
+		"MM Department", meeting_type.department,
+		["name", "department_name", "department_slug", "timezone"],
+		as_dict=True
+	)
+
+	# Get assigned users (single batched query)
+	assigned_users = _load_assigned_users(booking)
+
+	base_context = {
+		"booking": booking,
+		"meeting_type": meeting_type,
+		"department": department,
+		"assigned_users": assigned_users,
+		"formatted_start": format_datetime(booking.start_datetime, "EEE, MMM dd, yyyy 'at' hh:mm a"),
+		"formatted_end": format_datetime(booking.end_datetime, "hh:mm a"),
+		"site_url": frappe.utils.get_url(),
+	}
+
+	return booking, meeting_type, department, assigned_users, base_context
+
+
+# Compiled Jinja templates, keyed by path - resolved once per worker so the
+# hot send path skips the template path resolution on every call
+_template_cache = {}
+
+
+def _get_template(path):
+	tpl = _template_cache.get(path)
+	if tpl is None:
+		tpl = _template_cache[path] = frappe.get_template(path)
+	return tpl
+
 
-	return False, "No default outgoing email account configured"
 
 
 def send_booking_confirmation_email(booking_id):
@@ -36,54 +141,33 @@ def send_booking_confirmation_email(booking_id):
 				"error": error_msg
 			}
 
-		# Get booking details
-		booking = frappe.get_doc("MM Meeting Booking", booking_id)
-		meeting_type = frappe.get_doc("MM Meeting Type", booking.meeting_type)
-		# Department is linked through meeting_type, not directly on booking
-		department = frappe.get_doc("MM Department", meeting_type.department)
-
-		# Get assigned users
-		assigned_users = []
-		for assignment in booking.assigned_users:
-			user = frappe.get_doc("User", assignment.user)
-			assigned_users.append({
-				"full_name": user.full_name,
-				"email": user.email
-			})
-
-		# Prepare context for templates
-		context = {
-			"booking": booking,
-			"meeting_type": meeting_type,
-			"department": department,
-			"assigned_users": assigned_users,
-			"formatted_start": format_datetime(booking.start_datetime, "EEE, MMM dd, yyyy 'at' hh:mm a"),
-			"formatted_end": format_datetime(booking.end_datetime, "hh:mm a"),
-			"site_url": frappe.utils.get_url(),
-			"cancel_url": f"{frappe.utils.get_url()}/cancel-booking?token={booking.cancel_token}",
-			"reschedule_url": f"{frappe.utils.get_url()}/reschedule-booking?token={booking.reschedule_token}"
-		}
+		# Load the booking and shared template context
+		booking, meeting_type, department, assigned_users, context = _load_email_context(booking_id)
+
+		# Add the confirmation-specific action links
+		context.update({
+			"cancel_url": f"{context['site_url']}/cancel-booking?token={booking.cancel_token}",
+			"reschedule_url": f"{context['site_url']}/reschedule-booking?token={booking.reschedule_token}"
+		})
 
 		# Send customer confirmation email
 		customer_email_sent = False
 		if booking.customer_email:
 			try:
 				customer_subject = f"Booking Confirmed: {meeting_type.meeting_name} - {booking.booking_reference}"
-				customer_message = frappe.render_template(
-					"meeting_manager/templates/emails/booking_confirmation_customer.html",
-					context
-				)
+				customer_message = _get_template(
+					"meeting_manager/templates/emails/booking_confirmation_customer.html"
+				).render(context)
 
 				frappe.sendmail(
 					recipients=[booking.customer_email],
 					subject=customer_subject,
 					message=customer_message,
 					reference_doctype="MM Meeting Booking",
-					reference_name=booking.name,
-					now=True  # Send immediately
+					reference_name=booking.name
 				)
 				customer_email_sent = True
-				frappe.logger().info(f"Customer confirmation email sent to {booking.customer_email}")
+				frappe.logger().info(f"Customer confirmation email queued for {booking.customer_email}")
 			except Exception as e:
 				frappe.log_error(
 					f"Failed to send customer confirmation email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
@@ -91,31 +175,31 @@ def send_booking_confirmation_email(booking_id):
 				)
 
 		# Send team member notification emails
+		# The message is identical for every team member, so issue a single
+		# batched sendmail instead of one synchronous SMTP call per recipient
 		team_emails_sent = 0
-		for user in assigned_users:
-			if user["email"]:
-				try:
-					team_subject = f"New Meeting Assignment: {meeting_type.meeting_name} - {booking.booking_reference}"
-					team_message = frappe.render_template(
-						"meeting_manager/templates/emails/booking_confirmation_team.html",
-						context
-					)
-
-					frappe.sendmail(
-						recipients=[user["email"]],
-						subject=team_subject,
-						message=team_message,
-						reference_doctype="MM Meeting Booking",
-						reference_name=booking.name,
-						now=True  # Send immediately
-					)
-					team_emails_sent += 1
-					frappe.logger().info(f"Team member notification email sent to {user['email']}")
-				except Exception as e:
-					frappe.log_error(
-						f"Failed to send team notification email to {user['email']} for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
-						"Team Email Error"
-					)
+		team_recipients = [user["email"] for user in assigned_users if user["email"]]
+		if team_recipients:
+			try:
+				team_subject = f"New Meeting Assignment: {meeting_type.meeting_name} - {booking.booking_reference}"
+				team_message = _get_template(
+					"meeting_manager/templates/emails/booking_confirmation_team.html"
+				).render(context)
+
+				frappe.sendmail(
+					recipients=team_recipients,
+					subject=team_subject,
+					message=team_message,
+					reference_doctype="MM Meeting Booking",
+					reference_name=booking.name
+				)
+				team_emails_sent = len(team_recipients)
+				frappe.logger().info(f"Team member notification email queued for {', '.join(team_recipients)}")
+			except Exception as e:
+				frappe.log_error(
+					f"Failed to send team notification email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
+					"Team Email Error"
+				)
 
 		# Return success status
 		return {
@@ -163,60 +247,38 @@ def send_reschedule_confirmation_email(booking_id, old_datetime_dict, new_dateti
 				"error": error_msg
 			}
 
-		# Get booking details
-		booking = frappe.get_doc("MM Meeting Booking", booking_id)
-		meeting_type = frappe.get_doc("MM Meeting Type", booking.meeting_type)
-		# Department is linked through meeting_type, not directly on booking
-		department = frappe.get_doc("MM Department", meeting_type.department)
-
-		# Get assigned users
-		assigned_users = []
-		for assignment in booking.assigned_users:
-			user = frappe.get_doc("User", assignment.user)
-			assigned_users.append({
-				"full_name": user.full_name,
-				"email": user.email
-			})
-
-		# Prepare context for templates
-		context = {
-			"booking": booking,
-			"meeting_type": meeting_type,
-			"department": department,
-			"assigned_users": assigned_users,
-			"formatted_start": format_datetime(booking.start_datetime, "EEE, MMM dd, yyyy 'at' hh:mm a"),
-			"formatted_end": format_datetime(booking.end_datetime, "hh:mm a"),
-			"site_url": frappe.utils.get_url(),
-			"cancel_url": f"{frappe.utils.get_url()}/cancel-booking?token={booking.cancel_token}",
-			"reschedule_url": f"{frappe.utils.get_url()}/reschedule-booking?token={booking.reschedule_token}",
-			# Reschedule-specific data
+		# Load the booking and shared template context
+		booking, meeting_type, department, assigned_users, context = _load_email_context(booking_id)
+
+		# Add the action links and reschedule-specific data
+		context.update({
+			"cancel_url": f"{context['site_url']}/cancel-booking?token={booking.cancel_token}",
+			"reschedule_url": f"{context['site_url']}/reschedule-booking?token={booking.reschedule_token}",
 			"old_datetime": old_datetime_dict,
 			"new_datetime": new_datetime_dict,
 			"member_changed": member_changed,
 			"old_assigned_to": old_assigned_to,
 			"new_assigned_to": new_assigned_to
-		}
+		})
 
 		# Send customer reschedule confirmation email
 		customer_email_sent = False
 		if booking.customer_email:
 			try:
 				customer_subject = f"Booking Rescheduled: {meeting_type.meeting_name} - {booking.booking_reference}"
-				customer_message = frappe.render_template(
-					"meeting_manager/templates/emails/booking_reschedule_confirmation.html",
-					context
-				)
+				customer_message = _get_template(
+					"meeting_manager/templates/emails/booking_reschedule_confirmation.html"
+				).render(context)
 
 				frappe.sendmail(
 					recipients=[booking.customer_email],
 					subject=customer_subject,
 					message=customer_message,
 					reference_doctype="MM Meeting Booking",
-					reference_name=booking.name,
-					now=True  # Send immediately
+					reference_name=booking.name
 				)
 				customer_email_sent = True
-				frappe.logger().info(f"Customer reschedule confirmation email sent to {booking.customer_email}")
+				frappe.logger().info(f"Customer reschedule confirmation email queued for {booking.customer_email}")
 			except Exception as e:
 				frappe.log_error(
 					f"Failed to send customer reschedule confirmation email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
@@ -224,32 +286,31 @@ def send_reschedule_confirmation_email(booking_id, old_datetime_dict, new_dateti
 				)
 
 		# Send team member notification emails about reschedule
+		# Same message for every team member - one batched sendmail call
 		team_emails_sent = 0
-		for user in assigned_users:
-			if user["email"]:
-				try:
-					team_subject = f"Meeting Rescheduled: {meeting_type.meeting_name} - {booking.booking_reference}"
-					# Use the same template for team members
-					team_message = frappe.render_template(
-						"meeting_manager/templates/emails/booking_reschedule_confirmation.html",
-						context
-					)
-
-					frappe.sendmail(
-						recipients=[user["email"]],
-						subject=team_subject,
-						message=team_message,
-						reference_doctype="MM Meeting Booking",
-						reference_name=booking.name,
-						now=True  # Send immediately
-					)
-					team_emails_sent += 1
-					frappe.logger().info(f"Team member reschedule notification email sent to {user['email']}")
-				except Exception as e:
-					frappe.log_error(
-						f"Failed to send team reschedule notification email to {user['email']} for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
-						"Team Reschedule Email Error"
-					)
+		team_recipients = [user["email"] for user in assigned_users if user["email"]]
+		if team_recipients:
+			try:
+				team_subject = f"Meeting Rescheduled: {meeting_type.meeting_name} - {booking.booking_reference}"
+				# Use the same template for team members
+				team_message = _get_template(
+					"meeting_manager/templates/emails/booking_reschedule_confirmation.html"
+				).render(context)
+
+				frappe.sendmail(
+					recipients=team_recipients,
+					subject=team_subject,
+					message=team_message,
+					reference_doctype="MM Meeting Booking",
+					reference_name=booking.name
+				)
+				team_emails_sent = len(team_recipients)
+				frappe.logger().info(f"Team member reschedule notification email queued for {', '.join(team_recipients)}")
+			except Exception as e:
+				frappe.log_error(
+					f"Failed to send team reschedule notification email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
+					"Team Reschedule Email Error"
+				)
 
 		# Return success status
 		return {
@@ -292,53 +353,30 @@ def send_cancellation_email(booking_id):
 				"error": error_msg
 			}
 
-		# Get booking details
-		booking = frappe.get_doc("MM Meeting Booking", booking_id)
-		meeting_type = frappe.get_doc("MM Meeting Type", booking.meeting_type)
-		# Department is linked through meeting_type, not directly on booking
-		department = frappe.get_doc("MM Department", meeting_type.department)
-
-		# Get assigned users
-		assigned_users = []
-		for assignment in booking.assigned_users:
-			user = frappe.get_doc("User", assignment.user)
-			assigned_users.append({
-				"full_name": user.full_name,
-				"email": user.email
-			})
-
-		# Prepare context for templates
-		context = {
-			"booking": booking,
-			"meeting_type": meeting_type,
-			"department": department,
-			"assigned_users": assigned_users,
-			"formatted_start": format_datetime(booking.start_datetime, "EEE, MMM dd, yyyy 'at' hh:mm a"),
-			"formatted_end": format_datetime(booking.end_datetime, "hh:mm a"),
-			"site_url": frappe.utils.get_url(),
-			"rebook_url": f"{frappe.utils.get_url()}/meeting-booking/{department.department_slug}"
-		}
+		# Load the booking and shared template context
+		booking, meeting_type, department, assigned_users, context = _load_email_context(booking_id)
+
+		# Add the cancellation-specific rebook link
+		context["rebook_url"] = f"{context['site_url']}/meeting-booking/{department.department_slug}"
 
 		# Send cancellation email to customer
 		customer_email_sent = False
 		if booking.customer_email:
 			try:
 				customer_subject = f"Booking Cancelled: {meeting_type.meeting_name} - {booking.booking_reference}"
-				customer_message = frappe.render_template(
-					"meeting_manager/templates/emails/booking_cancellation.html",
-					context
-				)
+				customer_message = _get_template(
+					"meeting_manager/templates/emails/booking_cancellation.html"
+				).render(context)
 
 				frappe.sendmail(
 					recipients=[booking.customer_email],
 					subject=customer_subject,
 					message=customer_message,
 					reference_doctype="MM Meeting Booking",
-					reference_name=booking.name,
-					now=True  # Send immediately
+					reference_name=booking.name
 				)
 				customer_email_sent = True
-				frappe.logger().info(f"Customer cancellation email sent to {booking.customer_email}")
+				frappe.logger().info(f"Customer cancellation email queued for {booking.customer_email}")
 			except Exception as e:
 				frappe.log_error(
 					f"Failed to send customer cancellation email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
@@ -346,31 +384,31 @@ def send_cancellation_email(booking_id):
 				)
 
 		# Send cancellation notification to team members
+		# The team variant only differs by the is_team_member flag; render it
+		# once and send to all team recipients in a single batched call
 		team_emails_sent = 0
-		for user in assigned_users:
-			if user["email"]:
-				try:
-					team_subject = f"Meeting Cancelled: {meeting_type.meeting_name} - {booking.booking_reference}"
-					team_message = frappe.render_template(
-						"meeting_manager/templates/emails/booking_cancellation.html",
-						{**context, "is_team_member": True}
-					)
-
-					frappe.sendmail(
-						recipients=[user["email"]],
-						subject=team_subject,
-						message=team_message,
-						reference_doctype="MM Meeting Booking",
-						reference_name=booking.name,
-						now=True  # Send immediately
-					)
-					team_emails_sent += 1
-					frappe.logger().info(f"Team member cancellation email sent to {user['email']}")
-				except Exception as e:
-					frappe.log_error(
-						f"Failed to send team cancellation email to {user['email']} for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
-						"Team Cancellation Email Error"
-					)
+		team_recipients = [user["email"] for user in assigned_users if user["email"]]
+		if team_recipients:
+			try:
+				team_subject = f"Meeting Cancelled: {meeting_type.meeting_name} - {booking.booking_reference}"
+				team_message = _get_template(
+					"meeting_manager/templates/emails/booking_cancellation.html"
+				).render({**context, "is_team_member": True})
+
+				frappe.sendmail(
+					recipients=team_recipients,
+					subject=team_subject,
+					message=team_message,
+					reference_doctype="MM Meeting Booking",
+					reference_name=booking.name
+				)
+				team_emails_sent = len(team_recipients)
+				frappe.logger().info(f"Team member cancellation email queued for {', '.join(team_recipients)}")
+			except Exception as e:
+				frappe.log_error(
+					f"Failed to send team cancellation email for booking {booking_id}: {str(e)}\n{frappe.get_traceback()}",
+					"Team Cancellation Email Error"
+				)
 
 		# Return success status
 		return {
@@ -30,28 +30,36 @@ def has_app_permission(user=None):
 	if user == "Guest":
 		return False
 
-	# Get user roles
-	roles = frappe.get_roles(user)
-
-	# System Managers always have access
-	if "System Manager" in roles:
+	# Administrator always has access - skip the role fetch entirely for
+	# the single most frequent caller
+	if user == "Administrator":
 		return True
 
-	# Department Leaders have access
-	if "Department Leader" in roles:
-		return True
+	# This hook fires on every desk page load, sometimes more than once per
+	# request - memoize the answer on frappe.local so repeat checks for the
+	# same user hit memory instead of the database
+	cache = getattr(frappe.local, "_mm_app_perm_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_app_perm_cache = {}
+	if user in cache:
+		return cache[user]
 
-	# Check if user is a member of any department
-	is_member = frappe.db.exists(
-		"MM Department Member",
-		{
-			"member": user,
-			"is_active": 1
-		}
-	)
+	# Get user roles as a set: one O(1) intersection covers both role
+	# checks instead of two linear scans of the list get_roles returns
+	roles = set(frappe.get_roles(user))
 
-	if is_member:
-		return True
+	# System Managers and Department Leaders always have access; otherwise
+	# check if user is an active member of any department
+	# The membership lookup uses cache=True so repeat checks across requests
+	# resolve from Frappe's Redis-backed value cache; the (member, is_active)
+	# index added by the add_department_member_index patch keeps cold lookups
+	# off a table scan
+	has_access = bool(
+		roles & {"System Manager", "Department Leader"}
+		or frappe.db.get_value(
+			"MM Department Member", {"member": user, "is_active": 1}, "name", cache=True
+		)
+	)
 
-	# No access
-	return False
+	cache[user] = has_access
+	return has_access
@@ -10,8 +10,21 @@ and display formatting for the Meeting Manager system.
 
 import frappe
 from frappe.utils import get_datetime, now_datetime
-from datetime import datetime
-import pytz
+from datetime import datetime, timedelta, timezone as _utc_tz
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+@lru_cache(maxsize=512)
+def _tz(name):
+	"""Cached ZoneInfo lookup
+
+	The handful of zones a site actually uses are requested constantly
+	while rendering slots, so memoize the tzinfo objects. zoneinfo skips
+	pytz's localize/normalize dance entirely: naive datetimes just get
+	tzinfo attached and astimezone handles DST natively.
+	"""
+	return ZoneInfo(name)
 
 
 def get_department_timezone(department):
@@ -24,8 +37,15 @@ def get_department_timezone(department):
 	Returns:
 		str: Timezone string (e.g., "Europe/Copenhagen")
 	"""
-	timezone = frappe.get_value("MM Department", department, "timezone")
-	return timezone or "UTC"
+	# Rendering a day of slots asks for the same department repeatedly -
+	# memoize per request on frappe.local
+	cache = getattr(frappe.local, "_mm_tz_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_tz_cache = {}
+	key = ("dept", department)
+	if key not in cache:
+		cache[key] = frappe.get_value("MM Department", department, "timezone") or "UTC"
+	return cache[key]
 
 
 def get_user_timezone(user):
@@ -38,14 +58,26 @@ def get_user_timezone(user):
 	Returns:
 		str: Timezone string (e.g., "Europe/Copenhagen")
 	"""
-	# Try to get from MM User Settings first
-	timezone = frappe.get_value("MM User Settings", {"user": user}, "timezone")
-
-	if not timezone:
-		# Fall back to Frappe user timezone
-		timezone = frappe.get_value("User", user, "time_zone")
-
-	return timezone or "UTC"
+	cache = getattr(frappe.local, "_mm_tz_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_tz_cache = {}
+	key = ("user", user)
+	if key in cache:
+		return cache[key]
+
+	# MM User Settings takes priority, falling back to the Frappe user
+	# timezone - one joined query instead of two sequential get_values
+	rows = frappe.db.sql(
+		"""SELECT COALESCE(NULLIF(us.timezone, ''), u.time_zone)
+		FROM `tabUser` u
+		LEFT JOIN `tabMM User Settings` us ON us.user = u.name
+		WHERE u.name = %s""",
+		(user,)
+	)
+	timezone = rows[0][0] if rows else None
+
+	cache[key] = timezone or "UTC"
+	return cache[key]
 
 
 def convert_to_timezone(dt, from_tz, to_tz):
@@ -63,18 +95,11 @@ def convert_to_timezone(dt, from_tz, to_tz):
 	if isinstance(dt, str):
 		dt = get_datetime(dt)
 
-	# Get timezone objects
-	from_timezone = pytz.timezone(from_tz)
-	to_timezone = pytz.timezone(to_tz)
-
-	# Localize to source timezone if naive
+	# Attach the source timezone if naive, then convert
 	if dt.tzinfo is None:
-		dt = from_timezone.localize(dt)
-	else:
-		dt = dt.astimezone(from_timezone)
+		dt = dt.replace(tzinfo=_tz(from_tz))
 
-	# Convert to target timezone
-	return dt.astimezone(to_timezone)
+	return dt.astimezone(_tz(to_tz))
 
 
 def convert_to_utc(dt, source_tz):
@@ -120,16 +145,27 @@ def format_datetime_with_timezone(dt, tz, format_string="%Y-%m-%d %H:%M %Z"):
 	if isinstance(dt, str):
 		dt = get_datetime(dt)
 
-	timezone = pytz.timezone(tz)
-
-	if dt.tzinfo is None:
-		dt = timezone.localize(dt)
-	else:
-		dt = dt.astimezone(timezone)
+	zone = _tz(tz)
+	dt = dt.replace(tzinfo=zone) if dt.tzinfo is None else dt.astimezone(zone)
 
 	return dt.strftime(format_string)
 
 
+@lru_cache(maxsize=4096)
+def _offset_at(tz, year, month, day, hour):
+	"""Cached offset string for a zone at hour granularity
+
+	Offsets change at most a handful of times a year per zone, so keying
+	on (tz, year, month, day, hour) turns the repeated lookups a slot grid
+	makes into dict hits. Hour granularity is exact except within a
+	transition hour, where a fresh computation for that hour is cached too.
+	"""
+	localized_dt = datetime(year, month, day, hour, tzinfo=_tz(tz))
+	offset = localized_dt.strftime("%z")
+	# Format as +HH:MM
+	return f"{offset[:3]}:{offset[3:]}"
+
+
 def get_timezone_offset(tz, dt=None):
 	"""
 	Get the UTC offset for a timezone at a specific datetime
@@ -144,17 +180,16 @@ def get_timezone_offset(tz, dt=None):
 	if dt is None:
 		dt = now_datetime()
 
-	timezone = pytz.timezone(tz)
-	localized_dt = timezone.localize(dt) if dt.tzinfo is None else dt.astimezone(timezone)
+	if dt.tzinfo is not None:
+		dt = dt.astimezone(_tz(tz))
 
-	offset = localized_dt.strftime("%z")
-	# Format as +HH:MM
-	return f"{offset[:3]}:{offset[3:]}"
+	return _offset_at(tz, dt.year, dt.month, dt.day, dt.hour)
 
 
+@lru_cache(maxsize=512)
 def validate_timezone(tz):
 	"""
-	Validate if a timezone string is valid
+	Validate if a timezone string is valid (cached; the check is pure)
 
 	Args:
 		tz (str): Timezone string
@@ -163,20 +198,33 @@ def validate_timezone(tz):
 		bool: True if valid, False otherwise
 	"""
 	try:
-		pytz.timezone(tz)
+		_tz(tz)
 		return True
-	except pytz.UnknownTimeZoneError:
+	except (ZoneInfoNotFoundError, ValueError, TypeError):
 		return False
 
 
+@lru_cache(maxsize=1)
 def get_common_timezones():
 	"""
 	Get list of common timezones for selection
 
+	Built from the OS tzdata instead of pytz's bundled list, which was
+	this module's last pytz use and cost a full zone-map read on worker
+	start. available_timezones() scans the tzdata directory, so the
+	result is computed once and cached. Legacy aliases (bare
+	three-letter zones, Etc/ offsets) are filtered out to keep the
+	selection list close to pytz's common_timezones.
+
 	Returns:
-		list: List of timezone strings
+		list: Sorted list of timezone strings
 	"""
-	return pytz.common_timezones
+	from zoneinfo import available_timezones
+
+	return sorted(
+		name for name in available_timezones()
+		if ("/" in name and not name.startswith("Etc/")) or name == "UTC"
+	)
 
 
 def detect_visitor_timezone(request=None):
@@ -229,19 +277,28 @@ def format_time_slot_display(start_time, end_time, timezone, visitor_timezone=No
 		end_time = dt.combine(dt.today(), end_time)
 
 	# Format in meeting timezone
-	meeting_tz = pytz.timezone(timezone)
-	start_local = start_time.astimezone(meeting_tz) if start_time.tzinfo else meeting_tz.localize(start_time)
-	end_local = end_time.astimezone(meeting_tz) if end_time.tzinfo else meeting_tz.localize(end_time)
-
-	meeting_time_str = f"{start_local.strftime('%H:%M')} - {end_local.strftime('%H:%M')} {timezone}"
+	meeting_tz = _tz(timezone)
+	start_local = start_time.astimezone(meeting_tz) if start_time.tzinfo else start_time.replace(tzinfo=meeting_tz)
+	end_local = end_time.astimezone(meeting_tz) if end_time.tzinfo else end_time.replace(tzinfo=meeting_tz)
+
+	# Format hour/minute directly - strftime goes through locale table
+	# dispatch for what is a pair of zero-padded ints, and this runs four
+	# times per slot when both timezones are shown
+	meeting_time_str = (
+		f"{start_local.hour:02d}:{start_local.minute:02d} - "
+		f"{end_local.hour:02d}:{end_local.minute:02d} {timezone}"
+	)
 
 	# If visitor timezone is different, show both
 	if visitor_timezone and visitor_timezone != timezone:
-		visitor_tz = pytz.timezone(visitor_timezone)
+		visitor_tz = _tz(visitor_timezone)
 		start_visitor = start_time.astimezone(visitor_tz) if start_time.tzinfo else convert_to_timezone(start_time, timezone, visitor_timezone)
 		end_visitor = end_time.astimezone(visitor_tz) if end_time.tzinfo else convert_to_timezone(end_time, timezone, visitor_timezone)
 
-		visitor_time_str = f"{start_visitor.strftime('%H:%M')} - {end_visitor.strftime('%H:%M')} {visitor_timezone}"
+		visitor_time_str = (
+			f"{start_visitor.hour:02d}:{start_visitor.minute:02d} - "
+			f"{end_visitor.hour:02d}:{end_visitor.minute:02d} {visitor_timezone}"
+		)
 		return f"{meeting_time_str} ({visitor_time_str} your time)"
 
 	return meeting_time_str
@@ -258,18 +315,19 @@ def is_dst_transition(dt, tz):
 	Returns:
 		bool: True if during DST transition
 	"""
-	timezone = pytz.timezone(tz)
+	zone = _tz(tz)
+	naive = dt.replace(tzinfo=None) if dt.tzinfo else dt
 
-	try:
-		timezone.localize(dt)
-		return False
-	except pytz.AmbiguousTimeError:
-		# Time occurs twice (fall back)
-		return True
-	except pytz.NonExistentTimeError:
-		# Time doesn't exist (spring forward)
+	# Time occurs twice (fall back): the two folds resolve to different
+	# UTC offsets
+	if naive.replace(tzinfo=zone, fold=0).utcoffset() != naive.replace(tzinfo=zone, fold=1).utcoffset():
 		return True
 
+	# Time doesn't exist (spring forward): a round-trip through UTC lands
+	# on a different wall-clock time
+	roundtrip = naive.replace(tzinfo=zone).astimezone(_utc_tz.utc).astimezone(zone)
+	return roundtrip.replace(tzinfo=None) != naive
+
 
 def get_next_occurrence_in_timezone(time_str, tz, from_datetime=None):
 	"""
@@ -286,8 +344,8 @@ def get_next_occurrence_in_timezone(time_str, tz, from_datetime=None):
 	if from_datetime is None:
 		from_datetime = now_datetime()
 
-	timezone = pytz.timezone(tz)
-	local_dt = from_datetime.astimezone(timezone) if from_datetime.tzinfo else timezone.localize(from_datetime)
+	zone = _tz(tz)
+	local_dt = from_datetime.astimezone(zone) if from_datetime.tzinfo else from_datetime.replace(tzinfo=zone)
 
 	# Parse time
 	hour, minute = map(int, time_str.split(":"))
@@ -295,8 +353,11 @@ def get_next_occurrence_in_timezone(time_str, tz, from_datetime=None):
 	# Create datetime with the target time
 	target_dt = local_dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
-	# If target time has passed today, move to tomorrow
+	# If target time has passed today, move to tomorrow. timedelta
+	# arithmetic rolls over month and year boundaries (replace(day=day+1)
+	# raised ValueError on the last day of a month), and zoneinfo resolves
+	# any DST shift via fold when the result is read back.
 	if target_dt <= local_dt:
-		target_dt = target_dt.replace(day=target_dt.day + 1)
+		target_dt = target_dt + timedelta(days=1)
 
 	return target_dt
@@ -10,11 +10,35 @@ detecting scheduling conflicts, and validating booking requests.
 
 import frappe
 from frappe.utils import getdate, get_time, get_datetime, add_to_date, now_datetime
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta, time
+from email.utils import parseaddr
 import json
 
+from meeting_manager.meeting_manager.utils.caching import get_cached_working_hours
 
-def check_member_availability(member, scheduled_date, scheduled_start_time, duration_minutes, exclude_booking=None):
+
+def is_valid_email(value):
+	"""Validate an email address using the stdlib parser
+
+	Cheaper and more robust than the hand-rolled regex the validators used
+	to compile per save.
+
+	Args:
+		value (str): Email address to check
+
+	Returns:
+		bool: True if the address parses cleanly and has a dotted domain
+	"""
+	if not value:
+		return False
+
+	addr = parseaddr(value)[1]
+	return '@' in addr and '.' in addr.rsplit('@', 1)[-1] and addr == value
+
+
+def check_member_availability(member, scheduled_date, scheduled_start_time, duration_minutes, exclude_booking=None, fast_fail=False):
 	"""
 	Check if a member is available at the specified date/time
 
@@ -24,6 +48,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 		scheduled_start_time (time or str): Start time of the booking
 		duration_minutes (int): Duration of the meeting in minutes
 		exclude_booking (str, optional): Booking ID to exclude from conflict check (for updates)
+		fast_fail (bool): Return on the first conflict instead of running
+			all checks; slot grids only need a yes/no, while the booking
+			validator wants the full conflict list for its error message
 
 	Returns:
 		dict: {
@@ -51,6 +78,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 			"message": working_hours_check["reason"]
 		})
 
+	if conflicts and fast_fail:
+		return {"available": False, "conflicts": conflicts, "reason": conflicts[0]["message"]}
+
 	# 2. Check date overrides (vacations, special availability)
 	date_override_check = check_date_overrides(member, scheduled_date, scheduled_start_time, scheduled_end_time)
 	if not date_override_check["available"]:
@@ -59,6 +89,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 			"message": date_override_check["reason"]
 		})
 
+	if conflicts and fast_fail:
+		return {"available": False, "conflicts": conflicts, "reason": conflicts[0]["message"]}
+
 	# 3. Check existing bookings
 	booking_conflicts = check_booking_conflicts(member, scheduled_date, scheduled_start_time, scheduled_end_time, exclude_booking)
 	if booking_conflicts:
@@ -68,6 +101,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 			"message": conflict["message"]
 		} for conflict in booking_conflicts])
 
+	if conflicts and fast_fail:
+		return {"available": False, "conflicts": conflicts, "reason": conflicts[0]["message"]}
+
 	# 4. Check synced calendar events
 	calendar_conflicts = check_calendar_event_conflicts(member, start_datetime, end_datetime)
 	if calendar_conflicts:
@@ -77,6 +113,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 			"message": conflict["message"]
 		} for conflict in calendar_conflicts])
 
+	if conflicts and fast_fail:
+		return {"available": False, "conflicts": conflicts, "reason": conflicts[0]["message"]}
+
 	# 5. Check buffer times
 	buffer_conflicts = check_buffer_time_conflicts(member, start_datetime, end_datetime, exclude_booking)
 	if buffer_conflicts:
@@ -85,6 +124,9 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 			"message": conflict["message"]
 		} for conflict in buffer_conflicts])
 
+	if conflicts and fast_fail:
+		return {"available": False, "conflicts": conflicts, "reason": conflicts[0]["message"]}
+
 	# 6. Check availability rules (max bookings per day/week)
 	availability_rule_check = check_availability_rules(member, scheduled_date)
 	if not availability_rule_check["available"]:
@@ -100,6 +142,304 @@ def check_member_availability(member, scheduled_date, scheduled_start_time, dura
 	}
 
 
+def check_members_availability(members, scheduled_date, scheduled_start_time, duration_minutes, exclude_booking=None):
+	"""
+	Check several members against the same slot with one query per concern
+
+	check_member_availability issues six queries per member; validating a
+	team meeting that way costs 6*M roundtrips for the same slot. This
+	variant fetches each concern for all members at once and evaluates the
+	conflicts in Python, so the query count stays constant regardless of
+	team size.
+
+	Args:
+		members (list): User IDs to check
+		scheduled_date (date or str): Date of the booking
+		scheduled_start_time (time or str): Start time of the booking
+		duration_minutes (int): Duration of the meeting in minutes
+		exclude_booking (str, optional): Booking ID to exclude from conflict check
+
+	Returns:
+		dict: member -> result in check_member_availability's shape
+	"""
+	members = list(members)
+	if not members:
+		return {}
+
+	scheduled_date = getdate(scheduled_date)
+	scheduled_start_time = get_time(scheduled_start_time)
+	start_datetime = datetime.combine(scheduled_date, scheduled_start_time)
+	end_datetime = start_datetime + timedelta(minutes=duration_minutes)
+	scheduled_end_time = end_datetime.time()
+
+	exclude_condition = "AND mb.name != %(exclude_booking)s" if exclude_booking else ""
+
+	# 1. Working hours for every member
+	working_hours_map = {
+		s.user: s.working_hours_json
+		for s in frappe.get_all(
+			"MM User Settings",
+			filters={"user": ["in", members]},
+			fields=["user", "working_hours_json"]
+		)
+	}
+
+	# 2. Availability rules (default first, mirroring the limit-1 ordering
+	# of the per-member path) plus rule ownership for override mapping
+	rule_map = {}
+	rule_owner = {}
+	for row in frappe.get_all(
+		"MM User Availability Rule",
+		filters={"user": ["in", members]},
+		fields=[
+			"name", "user", "is_default", "buffer_time_before", "buffer_time_after",
+			"max_bookings_per_day", "max_bookings_per_week",
+		],
+		order_by="is_default desc"
+	):
+		rule_map.setdefault(row.user, row)
+		rule_owner[row.name] = row.user
+
+	# 3. Date overrides on the requested date for every rule
+	overrides_map = defaultdict(list)
+	if rule_owner:
+		for o in frappe.get_all(
+			"MM User Date Overrides",
+			filters={
+				"parent": ["in", list(rule_owner)],
+				"parenttype": "MM User Availability Rule",
+				"date": scheduled_date,
+			},
+			fields=["parent", "available", "custom_hours_start", "custom_hours_end", "reason"]
+		):
+			overrides_map[rule_owner[o.parent]].append(o)
+
+	# 4. The bookings touching the day for every member in one query;
+	# overlap, buffer and per-day counting all run off this list. Fetched
+	# by overlap window so a booking running past midnight from the
+	# previous evening still blocks the morning, and the range predicate
+	# can use the status/range index
+	day_start = datetime.combine(scheduled_date, time.min)
+	day_end = day_start + timedelta(days=1)
+	day_bookings_map = defaultdict(list)
+	for row in frappe.db.sql(
+		f"""SELECT DISTINCT au.user, mb.name, mb.start_datetime, mb.end_datetime
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` au
+			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+		WHERE au.user IN %(members)s
+			AND mb.start_datetime < %(day_end)s
+			AND mb.end_datetime > %(day_start)s
+			AND mb.booking_status IN ('Confirmed', 'Pending')
+			{exclude_condition}""",
+		{
+			"members": members,
+			"day_start": day_start,
+			"day_end": day_end,
+			"exclude_booking": exclude_booking,
+		},
+		as_dict=True
+	):
+		day_bookings_map[row.user].append(row)
+
+	# 5. Blocking synced calendar events overlapping the slot
+	calendar_map = defaultdict(list)
+	for row in frappe.db.sql(
+		"""SELECT ci.user, ces.event_title, ces.start_datetime, ces.end_datetime
+		FROM `tabMM Calendar Event Sync` ces
+		INNER JOIN `tabMM Calendar Integration` ci
+			ON ces.calendar_integration = ci.name
+		WHERE ci.user IN %(members)s
+			AND ces.is_blocking_availability = 1
+			AND ces.event_type != 'All-Day Event'
+			AND ces.sync_status = 'Synced'
+			AND ces.start_datetime < %(end_datetime)s
+			AND ces.end_datetime > %(start_datetime)s""",
+		{
+			"members": members,
+			"start_datetime": start_datetime,
+			"end_datetime": end_datetime,
+		},
+		as_dict=True
+	):
+		calendar_map[row.user].append(row)
+
+	# 6. Week booking counts in one grouped query (day counts come from
+	# the day-bookings list already in hand)
+	week_start = scheduled_date - timedelta(days=scheduled_date.weekday())
+	week_end = week_start + timedelta(days=6)
+	week_counts = {}
+	for row in frappe.db.sql(
+		f"""SELECT au.user, COUNT(DISTINCT mb.name) AS count
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` au
+			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+		WHERE au.user IN %(members)s
+			AND DATE(mb.start_datetime) BETWEEN %(week_start)s AND %(week_end)s
+			AND mb.booking_status IN ('Confirmed', 'Pending')
+			{exclude_condition}
+		GROUP BY au.user""",
+		{
+			"members": members,
+			"week_start": week_start,
+			"week_end": week_end,
+			"exclude_booking": exclude_booking,
+		},
+		as_dict=True
+	):
+		week_counts[row.user] = row.count
+
+	results = {}
+	for member in members:
+		conflicts = []
+
+		working_hours_check = _eval_working_hours(
+			working_hours_map.get(member), scheduled_date, scheduled_start_time, scheduled_end_time
+		)
+		if not working_hours_check["available"]:
+			conflicts.append({
+				"type": "working_hours",
+				"message": working_hours_check["reason"]
+			})
+
+		date_override_check = _eval_overrides(
+			overrides_map.get(member, ()), scheduled_start_time, scheduled_end_time
+		)
+		if not date_override_check["available"]:
+			conflicts.append({
+				"type": "date_override",
+				"message": date_override_check["reason"]
+			})
+
+		day_bookings = day_bookings_map.get(member, [])
+		for booking in day_bookings:
+			booking_start = get_datetime(booking.start_datetime)
+			booking_end = get_datetime(booking.end_datetime)
+			if booking_start < end_datetime and booking_end > start_datetime:
+				conflicts.append({
+					"type": "booking_conflict",
+					"booking_id": booking.name,
+					"message": f"Conflicts with existing booking {booking.name} ({booking_start.strftime('%H:%M')} - {booking_end.strftime('%H:%M')})"
+				})
+
+		for event in calendar_map.get(member, ()):
+			event_start = get_datetime(event.start_datetime)
+			event_end = get_datetime(event.end_datetime)
+			conflicts.append({
+				"type": "calendar_event",
+				"event_title": event.event_title or "Busy",
+				"message": f"Conflicts with calendar event: {event.event_title or 'Busy'} ({event_start.strftime('%H:%M')} - {event_end.strftime('%H:%M')})"
+			})
+
+		rule = rule_map.get(member)
+		if rule:
+			buffer_before = rule.buffer_time_before or 0
+			buffer_after = rule.buffer_time_after or 0
+			if buffer_before or buffer_after:
+				buffer_start = start_datetime - timedelta(minutes=buffer_before)
+				buffer_end = end_datetime + timedelta(minutes=buffer_after)
+				for booking in day_bookings:
+					booking_start = get_datetime(booking.start_datetime)
+					booking_end = get_datetime(booking.end_datetime)
+					if booking_end <= buffer_start or booking_start >= buffer_end:
+						continue
+					if booking_end > buffer_start and booking_end <= start_datetime:
+						conflicts.append({
+							"type": "buffer_time",
+							"message": f"Violates {buffer_before}-minute buffer before meeting (conflicts with {booking.name})"
+						})
+					elif booking_start < buffer_end and booking_start >= end_datetime:
+						conflicts.append({
+							"type": "buffer_time",
+							"message": f"Violates {buffer_after}-minute buffer after meeting (conflicts with {booking.name})"
+						})
+
+			# The day count only covers bookings starting on the date, as
+			# before - the overlap fetch may include one from the previous
+			# evening
+			day_count = sum(
+				1 for b in day_bookings
+				if get_datetime(b.start_datetime).date() == scheduled_date
+			)
+			if rule.max_bookings_per_day and day_count >= rule.max_bookings_per_day:
+				conflicts.append({
+					"type": "availability_rule",
+					"message": f"Member has reached maximum bookings per day ({rule.max_bookings_per_day})"
+				})
+
+			if rule.max_bookings_per_week and week_counts.get(member, 0) >= rule.max_bookings_per_week:
+				conflicts.append({
+					"type": "availability_rule",
+					"message": f"Member has reached maximum bookings per week ({rule.max_bookings_per_week})"
+				})
+
+		results[member] = {
+			"available": len(conflicts) == 0,
+			"conflicts": conflicts,
+			"reason": conflicts[0]["message"] if conflicts else None
+		}
+
+	return results
+
+
+
+def _load_member_profile(member):
+	"""User settings and availability rules for a member, fetched once
+
+	Each check_* helper used to issue its own settings/rule query, so one
+	slot validation hit the same two tables six times. Memoize the profile
+	on frappe.local; date overrides are fetched lazily per date and cached
+	alongside it.
+
+	Returns:
+		dict: {"working_hours_json", "rules", "rule", "overrides_by_date"}
+	"""
+	cache = getattr(frappe.local, "_mm_profile_cache", None)
+	if cache is None:
+		cache = frappe.local._mm_profile_cache = {}
+	profile = cache.get(member)
+	if profile is None:
+		working_hours_json = get_cached_working_hours(member)
+		rules = frappe.get_all(
+			"MM User Availability Rule",
+			filters={"user": member},
+			fields=[
+				"name", "is_default", "buffer_time_before", "buffer_time_after",
+				"max_bookings_per_day", "max_bookings_per_week",
+				"min_notice_hours", "max_days_advance",
+			],
+			order_by="is_default desc"
+		)
+		profile = cache[member] = {
+			"working_hours_json": working_hours_json or None,
+			"rules": rules,
+			# Primary rule: default first, mirroring the old limit-1 queries
+			"rule": rules[0] if rules else None,
+			"overrides_by_date": {},
+		}
+	return profile
+
+
+def _get_date_overrides(profile, scheduled_date):
+	"""Date-override rows for all of a member's rules, one query per date"""
+	overrides = profile["overrides_by_date"].get(scheduled_date)
+	if overrides is None:
+		rule_names = [rule.name for rule in profile["rules"]]
+		overrides = []
+		if rule_names:
+			overrides = frappe.get_all(
+				"MM User Date Overrides",
+				filters={
+					"parent": ["in", rule_names],
+					"parenttype": "MM User Availability Rule",
+					"date": scheduled_date,
+				},
+				fields=["available", "custom_hours_start", "custom_hours_end", "reason"]
+			)
+		profile["overrides_by_date"][scheduled_date] = overrides
+	return overrides
+
+
 def check_working_hours(member, scheduled_date, start_time, end_time):
 	"""
 	Check if the time falls within member's working hours
@@ -107,42 +447,66 @@ def check_working_hours(member, scheduled_date, start_time, end_time):
 	Returns:
 		dict: {"available": bool, "reason": str}
 	"""
-	# Get user settings
-	user_settings = frappe.get_value(
-		"MM User Settings",
-		{"user": member},
-		["working_hours_json"],
-		as_dict=True
-	)
+	profile = _load_member_profile(member)
+	return _eval_working_hours(profile["working_hours_json"], scheduled_date, start_time, end_time)
+
+
+_DAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
 
-	if not user_settings or not user_settings.working_hours_json:
-		# No working hours defined - assume 24/7 availability
-		return {"available": True, "reason": None}
+
+@lru_cache(maxsize=256)
+def _compile_working_hours(working_hours_json):
+	"""Compile a working_hours_json blob into a weekday lookup table
+
+	Schedules rarely change, so the JSON is parsed once per distinct blob
+	(keyed on the string itself - members sharing a schedule share the
+	entry) into a 7-tuple indexed by weekday: None for a disabled day,
+	else (start, end) time objects. Evaluating a slot is then a tuple
+	index plus two comparisons - no JSON parsing, dict lookups or string
+	parsing on the hot path.
+
+	Returns None for an empty or invalid blob, meaning 24/7 availability.
+	"""
+	if not working_hours_json:
+		return None
 
 	try:
-		working_hours = json.loads(user_settings.working_hours_json)
+		working_hours = json.loads(working_hours_json)
 	except (json.JSONDecodeError, TypeError):
 		# Invalid JSON - assume 24/7 availability
+		return None
+
+	table = []
+	for day_name in _DAY_NAMES:
+		day_config = working_hours.get(day_name, {})
+		if not day_config.get("enabled", False):
+			table.append(None)
+		else:
+			table.append((
+				get_time(day_config.get("start", "00:00")),
+				get_time(day_config.get("end", "23:59")),
+			))
+	return tuple(table)
+
+
+def _eval_working_hours(working_hours_json, scheduled_date, start_time, end_time):
+	"""Evaluate a working_hours_json blob against a slot (no DB access)"""
+	table = _compile_working_hours(working_hours_json)
+	if table is None:
+		# No working hours defined - assume 24/7 availability
 		return {"available": True, "reason": None}
 
-	# Get day of week (0 = Monday, 6 = Sunday)
-	day_of_week = scheduled_date.weekday()
-	day_names = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-	day_name = day_names[day_of_week]
-
-	day_config = working_hours.get(day_name, {})
+	# Day of week (0 = Monday, 6 = Sunday)
+	weekday = scheduled_date.weekday()
+	hours = table[weekday]
 
-	# Check if day is enabled
-	if not day_config.get("enabled", False):
+	if hours is None:
 		return {
 			"available": False,
-			"reason": f"Member is not available on {day_name.capitalize()}s"
+			"reason": f"Member is not available on {_DAY_NAMES[weekday].capitalize()}s"
 		}
 
-	# Check if time is within working hours
-	work_start = get_time(day_config.get("start", "00:00"))
-	work_end = get_time(day_config.get("end", "23:59"))
-
+	work_start, work_end = hours
 	if start_time < work_start or end_time > work_end:
 		return {
 			"available": False,
@@ -152,6 +516,29 @@ def check_working_hours(member, scheduled_date, start_time, end_time):
 	return {"available": True, "reason": None}
 
 
+def _eval_overrides(overrides, start_time, end_time):
+	"""Evaluate pre-fetched date-override rows against a slot (no DB access)"""
+	for override in overrides:
+		if not override.available:
+			return {
+				"available": False,
+				"reason": override.reason or "Member is not available on this date"
+			}
+
+		# If available with custom hours, check if time falls within custom hours
+		if override.custom_hours_start and override.custom_hours_end:
+			custom_start = get_time(override.custom_hours_start)
+			custom_end = get_time(override.custom_hours_end)
+
+			if start_time < custom_start or end_time > custom_end:
+				return {
+					"available": False,
+					"reason": f"Time is outside custom hours for this date ({custom_start.strftime('%H:%M')} - {custom_end.strftime('%H:%M')})"
+				}
+
+	return {"available": True, "reason": None}
+
+
 def check_date_overrides(member, scheduled_date, start_time, end_time):
 	"""
 	Check date-specific overrides (vacations, special availability)
@@ -159,49 +546,12 @@ def check_date_overrides(member, scheduled_date, start_time, end_time):
 	Returns:
 		dict: {"available": bool, "reason": str}
 	"""
-	# Get user's availability rules with date overrides
-	availability_rules = frappe.get_all(
-		"MM User Availability Rule",
-		filters={"user": member},
-		fields=["name", "is_default"]
-	)
-
-	if not availability_rules:
+	profile = _load_member_profile(member)
+	if not profile["rules"]:
 		return {"available": True, "reason": None}
 
-	# Check all rules for date overrides
-	for rule in availability_rules:
-		# Get date overrides for this rule
-		overrides = frappe.get_all(
-			"MM User Date Overrides",
-			filters={
-				"parent": rule.name,
-				"parenttype": "MM User Availability Rule",
-				"date": scheduled_date
-			},
-			fields=["available", "custom_hours_start", "custom_hours_end", "reason"]
-		)
-
-		for override in overrides:
-			if not override.available:
-				reason = override.reason or "Member is not available on this date"
-				return {
-					"available": False,
-					"reason": reason
-				}
-
-			# If available with custom hours, check if time falls within custom hours
-			if override.custom_hours_start and override.custom_hours_end:
-				custom_start = get_time(override.custom_hours_start)
-				custom_end = get_time(override.custom_hours_end)
-
-				if start_time < custom_start or end_time > custom_end:
-					return {
-						"available": False,
-						"reason": f"Time is outside custom hours for this date ({custom_start.strftime('%H:%M')} - {custom_end.strftime('%H:%M')})"
-					}
-
-	return {"available": True, "reason": None}
+	overrides = _get_date_overrides(profile, scheduled_date)
+	return _eval_overrides(overrides, start_time, end_time)
 
 
 def check_booking_conflicts(member, scheduled_date, start_time, end_time, exclude_booking=None):
@@ -215,39 +565,18 @@ def check_booking_conflicts(member, scheduled_date, start_time, end_time, exclud
 	scheduled_start_datetime = datetime.combine(scheduled_date, start_time)
 	scheduled_end_datetime = datetime.combine(scheduled_date, end_time)
 
-	# Query bookings where member is assigned (via child table)
-	# Use SQL query to join with child table
-	query = """
-		SELECT DISTINCT
-			mb.name,
-			mb.start_datetime,
-			mb.end_datetime,
-			mb.meeting_type
-		FROM `tabMM Meeting Booking` mb
-		INNER JOIN `tabMM Meeting Booking Assigned User` au
-			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
-		WHERE au.user = %(member)s
-			AND mb.booking_status IN ('Confirmed', 'Pending')
-			AND mb.start_datetime < %(end_datetime)s
-			AND mb.end_datetime > %(start_datetime)s
-			{exclude_condition}
-	""".format(
-		exclude_condition=f"AND mb.name != %(exclude_booking)s" if exclude_booking else ""
-	)
-
-	params = {
-		"member": member,
-		"start_datetime": scheduled_start_datetime,
-		"end_datetime": scheduled_end_datetime
-	}
+	conflicts = []
+	for booking in _get_day_bookings(member, scheduled_date):
+		if exclude_booking and booking.name == exclude_booking:
+			continue
 
-	if exclude_booking:
-		params["exclude_booking"] = exclude_booking
+		# Rows are sorted by start; nothing after this can overlap
+		if get_datetime(booking.start_datetime) >= scheduled_end_datetime:
+			break
 
-	existing_bookings = frappe.db.sql(query, params, as_dict=True)
+		if get_datetime(booking.end_datetime) <= scheduled_start_datetime:
+			continue
 
-	conflicts = []
-	for booking in existing_bookings:
 		# Convert to time for display
 		booking_start = get_datetime(booking.start_datetime).time()
 		booking_end = get_datetime(booking.end_datetime).time()
@@ -260,6 +589,135 @@ def check_booking_conflicts(member, scheduled_date, start_time, end_time, exclud
 	return conflicts
 
 
+def _get_day_bookings(member, scheduled_date):
+	"""The member's confirmed/pending bookings on a date, fetched once
+
+	Rendering a slot grid probes the same (member, date) dozens of times;
+	cache the day's rows (sorted by start) on frappe.local so each slot
+	check is an in-memory scan instead of a fresh overlap query.
+
+	Returns:
+		list: Booking rows with name, start_datetime, end_datetime,
+		meeting_type, sorted by start_datetime
+	"""
+	cache = getattr(frappe.local, "_mm_day_bookings", None)
+	if cache is None:
+		cache = frappe.local._mm_day_bookings = {}
+	key = (member, scheduled_date)
+	rows = cache.get(key)
+	if rows is None:
+		# Fetch by overlap window, not DATE(start_datetime): a booking that
+		# starts the previous evening and runs past midnight still occupies
+		# this date, and the range predicate stays sargable against the
+		# (booking_status, start_datetime, end_datetime) index where the
+		# DATE() wrapper would defeat it
+		day_start = datetime.combine(scheduled_date, time.min)
+		day_end = day_start + timedelta(days=1)
+		rows = frappe.db.sql(
+			"""SELECT DISTINCT
+				mb.name,
+				mb.start_datetime,
+				mb.end_datetime,
+				mb.meeting_type
+			FROM `tabMM Meeting Booking` mb
+			INNER JOIN `tabMM Meeting Booking Assigned User` au
+				ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+			WHERE au.user = %(member)s
+				AND mb.start_datetime < %(day_end)s
+				AND mb.end_datetime > %(day_start)s
+				AND mb.booking_status IN ('Confirmed', 'Pending')""",
+			{"member": member, "day_start": day_start, "day_end": day_end},
+			as_dict=True
+		)
+		rows.sort(key=lambda r: r.start_datetime)
+		cache[key] = rows
+	return rows
+
+
+def _get_day_calendar_events(member, scheduled_date):
+	"""Blocking synced calendar events touching a date, fetched once
+
+	Companion to _get_day_bookings with the same frappe.local memoization,
+	so bulk slot checks probe external-calendar busy blocks in memory.
+	"""
+	cache = getattr(frappe.local, "_mm_day_events", None)
+	if cache is None:
+		cache = frappe.local._mm_day_events = {}
+	key = (member, scheduled_date)
+	rows = cache.get(key)
+	if rows is None:
+		day_start = datetime.combine(scheduled_date, time.min)
+		day_end = day_start + timedelta(days=1)
+		rows = frappe.db.sql(
+			"""SELECT ces.event_title, ces.start_datetime, ces.end_datetime
+			FROM `tabMM Calendar Event Sync` ces
+			INNER JOIN `tabMM Calendar Integration` ci
+				ON ces.calendar_integration = ci.name
+			WHERE ci.user = %(member)s
+				AND ces.is_blocking_availability = 1
+				AND ces.event_type != 'All-Day Event'
+				AND ces.sync_status = 'Synced'
+				AND ces.start_datetime < %(day_end)s
+				AND ces.end_datetime > %(day_start)s""",
+			{"member": member, "day_start": day_start, "day_end": day_end},
+			as_dict=True
+		)
+		cache[key] = rows
+	return rows
+
+
+def slot_conflict_mask(member, scheduled_date, slot_starts, slot_ends, exclude_booking=None):
+	"""Booking/event/buffer conflict mask for a whole grid of slots
+
+	Calling the per-slot checks for a day view re-tests the same bookings
+	slot by slot. This computes all slots in one pass over the day's
+	bookings and blocking calendar events (each fetched once), with the
+	member's buffer windows folded into the slot bounds.
+
+	Args:
+		member (str): User ID
+		scheduled_date (date): Date of the slots
+		slot_starts (list[datetime]): Slot start datetimes
+		slot_ends (list[datetime]): Slot end datetimes
+		exclude_booking (str, optional): Booking ID to ignore
+
+	Returns:
+		list[bool]: True where the slot collides with a booking, a
+		blocking event, or a buffer window
+	"""
+	rule = _load_member_profile(member)["rule"]
+	buffer_before = ((rule.buffer_time_before or 0) if rule else 0) * 60
+	buffer_after = ((rule.buffer_time_after or 0) if rule else 0) * 60
+
+	# Compare integer epoch seconds instead of datetime objects: the
+	# overlap loop below runs slots x intervals times, and int comparisons
+	# skip the datetime C-accessor dispatch on every test. All values are
+	# naive site-local timestamps, so the epochs are mutually consistent.
+	bookings = [
+		(get_datetime(r.start_datetime).timestamp(), get_datetime(r.end_datetime).timestamp())
+		for r in _get_day_bookings(member, scheduled_date)
+		if not (exclude_booking and r.name == exclude_booking)
+	]
+	events = [
+		(get_datetime(r.start_datetime).timestamp(), get_datetime(r.end_datetime).timestamp())
+		for r in _get_day_calendar_events(member, scheduled_date)
+	]
+
+	mask = []
+	for slot_start, slot_end in zip(slot_starts, slot_ends):
+		# Buffers widen the window a booking may not touch; events block
+		# only the slot itself
+		start_ts = slot_start.timestamp()
+		end_ts = slot_end.timestamp()
+		buffer_start = start_ts - buffer_before
+		buffer_end = end_ts + buffer_after
+		conflict = any(b_start < buffer_end and b_end > buffer_start for b_start, b_end in bookings) \
+			or any(e_start < end_ts and e_end > start_ts for e_start, e_end in events)
+		mask.append(conflict)
+
+	return mask
+
+
 def check_calendar_event_conflicts(member, start_datetime, end_datetime):
 	"""
 	Check for conflicts with synced external calendar events
@@ -313,19 +771,9 @@ def check_buffer_time_conflicts(member, start_datetime, end_datetime, exclude_bo
 	Returns:
 		list: List of buffer time violations
 	"""
-	# Get user's availability rules for buffer times
-	availability_rules = frappe.get_all(
-		"MM User Availability Rule",
-		filters={"user": member},
-		fields=["buffer_time_before", "buffer_time_after", "is_default"],
-		order_by="is_default desc",
-		limit=1
-	)
-
-	if not availability_rules:
+	rule = _load_member_profile(member)["rule"]
+	if not rule:
 		return []
-
-	rule = availability_rules[0]
 	buffer_before = rule.buffer_time_before or 0
 	buffer_after = rule.buffer_time_after or 0
 
@@ -336,55 +784,33 @@ def check_buffer_time_conflicts(member, start_datetime, end_datetime, exclude_bo
 	buffer_start = start_datetime - timedelta(minutes=buffer_before)
 	buffer_end = end_datetime + timedelta(minutes=buffer_after)
 
-	# Check for bookings within buffer windows using child table join
-	# Note: assigned_to field doesn't exist on MM Meeting Booking, need to query through child table
-	query = """
-		SELECT DISTINCT
-			mb.name,
-			mb.start_datetime,
-			mb.end_datetime
-		FROM `tabMM Meeting Booking` mb
-		INNER JOIN `tabMM Meeting Booking Assigned User` au
-			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
-		WHERE au.user = %(member)s
-			AND DATE(mb.start_datetime) = %(scheduled_date)s
-			AND mb.booking_status IN ('Confirmed', 'Pending')
-			AND (
-				(mb.start_datetime >= %(buffer_start)s AND mb.start_datetime < %(buffer_end)s)
-				OR (mb.end_datetime > %(buffer_start)s AND mb.end_datetime <= %(buffer_end)s)
-			)
-			{exclude_condition}
-	""".format(
-		exclude_condition="AND mb.name != %(exclude_booking)s" if exclude_booking else ""
-	)
+	# Test the cached day bookings against the buffer windows in memory -
+	# same rows check_booking_conflicts already fetched for this date.
+	# Epoch seconds keep the inner comparisons on plain floats, and both
+	# violation sides are computed up front so the classification is a
+	# tuple index instead of a branch chain.
+	start_ts = start_datetime.timestamp()
+	end_ts = end_datetime.timestamp()
+	buffer_start_ts = buffer_start.timestamp()
+	buffer_end_ts = buffer_end.timestamp()
 
-	params = {
-		"member": member,
-		"scheduled_date": start_datetime.date(),
-		"buffer_start": buffer_start,
-		"buffer_end": buffer_end
-	}
-
-	if exclude_booking:
-		params["exclude_booking"] = exclude_booking
+	conflicts = []
+	for booking in _get_day_bookings(member, start_datetime.date()):
+		if exclude_booking and booking.name == exclude_booking:
+			continue
 
-	nearby_bookings = frappe.db.sql(query, params, as_dict=True)
+		booking_start = get_datetime(booking.start_datetime).timestamp()
+		booking_end = get_datetime(booking.end_datetime).timestamp()
 
-	conflicts = []
-	for booking in nearby_bookings:
-		booking_start = get_datetime(booking.start_datetime)
-		booking_end = get_datetime(booking.end_datetime)
+		before_violation = buffer_start_ts < booking_end <= start_ts
+		after_violation = end_ts <= booking_start < buffer_end_ts
 
-		# Check if booking violates buffer zones
-		if not (booking_end <= buffer_start or booking_start >= buffer_end):
-			if booking_end > buffer_start and booking_end <= start_datetime:
-				conflicts.append({
-					"message": f"Violates {buffer_before}-minute buffer before meeting (conflicts with {booking.name})"
-				})
-			elif booking_start < buffer_end and booking_start >= end_datetime:
-				conflicts.append({
-					"message": f"Violates {buffer_after}-minute buffer after meeting (conflicts with {booking.name})"
-				})
+		if before_violation | after_violation:
+			messages = (
+				f"Violates {buffer_before}-minute buffer before meeting (conflicts with {booking.name})",
+				f"Violates {buffer_after}-minute buffer after meeting (conflicts with {booking.name})",
+			)
+			conflicts.append({"message": messages[after_violation]})
 
 	return conflicts
 
@@ -396,65 +822,52 @@ def check_availability_rules(member, scheduled_date):
 	Returns:
 		dict: {"available": bool, "reason": str}
 	"""
-	# Get user's availability rules
-	availability_rules = frappe.get_all(
-		"MM User Availability Rule",
-		filters={"user": member},
-		fields=["max_bookings_per_day", "max_bookings_per_week", "is_default"],
-		order_by="is_default desc",
-		limit=1
-	)
+	rule = _load_member_profile(member)["rule"]
+	if not rule:
+		return {"available": True, "reason": None}
 
-	if not availability_rules:
+	if not (rule.max_bookings_per_day or rule.max_bookings_per_week):
 		return {"available": True, "reason": None}
 
-	rule = availability_rules[0]
+	# Calculate week start (Monday) and end (Sunday); a single scan of the
+	# week's bookings yields both counts via a conditional aggregate
+	week_start = scheduled_date - timedelta(days=scheduled_date.weekday())
+	week_end = week_start + timedelta(days=6)
 
-	# Check max bookings per day
-	if rule.max_bookings_per_day:
-		# Count bookings through child table
-		query = """
-			SELECT COUNT(DISTINCT mb.name) as count
-			FROM `tabMM Meeting Booking` mb
-			INNER JOIN `tabMM Meeting Booking Assigned User` au
-				ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
-			WHERE au.user = %(member)s
-				AND DATE(mb.start_datetime) = %(scheduled_date)s
-				AND mb.booking_status IN ('Confirmed', 'Pending')
-		"""
-		result = frappe.db.sql(query, {"member": member, "scheduled_date": scheduled_date}, as_dict=True)
-		day_bookings = result[0].count if result else 0
+	result = frappe.db.sql(
+		"""SELECT
+			COUNT(DISTINCT CASE WHEN DATE(mb.start_datetime) = %(scheduled_date)s THEN mb.name END) AS day_count,
+			COUNT(DISTINCT mb.name) AS week_count
+		FROM `tabMM Meeting Booking` mb
+		INNER JOIN `tabMM Meeting Booking Assigned User` au
+			ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
+		WHERE au.user = %(member)s
+			AND DATE(mb.start_datetime) BETWEEN %(week_start)s AND %(week_end)s
+			AND mb.booking_status IN ('Confirmed', 'Pending')""",
+		{
+			"member": member,
+			"scheduled_date": scheduled_date,
+			"week_start": week_start,
+			"week_end": week_end,
+		},
+		as_dict=True
+	)
+	day_bookings = (result[0].day_count or 0) if result else 0
+	week_bookings = (result[0].week_count or 0) if result else 0
 
-		if day_bookings >= rule.max_bookings_per_day:
-			return {
-				"available": False,
-				"reason": f"Member has reached maximum bookings per day ({rule.max_bookings_per_day})"
-			}
+	# Check max bookings per day
+	if rule.max_bookings_per_day and day_bookings >= rule.max_bookings_per_day:
+		return {
+			"available": False,
+			"reason": f"Member has reached maximum bookings per day ({rule.max_bookings_per_day})"
+		}
 
 	# Check max bookings per week
-	if rule.max_bookings_per_week:
-		# Calculate week start (Monday) and end (Sunday)
-		week_start = scheduled_date - timedelta(days=scheduled_date.weekday())
-		week_end = week_start + timedelta(days=6)
-
-		# Count bookings through child table
-		query = """
-			SELECT COUNT(DISTINCT mb.name) as count
-			FROM `tabMM Meeting Booking` mb
-			INNER JOIN `tabMM Meeting Booking Assigned User` au
-				ON au.parent = mb.name AND au.parenttype = 'MM Meeting Booking'
-			WHERE au.user = %(member)s
-				AND DATE(mb.start_datetime) BETWEEN %(week_start)s AND %(week_end)s
-				AND mb.booking_status IN ('Confirmed', 'Pending')
-		"""
-		result = frappe.db.sql(query, {"member": member, "week_start": week_start, "week_end": week_end}, as_dict=True)
-		week_bookings = result[0].count if result else 0
-
-		if week_bookings >= rule.max_bookings_per_week:
-			return {
-				"available": False,
-				"reason": f"Member has reached maximum bookings per week ({rule.max_bookings_per_week})"
-			}
+	if rule.max_bookings_per_week and week_bookings >= rule.max_bookings_per_week:
+		return {
+			"available": False,
+			"reason": f"Member has reached maximum bookings per week ({rule.max_bookings_per_week})"
+		}
 
 	return {"available": True, "reason": None}
 
@@ -470,19 +883,11 @@ def validate_minimum_notice(member, scheduled_datetime):
 	Returns:
 		dict: {"valid": bool, "reason": str}
 	"""
-	# Get user's availability rules
-	availability_rules = frappe.get_all(
-		"MM User Availability Rule",
-		filters={"user": member},
-		fields=["min_notice_hours", "is_default"],
-		order_by="is_default desc",
-		limit=1
-	)
-
-	if not availability_rules or not availability_rules[0].min_notice_hours:
+	rule = _load_member_profile(member)["rule"]
+	if not rule or not rule.min_notice_hours:
 		return {"valid": True, "reason": None}
 
-	min_notice_hours = availability_rules[0].min_notice_hours
+	min_notice_hours = rule.min_notice_hours
 	min_allowed_datetime = now_datetime() + timedelta(hours=min_notice_hours)
 
 	if scheduled_datetime < min_allowed_datetime:
@@ -505,19 +910,11 @@ def validate_advance_booking_window(member, scheduled_date):
 	Returns:
 		dict: {"valid": bool, "reason": str}
 	"""
-	# Get user's availability rules
-	availability_rules = frappe.get_all(
-		"MM User Availability Rule",
-		filters={"user": member},
-		fields=["max_days_advance", "is_default"],
-		order_by="is_default desc",
-		limit=1
-	)
-
-	if not availability_rules or not availability_rules[0].max_days_advance:
+	rule = _load_member_profile(member)["rule"]
+	if not rule or not rule.max_days_advance:
 		return {"valid": True, "reason": None}
 
-	max_days_advance = availability_rules[0].max_days_advance
+	max_days_advance = rule.max_days_advance
 	max_allowed_date = getdate() + timedelta(days=max_days_advance)
 
 	if scheduled_date > max_allowed_date:
@@ -0,0 +1,13 @@
+import frappe
+
+
+def execute():
+	"""Index the calendar hot paths.
+
+	get_events filters bookings by a start_datetime range plus an optional
+	booking_status and orders by start_datetime, so a composite index covers
+	both the filter and the sort without a filesort. The assigned-user child
+	table is additionally probed by user for permission pre-filtering.
+	"""
+	frappe.db.add_index("MM Meeting Booking", ["start_datetime", "booking_status"], "idx_start_status")
+	frappe.db.add_index("MM Meeting Booking Assigned User", ["user"])
@@ -0,0 +1,14 @@
+import frappe
+
+
+def execute():
+	"""Uniquely index the customer self-service tokens.
+
+	The public cancel/reschedule pages look bookings up by token, which
+	was an unindexed Data column - a full table scan per page load. A
+	unique index makes the lookup a seek and enforces that no two
+	bookings ever share a token. MariaDB permits multiple NULLs in a
+	unique index, so bookings without tokens are unaffected.
+	"""
+	frappe.db.add_unique("MM Meeting Booking", ["cancel_token"], constraint_name="unique_cancel_token")
+	frappe.db.add_unique("MM Meeting Booking", ["reschedule_token"], constraint_name="unique_reschedule_token")
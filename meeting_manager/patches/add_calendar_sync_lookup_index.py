@@ -0,0 +1,11 @@
+import frappe
+
+
+def execute():
+	"""Index the sync-record lookup used by process_calendar_events.
+
+	Incoming events are matched to existing sync rows by
+	(calendar_integration, external_event_id); without a composite index
+	the batch lookup scans the whole table on every scheduler run.
+	"""
+	frappe.db.add_index("MM Calendar Event Sync", ["calendar_integration", "external_event_id"])
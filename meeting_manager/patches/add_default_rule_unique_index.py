@@ -0,0 +1,28 @@
+import frappe
+
+
+def execute():
+	"""Enforce "one default availability rule per user" in the storage engine.
+
+	MariaDB has no partial/filtered unique indexes, so add a stored generated
+	column that mirrors `user` only on default rows (NULL otherwise - NULLs
+	never collide in a unique index) and put the unique index on that.
+	The validate() pre-check stays for a friendly error message; this index
+	makes the invariant race-safe.
+	"""
+	table = "tabMM User Availability Rule"
+
+	if not frappe.db.has_column("MM User Availability Rule", "_default_user"):
+		frappe.db.sql_ddl(
+			f"""ALTER TABLE `{table}`
+			ADD COLUMN `_default_user` varchar(140)
+			GENERATED ALWAYS AS (IF(`is_default` = 1, `user`, NULL)) STORED"""
+		)
+
+	index_exists = frappe.db.sql(
+		f"SHOW INDEX FROM `{table}` WHERE Key_name = 'unique_default_rule_per_user'"
+	)
+	if not index_exists:
+		frappe.db.sql_ddl(
+			f"CREATE UNIQUE INDEX `unique_default_rule_per_user` ON `{table}` (`_default_user`)"
+		)
@@ -0,0 +1,11 @@
+import frappe
+
+
+def execute():
+	"""Index department membership lookups.
+
+	has_app_permission probes MM Department Member by (member, is_active)
+	on every desk page load for non-privileged users; a composite index
+	makes that an index seek instead of a child-table scan.
+	"""
+	frappe.db.add_index("MM Department Member", ["member", "is_active"])
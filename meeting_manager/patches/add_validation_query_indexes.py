@@ -0,0 +1,14 @@
+import frappe
+
+
+def execute():
+	"""Index the availability-validation join pattern.
+
+	The conflict and quota checks all join the assigned-user child table
+	filtered by (user, parenttype) and probe bookings by status plus a
+	datetime range. Composite indexes on both sides turn those scans into
+	seeks; the existing idx_start_status keeps covering the calendar's
+	range-first queries.
+	"""
+	frappe.db.add_index("MM Meeting Booking Assigned User", ["user", "parenttype"])
+	frappe.db.add_index("MM Meeting Booking", ["booking_status", "start_datetime", "end_datetime"], "idx_status_range")
@@ -34,15 +34,21 @@ def get_context(context):
 
 	# Otherwise, show confirmation form
 	try:
-		booking = frappe.get_value(
-			"MM Meeting Booking",
-			{"cancel_token": cancel_token},
-			[
-				"name", "booking_reference", "booking_status", "customer_name",
-				"customer_email", "start_datetime", "end_datetime", "meeting_type"
-			],
+		# One joined SELECT instead of a get_value plus two full get_doc
+		# loads - the page only displays a handful of fields
+		rows = frappe.db.sql(
+			"""SELECT
+				mb.name, mb.booking_reference, mb.booking_status, mb.customer_name,
+				mb.customer_email, mb.start_datetime, mb.end_datetime, mb.meeting_type,
+				mt.meeting_name, mt.duration, d.department_name
+			FROM `tabMM Meeting Booking` mb
+			LEFT JOIN `tabMM Meeting Type` mt ON mt.name = mb.meeting_type
+			LEFT JOIN `tabMM Department` d ON d.name = mt.department
+			WHERE mb.cancel_token = %s""",
+			(cancel_token,),
 			as_dict=True
 		)
+		booking = rows[0] if rows else None
 
 		if not booking:
 			context.error = _("Invalid or expired cancellation link.")
@@ -61,19 +67,15 @@ def get_context(context):
 			context.title = "Cannot Cancel"
 			return context
 
-		# Get meeting type details
-		meeting_type = frappe.get_doc("MM Meeting Type", booking.meeting_type)
-		department = frappe.get_doc("MM Department", meeting_type.department)
-
 		# Set context for confirmation page
 		context.title = "Cancel Your Booking"
 		context.booking = frappe._dict(booking)
 		context.meeting_type = frappe._dict({
-			"meeting_name": meeting_type.meeting_name,
-			"duration": meeting_type.duration
+			"meeting_name": booking.meeting_name,
+			"duration": booking.duration
 		})
 		context.department = frappe._dict({
-			"department_name": department.department_name
+			"department_name": booking.department_name
 		})
 		context.cancel_token = cancel_token
 		context.show_confirmation = True
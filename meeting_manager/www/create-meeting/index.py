@@ -12,6 +12,7 @@ Two types of meeting creation:
 import frappe
 from frappe import _
 from frappe.utils import getdate
+from meeting_manager.meeting_manager.utils.caching import cached_roles
 
 
 def get_context(context):
@@ -31,8 +32,8 @@ def get_context(context):
 		frappe.throw(_("You must be logged in to create meetings"), frappe.PermissionError)
 
 	# Get user roles
-	user_roles = frappe.get_roles()
-	context.user_roles = user_roles
+	user_roles = cached_roles()
+	context.user_roles = list(user_roles)
 	context.is_system_manager = "System Manager" in user_roles
 	context.is_department_leader = "Department Leader" in user_roles
 
@@ -56,23 +57,16 @@ def get_context(context):
 			fields=["name", "department_name", "department_slug", "timezone"]
 		)
 	else:
-		# Regular members can create customer meetings for themselves
-		department_members = frappe.get_all(
-			"MM Department Member",
-			filters={
-				"member": frappe.session.user,
-				"is_active": 1
-			},
-			pluck="parent"
+		# Regular members can create customer meetings for themselves -
+		# one JOIN instead of a membership pluck followed by an IN query
+		departments = frappe.db.sql(
+			"""SELECT d.name, d.department_name, d.department_slug, d.timezone
+			FROM `tabMM Department` d
+			INNER JOIN `tabMM Department Member` m ON m.parent = d.name
+			WHERE m.member = %s AND m.is_active = 1 AND d.is_active = 1""",
+			(frappe.session.user,),
+			as_dict=True
 		)
-		departments = frappe.get_all(
-			"MM Department",
-			filters={
-				"name": ["in", department_members],
-				"is_active": 1
-			},
-			fields=["name", "department_name", "department_slug", "timezone"]
-		) if department_members else []
 
 	context.departments = departments
 
@@ -119,31 +113,43 @@ def get_department_members_list(department):
 	Returns:
 		list: Array of members
 	"""
-	# Check permissions
-	user_roles = frappe.get_roles()
-
-	if "System Manager" not in user_roles and "Department Leader" not in user_roles:
-		is_member = frappe.db.exists(
-			"MM Department Member",
-			{"parent": department, "member": frappe.session.user, "is_active": 1}
-		)
-		if not is_member:
-			frappe.throw(_("You don't have permission to view this department's members"))
+	user_roles = cached_roles()
 
-	members = frappe.get_all(
+	member_ids = frappe.get_all(
 		"MM Department Member",
 		filters={"parent": department, "is_active": 1},
-		fields=["member"]
+		pluck="member"
 	)
 
+	# The member list we need anyway doubles as the permission check -
+	# no separate exists probe against the same table
+	if (
+		"System Manager" not in user_roles
+		and "Department Leader" not in user_roles
+		and frappe.session.user not in member_ids
+	):
+		frappe.throw(_("You don't have permission to view this department's members"))
+
+	# One IN query for the whole member list instead of a User doc load
+	# per row; child-table order is preserved by iterating member_ids
+	user_map = {
+		u.name: u
+		for u in frappe.get_all(
+			"User",
+			filters={"name": ["in", member_ids]},
+			fields=["name", "full_name", "email"]
+		)
+	} if member_ids else {}
+
 	result = []
-	for m in members:
-		user = frappe.get_doc("User", m.member)
-		result.append({
-			"user_id": user.name,
-			"full_name": user.full_name,
-			"email": user.email
-		})
+	for member_id in member_ids:
+		user = user_map.get(member_id)
+		if user:
+			result.append({
+				"user_id": user.name,
+				"full_name": user.full_name,
+				"email": user.email
+			})
 
 	return result
 
@@ -1,8 +1,41 @@
 import frappe
+import re
 from frappe import _
-from frappe.utils import getdate, get_time
+from frappe.utils import now_datetime
 from datetime import datetime
 from meeting_manager.meeting_manager.api.public import get_departments, get_department_meeting_types
+from meeting_manager.meeting_manager.utils.caching import (
+	DEPARTMENT_LIST_CACHE_KEY,
+	MEETING_TYPES_CACHE_KEY,
+	WIZARD_SLUG_CACHE_KEY,
+)
+
+
+# The wizard URLs carry dates and times in one fixed shape, so a
+# precompiled regex plus strptime validates them without getdate's
+# dateutil parsing on every step render
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TIME_RE = re.compile(r"^\d{2}:\d{2}(:\d{2})?$")
+
+
+def _parse_date(date_str):
+	"""Parse a YYYY-MM-DD URL parameter or throw"""
+	if not date_str or not _DATE_RE.match(date_str):
+		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+	try:
+		return datetime.strptime(date_str, "%Y-%m-%d").date()
+	except ValueError:
+		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+
+
+def _parse_time(time_str):
+	"""Parse an HH:MM or HH:MM:SS URL parameter or throw"""
+	if not time_str or not _TIME_RE.match(time_str):
+		frappe.throw(_("Invalid time format"), frappe.ValidationError)
+	try:
+		return datetime.strptime(time_str, "%H:%M:%S" if len(time_str) > 5 else "%H:%M").time()
+	except ValueError:
+		frappe.throw(_("Invalid time format"), frappe.ValidationError)
 
 def get_context(context):
 	"""
@@ -49,8 +82,12 @@ def render_department_list(context):
 	context.title = "Book a Meeting"
 	context.meta_description = "Select a department to book a meeting"
 
-	# Use API instead of direct database queries
-	api_response = get_departments()
+	# The department list changes only when a department is saved, which
+	# drops this key - the funnel entry page is otherwise DB-free
+	api_response = frappe.cache().get_value(DEPARTMENT_LIST_CACHE_KEY)
+	if api_response is None:
+		api_response = get_departments()
+		frappe.cache().set_value(DEPARTMENT_LIST_CACHE_KEY, api_response)
 	context.departments = api_response.get("departments", [])
 
 	context.current_step = 1
@@ -62,8 +99,13 @@ def render_department_list(context):
 
 def render_meeting_types(context, department_slug):
 	"""Step 2: Show meeting types for department"""
-	# Use API instead of direct database queries
-	api_response = get_department_meeting_types(department_slug)
+	# Cached per slug; invalidated on department/meeting type save.
+	# Unknown slugs throw inside the generator and stay uncached.
+	api_response = frappe.cache().hget(
+		MEETING_TYPES_CACHE_KEY,
+		department_slug,
+		generator=lambda: get_department_meeting_types(department_slug)
+	)
 
 	department_data = api_response.get("department", {})
 	meeting_types = api_response.get("meeting_types", [])
@@ -92,8 +134,9 @@ def render_date_picker(context, department_slug, meeting_type_slug):
 	# Get department and meeting type
 	department, meeting_type = get_department_and_meeting_type(department_slug, meeting_type_slug)
 
-	# Get current month/year
-	now = datetime.now()
+	# Get current month/year in the site timezone - datetime.now()
+	# used the server clock, which drifts a day around midnight
+	now = now_datetime()
 
 	context.title = f"Select Date - {meeting_type.meeting_name}"
 	context.meta_description = f"Choose a date for your {meeting_type.meeting_name} with {department.department_name}"
@@ -114,10 +157,7 @@ def render_time_slots(context, department_slug, meeting_type_slug, date_str):
 	department, meeting_type = get_department_and_meeting_type(department_slug, meeting_type_slug)
 
 	# Validate date
-	try:
-		selected_date = getdate(date_str)
-	except:
-		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+	selected_date = _parse_date(date_str)
 
 	context.title = f"Select Time - {meeting_type.meeting_name}"
 	context.meta_description = f"Choose a time for your {meeting_type.meeting_name} on {selected_date.strftime('%B %d, %Y')}"
@@ -138,11 +178,8 @@ def render_customer_form(context, department_slug, meeting_type_slug, date_str,
 	department, meeting_type = get_department_and_meeting_type(department_slug, meeting_type_slug)
 
 	# Validate date and time
-	try:
-		selected_date = getdate(date_str)
-		selected_time = get_time(time_str)
-	except:
-		frappe.throw(_("Invalid date or time format"), frappe.ValidationError)
+	selected_date = _parse_date(date_str)
+	selected_time = _parse_time(time_str)
 
 	context.title = f"Enter Your Details - {meeting_type.meeting_name}"
 	context.meta_description = "Complete your booking by providing your contact information"
@@ -160,7 +197,19 @@ def render_customer_form(context, department_slug, meeting_type_slug, date_str,
 
 
 def get_department_and_meeting_type(department_slug, meeting_type_slug):
-	"""Helper function to get department and meeting type"""
+	"""Helper function to get department and meeting type
+
+	Steps 3-5 of the wizard and the slot AJAX calls all resolve the same
+	slug pair, so the result is kept in a Redis hash shared across
+	workers; MM Department and MM Meeting Type drop it on save/delete.
+	Only successful resolutions are cached - the not-found throws below
+	stay uncached so a newly activated type shows up immediately.
+	"""
+	cache_field = f"{department_slug}:{meeting_type_slug}"
+	cached = frappe.cache().hget(WIZARD_SLUG_CACHE_KEY, cache_field)
+	if cached:
+		return frappe._dict(cached["department"]), frappe._dict(cached["meeting_type"])
+
 	# Get department
 	department = frappe.get_value(
 		"MM Department",
@@ -188,4 +237,10 @@ def get_department_and_meeting_type(department_slug, meeting_type_slug):
 	if not meeting_type:
 		frappe.throw(_("Meeting type not found or inactive"), frappe.DoesNotExistError)
 
+	frappe.cache().hset(
+		WIZARD_SLUG_CACHE_KEY,
+		cache_field,
+		{"department": department, "meeting_type": meeting_type}
+	)
+
 	return department, meeting_type
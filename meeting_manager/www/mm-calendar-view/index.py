@@ -16,6 +16,16 @@ import frappe
 from frappe import _
 from frappe.utils import getdate, get_datetime, add_days, now_datetime
 from datetime import datetime, timedelta
+from meeting_manager.meeting_manager.utils.caching import cached_roles, get_led_departments
+
+# Event colors by booking status, shared by every calendar paint
+_STATUS_COLORS = {
+	"Confirmed": "#10b981",  # Green
+	"Pending": "#f59e0b",    # Yellow
+	"Cancelled": "#ef4444",  # Red
+	"Completed": "#3b82f6",  # Blue
+	"No-show": "#6b7280"     # Gray
+}
 
 
 def get_context(context):
@@ -35,8 +45,8 @@ def get_context(context):
 		frappe.throw(_("You must be logged in to access the calendar view"), frappe.PermissionError)
 
 	# Get user roles
-	user_roles = frappe.get_roles()
-	context.user_roles = user_roles
+	user_roles = cached_roles()
+	context.user_roles = list(user_roles)
 	context.is_system_manager = "System Manager" in user_roles
 	context.is_department_leader = "Department Leader" in user_roles
 
@@ -59,24 +69,16 @@ def get_context(context):
 			fields=["name", "department_name", "department_slug"]
 		)
 	else:
-		# Regular members see departments they belong to
-		department_members = frappe.get_all(
-			"MM Department Member",
-			filters={
-				"member": frappe.session.user,
-				"is_active": 1
-			},
-			fields=["parent"],
-			pluck="parent"
+		# Regular members see departments they belong to - one JOIN
+		# instead of a membership pluck followed by an IN query
+		departments = frappe.db.sql(
+			"""SELECT d.name, d.department_name, d.department_slug
+			FROM `tabMM Department` d
+			INNER JOIN `tabMM Department Member` m ON m.parent = d.name
+			WHERE m.member = %s AND m.is_active = 1 AND d.is_active = 1""",
+			(frappe.session.user,),
+			as_dict=True
 		)
-		departments = frappe.get_all(
-			"MM Department",
-			filters={
-				"name": ["in", department_members],
-				"is_active": 1
-			},
-			fields=["name", "department_name", "department_slug"]
-		) if department_members else []
 
 	context.departments = departments
 
@@ -85,26 +87,40 @@ def get_context(context):
 	context.selected_member = frappe.form_dict.get("member")
 	context.view_type = frappe.form_dict.get("view", "month")  # month, week, day
 
-	# Get members for selected department (for filtering)
+	# Get members for selected department (for filtering). Only resolve
+	# them when the requested department is one the user can actually
+	# see - a stale or forged ?department= should not cost a query.
+	accessible_departments = {d.name for d in departments}
 	context.members = []
-	if context.selected_department:
-		members = frappe.get_all(
+	if context.selected_department and context.selected_department in accessible_departments:
+		member_ids = frappe.get_all(
 			"MM Department Member",
 			filters={
 				"parent": context.selected_department,
 				"is_active": 1
 			},
-			fields=["member"]
+			pluck="member"
 		)
 
+		# One IN query for all members instead of a User doc load per row
+		user_map = {
+			u.name: u
+			for u in frappe.get_all(
+				"User",
+				filters={"name": ["in", member_ids]},
+				fields=["name", "full_name", "email"]
+			)
+		} if member_ids else {}
+
 		context.members = []
-		for m in members:
-			user = frappe.get_doc("User", m.member)
-			context.members.append({
-				"user_id": user.name,
-				"full_name": user.full_name,
-				"email": user.email
-			})
+		for member_id in member_ids:
+			user = user_map.get(member_id)
+			if user:
+				context.members.append({
+					"user_id": user.name,
+					"full_name": user.full_name,
+					"email": user.email
+				})
 
 	# Page title
 	context.title = _("Calendar View - Meeting Manager")
@@ -129,14 +145,19 @@ def get_calendar_events(department=None, member=None, start=None, end=None):
 	# Build filters
 	filters = {}
 
-	# Date range filter
-	if start:
+	# Date range filter. Assigning >= then <= to the same key silently
+	# dropped the start bound, so every paint fetched all bookings up to
+	# the end date; between keeps both bounds and lets the date index
+	# bracket the scan.
+	if start and end:
+		filters["scheduled_date"] = ["between", [getdate(start), getdate(end)]]
+	elif start:
 		filters["scheduled_date"] = [">=", getdate(start)]
-	if end:
+	elif end:
 		filters["scheduled_date"] = ["<=", getdate(end)]
 
 	# Permission-based filtering
-	user_roles = frappe.get_roles()
+	user_roles = cached_roles()
 
 	if "System Manager" in user_roles:
 		# System managers see all bookings
@@ -147,22 +168,27 @@ def get_calendar_events(department=None, member=None, start=None, end=None):
 
 	elif "Department Leader" in user_roles:
 		# Department leaders see bookings for their departments
-		led_departments = frappe.get_all(
-			"MM Department",
-			filters={"department_leader": frappe.session.user},
-			pluck="name"
-		)
+		led_departments = get_led_departments(frappe.session.user)
 
-		if led_departments:
-			if department and department in led_departments:
-				filters["department"] = department
-			else:
-				filters["department"] = ["in", led_departments]
+		if not led_departments:
+			return []  # Leader has no departments
 
-			if member:
-				filters["assigned_to"] = member
+		if department:
+			if department not in led_departments:
+				# Out of scope - previously widened silently to all led
+				# departments, which both leaked and scanned more rows
+				return []
+			filters["department"] = department
 		else:
-			return []  # Leader has no departments
+			filters["department"] = ["in", led_departments]
+
+		if member:
+			if not frappe.db.exists(
+				"MM Department Member",
+				{"parent": ["in", led_departments], "member": member, "is_active": 1}
+			):
+				return []
+			filters["assigned_to"] = member
 
 	else:
 		# Regular members see only their own bookings
@@ -175,34 +201,51 @@ def get_calendar_events(department=None, member=None, start=None, end=None):
 		fields=[
 			"name", "booking_reference", "booking_type", "department",
 			"meeting_type", "assigned_to", "customer_name",
-			"scheduled_date", "scheduled_start_time", "scheduled_end_time",
-			"duration", "status", "location_type", "video_platform",
-			"meeting_link", "customer_email", "customer_phone"
+			"CONCAT(scheduled_date, 'T', scheduled_start_time) as start_iso",
+			"CONCAT(scheduled_date, 'T', scheduled_end_time) as end_iso",
+			"duration", "status"
 		],
 		order_by="scheduled_date asc, scheduled_start_time asc"
 	)
 
-	# Convert to FullCalendar event format
-	events = []
-	for booking in bookings:
-		# Combine date and time
-		start_datetime = datetime.combine(booking.scheduled_date, booking.scheduled_start_time)
-		end_datetime = datetime.combine(booking.scheduled_date, booking.scheduled_end_time)
+	# Resolve display names in two bulk queries up front - a month of
+	# events was previously two single-row SELECTs per booking
+	meeting_type_ids = {b.meeting_type for b in bookings if b.meeting_type}
+	user_ids = {b.assigned_to for b in bookings if b.assigned_to}
+	meeting_type_names = {
+		r.name: r.meeting_name
+		for r in frappe.get_all(
+			"MM Meeting Type",
+			filters={"name": ["in", list(meeting_type_ids)]},
+			fields=["name", "meeting_name"]
+		)
+	} if meeting_type_ids else {}
+	user_names = {
+		r.name: r.full_name
+		for r in frappe.get_all(
+			"User",
+			filters={"name": ["in", list(user_ids)]},
+			fields=["name", "full_name"]
+		)
+	} if user_ids else {}
+
+	return list(_iter_events(bookings, meeting_type_names, user_names))
 
-		# Get meeting type name
-		meeting_type_name = frappe.get_value("MM Meeting Type", booking.meeting_type, "meeting_name")
 
-		# Get assigned user name
-		assigned_user_name = frappe.get_value("User", booking.assigned_to, "full_name")
+def _iter_events(bookings, meeting_type_names, user_names):
+	"""Yield FullCalendar event dicts one booking at a time
+
+	Keeping the per-event construction in a generator means a future
+	streaming response only has to swap the list() call in
+	get_calendar_events for an iterating encoder; the ISO timestamps are
+	concatenated by SQL, so no datetime work happens here either.
+	"""
+	for booking in bookings:
+		meeting_type_name = meeting_type_names.get(booking.meeting_type)
+		assigned_user_name = user_names.get(booking.assigned_to)
 
 		# Determine color based on status
-		color_map = {
-			"Confirmed": "#10b981",  # Green
-			"Pending": "#f59e0b",    # Yellow
-			"Cancelled": "#ef4444",  # Red
-			"Completed": "#3b82f6",  # Blue
-			"No-show": "#6b7280"     # Gray
-		}
+		color = _STATUS_COLORS.get(booking.status, "#6b7280")
 
 		# Event title
 		if booking.booking_type == "Customer Booking":
@@ -210,14 +253,14 @@ def get_calendar_events(department=None, member=None, start=None, end=None):
 		else:
 			title = f"{meeting_type_name} (Internal)"
 
-		events.append({
+		yield {
 			"id": booking.name,
 			"resourceId": booking.assigned_to,  # For resource timeline view
 			"title": title,
-			"start": start_datetime.isoformat(),
-			"end": end_datetime.isoformat(),
-			"backgroundColor": color_map.get(booking.status, "#6b7280"),
-			"borderColor": color_map.get(booking.status, "#6b7280"),
+			"start": booking.start_iso,
+			"end": booking.end_iso,
+			"backgroundColor": color,
+			"borderColor": color,
 			"textColor": "#ffffff",
 			"extendedProps": {
 				"booking_id": booking.name,
@@ -229,17 +272,61 @@ def get_calendar_events(department=None, member=None, start=None, end=None):
 				"assigned_to": booking.assigned_to,
 				"assigned_to_name": assigned_user_name,
 				"customer_name": booking.customer_name,
-				"customer_email": booking.customer_email,
-				"customer_phone": booking.customer_phone,
 				"status": booking.status,
-				"duration": booking.duration,
-				"location_type": booking.location_type,
-				"video_platform": booking.video_platform,
-				"meeting_link": booking.meeting_link
+				"duration": booking.duration
 			}
-		})
+		}
+
+
+@frappe.whitelist()
+def get_booking_detail(name):
+	"""
+	Contact and location details for one booking (event popover)
+
+	The list endpoint keeps rows lean - rendering a month of events only
+	needs title, timing and status - so the popover fetches the wide
+	columns lazily for the single booking being inspected.
+
+	Args:
+		name (str): Booking ID
+
+	Returns:
+		dict: Contact, location and link fields
+	"""
+	booking = frappe.get_value(
+		"MM Meeting Booking",
+		name,
+		[
+			"name", "meeting_type", "customer_email",
+			"customer_phone", "location_type", "video_meeting_url"
+		],
+		as_dict=True
+	)
 
-	return events
+	if not booking:
+		frappe.throw(_("Booking not found"), frappe.DoesNotExistError)
+
+	# Same visibility rules as the event list; the booking's department
+	# hangs off its meeting type, and assignment lives in the
+	# assigned_users child table
+	user_roles = cached_roles()
+	if "System Manager" not in user_roles:
+		if "Department Leader" in user_roles:
+			department = frappe.get_value("MM Meeting Type", booking.meeting_type, "department")
+			if department not in get_led_departments(frappe.session.user):
+				frappe.throw(_("You don't have permission to view this booking"), frappe.PermissionError)
+		elif not frappe.db.exists(
+			"MM Meeting Booking Assigned User",
+			{"parent": booking.name, "parenttype": "MM Meeting Booking", "user": frappe.session.user}
+		):
+			frappe.throw(_("You don't have permission to view this booking"), frappe.PermissionError)
+
+	return {
+		"customer_email": booking.customer_email,
+		"customer_phone": booking.customer_phone,
+		"location_type": booking.location_type,
+		"meeting_link": booking.video_meeting_url
+	}
 
 
 @frappe.whitelist()
@@ -254,60 +341,66 @@ def get_department_members(department=None):
 		list: Array of member objects
 	"""
 	# Check permissions
-	user_roles = frappe.get_roles()
+	user_roles = cached_roles()
 
 	# Get members based on department and permissions
 	if department:
-		# Check permissions for specific department
-		if "System Manager" not in user_roles and "Department Leader" not in user_roles:
-			is_member = frappe.db.exists(
-				"MM Department Member",
-				{"parent": department, "member": frappe.session.user, "is_active": 1}
-			)
-			if not is_member:
-				frappe.throw(_("You don't have permission to view this department's members"))
-
-		# Get members for specific department
-		members = frappe.get_all(
+		# Get members for specific department; the fetched list also
+		# serves as the permission check, replacing a separate exists
+		# probe against the same table
+		member_ids = frappe.get_all(
 			"MM Department Member",
 			filters={"parent": department, "is_active": 1},
-			fields=["member"],
+			pluck="member",
 			distinct=True
 		)
+
+		if (
+			"System Manager" not in user_roles
+			and "Department Leader" not in user_roles
+			and frappe.session.user not in member_ids
+		):
+			frappe.throw(_("You don't have permission to view this department's members"))
 	else:
 		# Get all accessible members
 		if "System Manager" in user_roles:
 			# System managers see all members
-			members = frappe.get_all(
+			member_ids = frappe.get_all(
 				"MM Department Member",
 				filters={"is_active": 1},
-				fields=["member"],
+				pluck="member",
 				distinct=True
 			)
 		elif "Department Leader" in user_roles:
 			# Department leaders see members from their departments
-			led_departments = frappe.get_all(
-				"MM Department",
-				filters={"department_leader": frappe.session.user},
-				pluck="name"
-			)
-			members = frappe.get_all(
+			led_departments = get_led_departments(frappe.session.user)
+			member_ids = frappe.get_all(
 				"MM Department Member",
 				filters={"parent": ["in", led_departments], "is_active": 1},
-				fields=["member"],
+				pluck="member",
 				distinct=True
 			) if led_departments else []
 		else:
 			# Regular members see only themselves
-			members = [{"member": frappe.session.user}]
+			member_ids = [frappe.session.user]
+
+	# Build result with unique members - a single IN query resolves the
+	# display fields instead of a User doc load per member
+	user_map = {
+		u.name: u
+		for u in frappe.get_all(
+			"User",
+			filters={"name": ["in", member_ids]},
+			fields=["name", "full_name", "email"]
+		)
+	} if member_ids else {}
 
-	# Build result with unique members
+	# distinct=True on the queries above already dedupes; the
+	# self-only branch is a single ID
 	result = []
-	seen_members = set()
-	for m in members:
-		if m.member not in seen_members:
-			seen_members.add(m.member)
-			user = frappe.get_doc("User", m.member)
+	for member_id in member_ids:
+		user = user_map.get(member_id)
+		if user:
 			result.append({
 				"id": user.name,
 				"title": user.full_name,
@@ -1,9 +1,37 @@
 import frappe
+import re
 from frappe import _
-from frappe.utils import getdate, get_time
+from frappe.utils import now_datetime
 from datetime import datetime
 from meeting_manager.meeting_manager.api.public import get_booking_details, reschedule_booking
 
+
+# The wizard URLs carry dates and times in one fixed shape, so a
+# precompiled regex plus strptime validates them without getdate's
+# dateutil parsing on every step render
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TIME_RE = re.compile(r"^\d{2}:\d{2}(:\d{2})?$")
+
+
+def _parse_date(date_str):
+	"""Parse a YYYY-MM-DD URL parameter or throw"""
+	if not date_str or not _DATE_RE.match(date_str):
+		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+	try:
+		return datetime.strptime(date_str, "%Y-%m-%d").date()
+	except ValueError:
+		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+
+
+def _parse_time(time_str):
+	"""Parse an HH:MM or HH:MM:SS URL parameter or throw"""
+	if not time_str or not _TIME_RE.match(time_str):
+		frappe.throw(_("Invalid time format"), frappe.ValidationError)
+	try:
+		return datetime.strptime(time_str, "%H:%M:%S" if len(time_str) > 5 else "%H:%M").time()
+	except ValueError:
+		frappe.throw(_("Invalid time format"), frappe.ValidationError)
+
 def get_context(context):
 	"""
 	Reschedule booking route handler
@@ -79,8 +107,9 @@ def render_booking_details(context):
 
 def render_date_picker(context):
 	"""Step 2: Date picker calendar"""
-	# Get current month/year
-	now = datetime.now()
+	# Get current month/year in the site timezone - datetime.now()
+	# used the server clock, which drifts a day around midnight
+	now = now_datetime()
 
 	meeting_type = context.meeting_type
 	department = context.department
@@ -100,10 +129,7 @@ def render_time_slots(context, date_str):
 	meeting_type = context.meeting_type
 
 	# Validate date
-	try:
-		selected_date = getdate(date_str)
-	except:
-		frappe.throw(_("Invalid date format"), frappe.ValidationError)
+	selected_date = _parse_date(date_str)
 
 	context.title = f"Select New Time - {meeting_type.meeting_name}"
 	context.meta_description = f"Choose a new time for your {meeting_type.meeting_name} on {selected_date.strftime('%B %d, %Y')}"
@@ -121,11 +147,8 @@ def render_confirmation(context, date_str, time_str):
 	booking = context.booking
 
 	# Validate date and time
-	try:
-		selected_date = getdate(date_str)
-		selected_time = get_time(time_str)
-	except:
-		frappe.throw(_("Invalid date or time format"), frappe.ValidationError)
+	selected_date = _parse_date(date_str)
+	selected_time = _parse_time(time_str)
 
 	context.title = f"Confirm Reschedule - {meeting_type.meeting_name}"
 	context.meta_description = "Confirm your booking reschedule"